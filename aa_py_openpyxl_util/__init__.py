@@ -4,14 +4,40 @@ Utilities that build on top of `openpyxl`.
 
 from typing import TYPE_CHECKING
 
-from ._cells import process_cells, get_cell_values
+from ._async import open_workbook_async, read_table_async
+from ._batch import read_tables_from_workbooks, WorkbookTables, TableValues
+from ._catalog import TableCatalog, CatalogEntry
+from ._cells import (
+    process_cells,
+    get_cell_values,
+    process_range_values,
+    get_range_values,
+)
+from ._columns import read_table_columns, columns_to_numpy, columns_to_pandas
 from ._context import safe_load_workbook, changed_builtin_number_formats
+from ._data_util import RowView
+from ._dates import find_date_columns, serials_to_datetimes
+from ._diagnostics import ReadDiagnostics
+from ._disk_cache import TableCache
 from ._data_validation import set_data_validation_input_message
-from ._extract import extract_data_from_numbered_tables, read_table, read_dict_table
+from ._extract import (
+    extract_data_from_numbered_tables,
+    read_table,
+    read_table_batches,
+    read_dict_table,
+    read_tables,
+)
 from ._find_table import find_table
 from ._iter_tables import iter_named_range_tables, iter_list_object_tables
 from ._named_ranges import define_named_ranges_for_dict_table
+from ._parallel import safe_load_workbook_parallel
+from ._partial import safe_load_workbook_for_tables
+from ._scan import scan_workbook, ScannedTable
+from ._schema import read_typed_table, ColumnSchema, ColumnError, SchemaError
+from ._table_parts import attach_list_objects
+from ._workbook_cache import WorkbookCache
 from ._workarounds import save_workbook_workaround, remove_atexit_permission_error
+from ._xml_writer import can_write_xml
 from ._write_only import (
     FormattedCell,
     TableInfo,
@@ -0,0 +1,179 @@
+"""
+Utilities for reading workbooks from asyncio code, without blocking the event loop.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from threading import Event
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from ._context import open_workbook
+from ._extract import read_table
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+    from openpyxl import Workbook
+    from ._catalog import TableCatalog
+
+
+@asynccontextmanager
+async def open_workbook_async(
+    *,
+    path: Path,
+    read_only: bool,
+    data_only: bool,
+    executor: Optional["Executor"] = None,
+) -> AsyncGenerator["Workbook", None]:
+    """
+    Like `safe_load_workbook`, but parse the workbook in an executor, so that the event loop is not blocked.
+
+    This is an async context manager.
+
+    Args:
+        path: The path to the workbook on the disk.
+        read_only: See `safe_load_workbook`.
+        data_only: See `safe_load_workbook`.
+        executor:
+            The executor in which to parse the workbook. Defaults to the default executor of the event loop.
+            Use a `ThreadPoolExecutor` with a small `max_workers` to bound the number of workbooks parsed at once.
+
+    Yields:
+        The workbook.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        executor,
+        partial(open_workbook, path=path, read_only=read_only, data_only=data_only),
+    )
+    try:
+        book = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # The executor can't be interrupted, so close the workbook once it has been opened.
+        future.add_done_callback(_close_opened_workbook)
+        raise
+
+    try:
+        yield book
+    finally:
+        book.close()
+
+
+def _close_opened_workbook(future: "asyncio.Future[Workbook]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+async def read_table_async(
+    *,
+    book: "Workbook",
+    table_name: str,
+    columns: List[str] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+    executor: Optional["Executor"] = None,
+    chunk_size: int = 1000,
+    max_chunks: int = 4,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Like `read_table`, but read the table in an executor, so that the event loop is not blocked.
+
+    The rows are passed from the executor to the event loop in chunks, through a queue holding at most `max_chunks`
+    chunks. When the consumer falls behind, reading pauses until there is room in the queue again. When the consumer
+    stops early, e.g. because its task is cancelled, reading stops too.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the table.
+        table_name: The name of the table (ListObject or named range) to read.
+        columns:
+            Optional list of column names to extract.
+            If not given, all columns are extracted.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+        executor:
+            The executor in which to read the table. Defaults to the default executor of the event loop.
+            This must run in the same process, e.g. a `ThreadPoolExecutor`, because the workbook can't be sent to
+            another process.
+        chunk_size: The number of rows in each chunk.
+        max_chunks: The maximum number of chunks waiting to be consumed.
+
+    Returns:
+        An async generator of dictionaries, like `read_table`.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    # Each item is a chunk of rows, or None after the last chunk.
+    queue: asyncio.Queue[Optional[List[Dict[str, Any]]]] = asyncio.Queue(
+        maxsize=max_chunks
+    )
+    stop = Event()
+
+    def put(chunk: Optional[List[Dict[str, Any]]]) -> None:
+        # Blocks while the queue is full.
+        asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+
+    def produce() -> None:
+        try:
+            chunk: List[Dict[str, Any]] = []
+            for row in read_table(
+                book=book,
+                table_name=table_name,
+                columns=columns,
+                ci=ci,
+                catalog=catalog,
+            ):
+                if stop.is_set():
+                    return
+
+                chunk.append(row)
+                if len(chunk) == chunk_size:
+                    put(chunk)
+                    chunk = []
+
+            if chunk and not stop.is_set():
+                put(chunk)
+        finally:
+            if not stop.is_set():
+                put(None)
+
+    task = loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+
+            for row in chunk:
+                yield row
+
+        # Raise any exception from the executor.
+        await task
+    finally:
+        if not task.done():
+            # Stop reading, and make room in the queue in case the executor is waiting to put a chunk.
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.wait([task])
+
+        if task.done() and not task.cancelled():
+            # Don't let asyncio complain about an exception that was never retrieved.
+            task.exception()
@@ -0,0 +1,208 @@
+"""
+Utilities for reading tables from many workbooks in parallel.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ._catalog import TableCatalog
+from ._context import safe_load_workbook
+from ._data_util import HeaderIndex
+from ._extract import read_tables_values
+
+
+@dataclass(frozen=True)
+class TableValues:
+    """
+    The values of a table, in a compact form that is cheap to send between processes.
+    """
+
+    header: Tuple[str, ...]
+    """
+    The column names, as `read_table` would use them.
+    """
+
+    rows: List[Tuple[Any, ...]]
+    """
+    One tuple of values per row, in the order of `header`. Empty rows are kept, like `read_table` does.
+    """
+
+
+@dataclass(frozen=True)
+class WorkbookTables:
+    """
+    The tables read from one workbook by `read_tables_from_workbooks`.
+    """
+
+    path: Path
+    """
+    The path of the workbook, as given.
+    """
+
+    tables: Dict[str, TableValues]
+    """
+    The tables, keyed by name (as given). Empty if reading the workbook failed.
+    """
+
+    error: Optional[BaseException] = None
+    """
+    The exception raised while reading the workbook, or None if it was read successfully.
+    """
+
+
+def read_tables_from_workbooks(
+    *,
+    paths: Iterable[Path],
+    table_names: Sequence[str],
+    columns: Mapping[str, List[str]] | None = None,
+    ci: bool | Literal["warn"],
+    read_only: bool,
+    data_only: bool,
+    workers: Optional[int] = None,
+) -> Generator[WorkbookTables, None, None]:
+    """
+    Read the same tables from many workbooks, using a pool of worker processes.
+
+    Each workbook is opened with `safe_load_workbook` and read with `read_tables` in a worker process, so that the
+    parsing is not limited by the GIL. The results are yielded as soon as each workbook is done, so the order is not
+    necessarily the order of `paths`.
+
+    An error in one workbook does not stop the batch. It is reported in `WorkbookTables.error` instead.
+
+    Args:
+        paths: The paths to the workbooks on the disk.
+        table_names: The names of the tables (ListObjects or named ranges) to read from each workbook.
+        columns:
+            Optional mapping from table name to the list of column names to extract from that table.
+            For tables not in the mapping, all columns are extracted.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        read_only: See `safe_load_workbook`.
+        data_only: See `safe_load_workbook`.
+        workers:
+            The number of worker processes. Defaults to the number of CPUs.
+            Use 1 to read the workbooks one by one in the current process, e.g. for debugging.
+
+    Returns:
+        A generator of results, one per workbook, in order of completion.
+    """
+    from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+    table_names = list(table_names)
+    columns = dict(columns or {})
+
+    if workers == 1:
+        for path in paths:
+            try:
+                tables = read_workbook_tables(
+                    path=path,
+                    table_names=table_names,
+                    columns=columns,
+                    ci=ci,
+                    read_only=read_only,
+                    data_only=data_only,
+                )
+            except Exception as e:
+                yield WorkbookTables(path=path, tables={}, error=e)
+            else:
+                yield WorkbookTables(path=path, tables=tables)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: Dict["Future[Dict[str, TableValues]]", Path] = {
+            executor.submit(
+                read_workbook_tables,
+                path=path,
+                table_names=table_names,
+                columns=columns,
+                ci=ci,
+                read_only=read_only,
+                data_only=data_only,
+            ): path
+            for path in paths
+        }
+
+        try:
+            for future in as_completed(futures):
+                path = futures.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield WorkbookTables(path=path, tables=future.result())
+                else:
+                    yield WorkbookTables(path=path, tables={}, error=error)
+        finally:
+            # Don't start the remaining workbooks if the caller stops iterating early.
+            for future in futures:
+                future.cancel()
+
+
+def read_workbook_tables(
+    *,
+    path: Path,
+    table_names: Sequence[str],
+    columns: Mapping[str, List[str]],
+    ci: bool | Literal["warn"],
+    read_only: bool,
+    data_only: bool,
+) -> Dict[str, TableValues]:
+    """
+    Read the tables of one workbook for `read_tables_from_workbooks`. This runs in a worker process.
+    """
+    with safe_load_workbook(
+        path=path, read_only=read_only, data_only=data_only
+    ) as book:
+        values = read_tables_values(
+            book=book,
+            table_names=table_names,
+            ci=ci,
+            catalog=TableCatalog(book=book),
+        )
+
+    return {
+        name: values_to_table_values(data=table_values, columns=columns.get(name))
+        for name, table_values in values.items()
+    }
+
+
+def values_to_table_values(
+    *,
+    data: Iterable[Sequence[Any]],
+    columns: Optional[List[str]],
+) -> TableValues:
+    """
+    Convert 2D data (rows and columns) into `TableValues`, assuming the first row is a header.
+
+    Duplicate column names and empty rows are handled like `read_table` does.
+
+    Examples:
+        >>> values_to_table_values(data=[("a", "b"), (1, 2), (None, None), (3, 4)], columns=["B"])
+        TableValues(header=('B',), rows=[(2,), (None,), (4,)])
+    """
+    it = iter(data)
+    index, picks = HeaderIndex.create(
+        header=[str(v) for v in next(it)], columns=columns
+    )
+
+    rows: List[Tuple[Any, ...]] = []
+    for row in it:
+        if picks is not None:
+            row = tuple([row[i] for i in picks])
+
+        rows.append(tuple(row))
+
+    return TableValues(header=tuple(index.keys), rows=rows)
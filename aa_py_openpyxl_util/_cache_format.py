@@ -0,0 +1,339 @@
+"""
+A compact binary format for storing `TableValues`, which is read through a memory map.
+
+A file consists of:
+
+- A magic line, identifying the format and its version.
+- The length of the header, as an unsigned 64-bit integer.
+- The header, in JSON, describing each table and the location of the buffers of each column.
+- The buffers, each aligned to 8 bytes.
+
+Each column is stored in up to four buffers:
+
+- `tags`: One byte per row, giving the type of each value. Left out when all the values have the same type, which is
+  then given in the header.
+- `payload`: One 64-bit slot per row: the integer, the bits of the float, the number of microseconds of a date, or the
+  index of a string.
+- `offsets` and `text`: The strings of the column, as one piece of text, and the code point offsets between them.
+
+Columns of integers or floats are read back in bulk, with `memoryview.cast(...).tolist()`. Only values of the types that
+openpyxl reads from cells can be stored. Unlike pickle, reading a file never runs any code.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from array import array
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Literal, Optional, Sequence, Tuple
+
+from ._batch import TableValues
+
+_MAGIC = b"aa-py-openpyxl-util table cache 2\n"
+
+_NONE = 0
+_BOOL = 1
+_INT = 2
+_FLOAT = 3
+_STR = 4
+_DATETIME = 5
+_DATE = 6
+_TIME = 7
+_TIMEDELTA = 8
+_BIG_INT = 9
+"""
+An integer that does not fit in 64 bits, stored as a string.
+"""
+
+_TAGS: Dict[type, int] = {
+    type(None): _NONE,
+    bool: _BOOL,
+    int: _INT,
+    float: _FLOAT,
+    str: _STR,
+    datetime: _DATETIME,
+    date: _DATE,
+    time: _TIME,
+    timedelta: _TIMEDELTA,
+}
+
+_MIN_DATETIME = datetime(1, 1, 1)
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def write_tables(f: BinaryIO, tables: Sequence[TableValues]) -> None:
+    """
+    Write tables to a binary file.
+
+    Raises:
+        ValueError: If any value can't be stored, e.g. an `ArrayFormula`, or a row does not match the header.
+    """
+    buffers: List[bytes] = []
+    # The offsets of the buffers, relative to the start of the first buffer.
+    size = 0
+
+    def add(buffer: bytes) -> Tuple[int, int]:
+        nonlocal size
+        location = (size, len(buffer))
+        padding = -len(buffer) % 8
+        buffers.append(buffer + b"\0" * padding)
+        size += len(buffer) + padding
+        return location
+
+    header_tables = []
+    for table in tables:
+        width = len(table.header)
+        for row in table.rows:
+            if len(row) != width:
+                raise ValueError(
+                    f"A row has {len(row)} values, but the header has {width} columns."
+                )
+        columns = list(zip(*table.rows)) if table.rows else [()] * width
+        header_tables.append(
+            {
+                "header": list(table.header),
+                "n_rows": len(table.rows),
+                "columns": [_encode_column(values, add) for values in columns],
+            }
+        )
+
+    header = json.dumps(
+        {"byteorder": sys.byteorder, "tables": header_tables},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    start = len(_MAGIC) + 8 + len(header)
+    padding = -start % 8
+
+    f.write(_MAGIC)
+    f.write(len(header).to_bytes(8, "little"))
+    f.write(header)
+    f.write(b"\0" * padding)
+    for buffer in buffers:
+        f.write(buffer)
+
+
+def read_tables(path: Path) -> List[TableValues]:
+    """
+    Read tables written by `write_tables`.
+
+    Raises:
+        ValueError: If the file is not in this format, or it is truncated.
+    """
+    import mmap
+
+    with (
+        path.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+    ):
+        if m[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a table cache file.")
+
+        header_start = len(_MAGIC) + 8
+        header_length = int.from_bytes(m[len(_MAGIC) : header_start], "little")
+        header_end = header_start + header_length
+        if header_end > len(m):
+            raise ValueError("The file is truncated.")
+
+        header = json.loads(m[header_start:header_end].decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(
+                "The file was written on a platform with another byte order."
+            )
+
+        data_start = header_end + (-header_end % 8)
+        with memoryview(m) as view:
+            return [
+                (
+                    TableValues(
+                        header=tuple(table["header"]),
+                        rows=list(
+                            zip(
+                                *[
+                                    _decode_column(
+                                        view,
+                                        column,
+                                        data_start=data_start,
+                                        n=table["n_rows"],
+                                    )
+                                    for column in table["columns"]
+                                ]
+                            )
+                        ),
+                    )
+                    if table["columns"]
+                    else TableValues(header=(), rows=[()] * table["n_rows"])
+                )
+                for table in header["tables"]
+            ]
+
+
+def _encode_column(values: Sequence[Any], add: Any) -> Dict[str, Any]:
+    """
+    Encode the values of a column into buffers, and describe them.
+    """
+    types = set(map(type, values))
+    if not types:
+        return {"tag": _NONE}
+    if len(types) == 1 and _TAGS.get(next(iter(types))) in (_NONE, _FLOAT, _STR):
+        only = _TAGS[next(iter(types))]
+        if only == _NONE:
+            return {"tag": _NONE}
+        if only == _FLOAT:
+            return {"tag": _FLOAT, "payload": add(array("d", values).tobytes())}
+        return {"tag": _STR, **_encode_strings(values, add)}
+
+    n = len(values)
+    tags = bytearray(n)
+    payload = bytearray(8 * n)
+    ints = memoryview(payload).cast("q")
+    floats = memoryview(payload).cast("d")
+    strings: List[str] = []
+
+    try:
+        for i, value in enumerate(values):
+            tag = _TAGS.get(type(value))
+            if tag is None:
+                raise ValueError(f"Can't store values of type {type(value)}.")
+
+            if tag == _BOOL:
+                ints[i] = int(value)
+            elif tag == _INT:
+                if _INT64_MIN <= value <= _INT64_MAX:
+                    ints[i] = value
+                else:
+                    tag = _BIG_INT
+                    ints[i] = len(strings)
+                    strings.append(str(value))
+            elif tag == _FLOAT:
+                floats[i] = value
+            elif tag == _STR:
+                ints[i] = len(strings)
+                strings.append(value)
+            elif tag == _DATETIME:
+                if value.tzinfo is not None:
+                    raise ValueError("Can't store dates with time zones.")
+                ints[i] = (value - _MIN_DATETIME) // timedelta(microseconds=1)
+            elif tag == _DATE:
+                ints[i] = value.toordinal()
+            elif tag == _TIME:
+                if value.tzinfo is not None:
+                    raise ValueError("Can't store times with time zones.")
+                ints[i] = (
+                    (value.hour * 60 + value.minute) * 60 + value.second
+                ) * 1_000_000 + value.microsecond
+            elif tag == _TIMEDELTA:
+                ints[i] = value // timedelta(microseconds=1)
+            tags[i] = tag
+    finally:
+        ints.release()
+        floats.release()
+
+    if len(set(tags)) == 1 and tags[0] == _INT:
+        return {"tag": _INT, "payload": add(bytes(payload))}
+
+    return {
+        "tag": None,
+        "tags": add(bytes(tags)),
+        "payload": add(bytes(payload)),
+        **_encode_strings(strings, add),
+    }
+
+
+def _encode_strings(strings: Sequence[str], add: Any) -> Dict[str, Any]:
+    offsets = array("q", [0])
+    position = 0
+    for s in strings:
+        position += len(s)
+        offsets.append(position)
+    return {
+        "offsets": add(offsets.tobytes()),
+        "text": add("".join(strings).encode("utf-8", "surrogatepass")),
+    }
+
+
+def _decode_column(
+    view: memoryview,
+    column: Dict[str, Any],
+    *,
+    data_start: int,
+    n: int,
+) -> List[Any]:
+    """
+    Decode the values of a column. All the views of the file are released before returning.
+    """
+
+    def buffer(name: str) -> memoryview:
+        offset, length = column[name]
+        start = data_start + offset
+        if start + length > len(view):
+            raise ValueError("The file is truncated.")
+        return view[start : start + length]
+
+    def numbers(name: str, typecode: Literal["q", "d"]) -> List[Any]:
+        with buffer(name) as part, part.cast(typecode) as cast:
+            if len(cast) != n:
+                raise ValueError("The column has the wrong number of values.")
+            result: List[Any] = cast.tolist()
+            return result
+
+    tag: Optional[int] = column["tag"]
+    if tag == _NONE:
+        return [None] * n
+    if tag == _FLOAT:
+        return numbers("payload", "d")
+    if tag == _INT:
+        return numbers("payload", "q")
+
+    strings = _decode_strings(buffer)
+    if tag == _STR:
+        if len(strings) != n:
+            raise ValueError("The column has the wrong number of values.")
+        return strings
+
+    with buffer("tags") as part:
+        tags = bytes(part)
+    ints = numbers("payload", "q")
+    floats = numbers("payload", "d")
+    if len(tags) != n:
+        raise ValueError("The column has the wrong number of values.")
+
+    values: List[Any] = []
+    append = values.append
+    for i, tag in enumerate(tags):
+        if tag == _NONE:
+            append(None)
+        elif tag == _BOOL:
+            append(bool(ints[i]))
+        elif tag == _INT:
+            append(ints[i])
+        elif tag == _FLOAT:
+            append(floats[i])
+        elif tag == _STR:
+            append(strings[ints[i]])
+        elif tag == _DATETIME:
+            append(_MIN_DATETIME + timedelta(microseconds=ints[i]))
+        elif tag == _DATE:
+            append(date.fromordinal(ints[i]))
+        elif tag == _TIME:
+            seconds, microsecond = divmod(ints[i], 1_000_000)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            append(time(hour, minute, second, microsecond))
+        elif tag == _TIMEDELTA:
+            append(timedelta(microseconds=ints[i]))
+        elif tag == _BIG_INT:
+            append(int(strings[ints[i]]))
+        else:
+            raise ValueError(f"Unknown type tag: {tag}")
+    return values
+
+
+def _decode_strings(buffer: Any) -> List[str]:
+    with buffer("text") as part:
+        text = str(part, "utf-8", "surrogatepass")
+    with buffer("offsets") as part, part.cast("q") as cast:
+        offsets: List[int] = cast.tolist()
+    return [text[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)]
@@ -0,0 +1,417 @@
+"""
+An index of all the tables in a workbook, for fast repeated lookups.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from logging import getLogger
+from typing import (
+    Collection,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from ._iter_tables import any_match
+from ._table_parts import get_list_objects
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.workbook.defined_name import DefinedName
+    from openpyxl.worksheet.table import Table
+    from openpyxl.worksheet.worksheet import Worksheet
+
+logger = getLogger(__name__)
+
+TableType = Literal["Named range", "ListObject"]
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """
+    A named range destination or a ListObject in a workbook.
+    """
+
+    name: str
+    """
+    The name of the table, in its original case.
+    """
+
+    table_type: TableType
+    """
+    Whether this is a named range or a ListObject.
+    """
+
+    sheet: "Worksheet"
+    """
+    The sheet on which the table lives.
+    """
+
+    table_range: str
+    """
+    The range of the table, as written in the workbook, e.g. `$B$2:$C$4` or `E2:F3`.
+    """
+
+    boundaries: Optional[Tuple[int, int, int, int]]
+    """
+    The parsed range as `(min_col, min_row, max_col, max_row)`, or None if the range is not a rectangular cell range.
+    """
+
+    scope: Optional[str] = None
+    """
+    The sheet name for sheet-scoped named ranges. None for workbook-scoped named ranges and ListObjects.
+    """
+
+    table: Optional["Table"] = None
+    """
+    The openpyxl ListObject. None for named ranges.
+    """
+
+    @property
+    def is_table(self) -> bool:
+        """
+        Whether the range can be a table, i.e. it has at least one column and at least two rows.
+        """
+        if self.boundaries is None:
+            return False
+        min_col, min_row, max_col, max_row = self.boundaries
+        return max_row - min_row + 1 >= 2 and max_col - min_col + 1 >= 1
+
+
+class TableCatalog:
+    """
+    An index of all the named ranges and ListObjects in a workbook, built in one pass.
+
+    Use this instead of calling `find_table` repeatedly on the same workbook. Each lookup is a dictionary access,
+    whereas `find_table` searches through the whole workbook every time.
+
+    The catalog is a snapshot. If tables are added to the workbook afterward, build a new catalog.
+    """
+
+    book: "Workbook"
+    """
+    The indexed workbook.
+    """
+
+    def __init__(self, *, book: "Workbook"):
+        self.book = book
+
+        # Workbook-scoped named ranges, with all their destinations, in workbook order.
+        self._named_ranges: Dict[str, List[CatalogEntry]] = {}
+        # Named ranges which can't be used as tables, with the reason.
+        self._named_range_errors: Dict[str, str] = {}
+        # Sheet-scoped named ranges, keyed by sheet name and then by name.
+        self._sheet_named_ranges: Dict[str, Dict[str, List[CatalogEntry]]] = {}
+        self._list_objects: Dict[str, CatalogEntry] = {}
+
+        # Case-insensitive indexes, mapping the case-folded name to the original name.
+        self._named_ranges_ci: Dict[str, str] = {}
+        self._list_objects_ci: Dict[str, str] = {}
+
+        sheets = {sheet.title: sheet for sheet in book.worksheets}
+
+        defined_name: "DefinedName"
+        for defined_name in book.defined_names.values():
+            name = defined_name.name
+            self._named_ranges_ci[name.casefold()] = name
+            try:
+                destinations = list(defined_name.destinations)
+            except AttributeError:
+                self._named_range_errors[name] = (
+                    f"Named range `{name}` found, but it has no destinations."
+                )
+                self._named_ranges[name] = []
+                continue
+
+            if len(destinations) != 1:
+                self._named_range_errors[name] = (
+                    f"Named range `{name}` found, but it has multiple destinations."
+                )
+            self._named_ranges[name] = list(
+                _named_range_entries(name, destinations, sheets, scope=None)
+            )
+
+        for sheet in book.worksheets:
+            scoped: Dict[str, List[CatalogEntry]] = {}
+            for defined_name in sheet.defined_names.values():
+                try:
+                    destinations = list(defined_name.destinations)
+                except AttributeError:
+                    continue
+                scoped[defined_name.name] = list(
+                    _named_range_entries(
+                        defined_name.name, destinations, sheets, scope=sheet.title
+                    )
+                )
+            self._sheet_named_ranges[sheet.title] = scoped
+
+            for table in get_list_objects(sheet).values():
+                self._list_objects[table.name] = CatalogEntry(
+                    name=table.name,
+                    table_type="ListObject",
+                    sheet=sheet,
+                    table_range=table.ref,
+                    boundaries=_parse_boundaries(table.ref),
+                    table=table,
+                )
+                self._list_objects_ci[table.name.casefold()] = table.name
+
+    def find(
+        self,
+        *,
+        name: str,
+        ci: bool | Literal["warn"],
+    ) -> CatalogEntry:
+        """
+        Find a table by name, like `find_table` does: Named ranges take precedence over ListObjects.
+
+        Args:
+            name: The name of the table (named range or ListObject).
+            ci:
+                Whether the table name lookup should be case-insensitive.
+                When this is "warn", a warning is logged when the provided case does not match the actual case.
+
+        Returns:
+            The catalog entry for the table.
+
+        Raises:
+            KeyError: If there is no such table, or it is not a valid table.
+        """
+        try:
+            entry = self.find_named_range(name=name, ci=ci)
+        except KeyError as e1:
+            try:
+                entry = self.find_list_object(name=name, ci=ci)
+            except KeyError as e2:
+                raise KeyError(f"Table `{name}` not found: {e1.args[0]} {e2.args[0]}")
+
+        if entry.boundaries is None:
+            raise KeyError(
+                f"{entry.table_type} `{name}` found, but it is not a cell range."
+            )
+
+        min_col, min_row, max_col, max_row = entry.boundaries
+        if max_row - min_row + 1 < 2:
+            raise KeyError(
+                f"{entry.table_type} `{name}` found, but it has fewer than 2 rows."
+            )
+        if max_col - min_col + 1 < 1:
+            raise KeyError(f"{entry.table_type} `{name}` found, but it has no columns.")
+
+        return entry
+
+    def find_named_range(
+        self,
+        *,
+        name: str,
+        ci: bool | Literal["warn"],
+    ) -> CatalogEntry:
+        """
+        Find a workbook-scoped named range with a single destination, like `find_named_range_by_name` does.
+
+        Raises:
+            KeyError: If there is no such named range, or it does not have exactly one destination.
+        """
+        original_name = _lookup(name, self._named_ranges, self._named_ranges_ci, ci)
+        if original_name is None:
+            raise KeyError(f"Named range `{name}` not found.")
+
+        error = self._named_range_errors.get(original_name)
+        if error is not None:
+            raise KeyError(error)
+
+        entries = self._named_ranges[original_name]
+        if len(entries) != 1:
+            # The destination sheet does not exist.
+            raise KeyError(f"Named range `{name}` found, but its sheet was not found.")
+        return entries[0]
+
+    def find_list_object(
+        self,
+        *,
+        name: str,
+        ci: bool | Literal["warn"],
+    ) -> CatalogEntry:
+        """
+        Find a ListObject, like `find_list_object_by_name` does.
+
+        Raises:
+            KeyError: If there is no such ListObject.
+        """
+        original_name = _lookup(name, self._list_objects, self._list_objects_ci, ci)
+        if original_name is None:
+            raise KeyError(f"ListObject `{name}` not found.")
+        return self._list_objects[original_name]
+
+    def iter_named_range_tables(
+        self,
+        *,
+        exclude_names: Collection[Union[Pattern[str], str]],
+        exclude_sheets: Collection[Union[Pattern[str], str]],
+    ) -> Generator[Tuple["Worksheet", str, str], None, None]:
+        """
+        Like `iter_named_range_tables`, but without parsing the named range destinations again.
+
+        Returns:
+            A generator of tuples like (sheet, name, range).
+        """
+        for entry in self.iter_named_range_entries(
+            exclude_names=exclude_names,
+            exclude_sheets=exclude_sheets,
+        ):
+            yield entry.sheet, entry.name, entry.table_range
+
+    def iter_named_range_entries(
+        self,
+        *,
+        exclude_names: Collection[Union[Pattern[str], str]],
+        exclude_sheets: Collection[Union[Pattern[str], str]],
+        sheet_scoped: bool = False,
+    ) -> Generator[CatalogEntry, None, None]:
+        """
+        Iterate over the catalog entries of named range tables.
+
+        Args:
+            exclude_names: Tables with names matching any of these patterns will be excluded.
+            exclude_sheets: Tables in sheets having names matching any of these patterns will be excluded.
+            sheet_scoped: Whether to include sheet-scoped named ranges, after the workbook-scoped ones.
+        """
+        groups = [self._named_ranges]
+        if sheet_scoped:
+            groups.extend(self._sheet_named_ranges.values())
+
+        for group in groups:
+            for name, entries in group.items():
+                for entry in entries:
+                    if any_match(exclude_sheets, entry.sheet.title.casefold()):
+                        continue
+
+                    if any_match(exclude_names, name.casefold()):
+                        continue
+
+                    if not entry.is_table:
+                        continue
+
+                    yield entry
+
+    def iter_list_object_tables(
+        self,
+        *,
+        exclude_list_objects: Collection[Union[Pattern[str], str]],
+        exclude_sheets: Collection[Union[Pattern[str], str]],
+    ) -> Generator[Tuple["Worksheet", "Table"], None, None]:
+        """
+        Like `iter_list_object_tables`, but without searching through the sheets again.
+
+        Returns:
+            A generator of tuples like (sheet, table).
+        """
+        for entry in self.iter_list_object_entries(
+            exclude_list_objects=exclude_list_objects,
+            exclude_sheets=exclude_sheets,
+        ):
+            yield entry.sheet, entry.table
+
+    def iter_list_object_entries(
+        self,
+        *,
+        exclude_list_objects: Collection[Union[Pattern[str], str]],
+        exclude_sheets: Collection[Union[Pattern[str], str]],
+    ) -> Generator[CatalogEntry, None, None]:
+        """
+        Iterate over the catalog entries of ListObject tables.
+
+        Args:
+            exclude_list_objects: Tables with names matching any of these patterns will be excluded.
+            exclude_sheets: Tables in sheets having names matching any of these patterns will be excluded.
+        """
+        for entry in self._list_objects.values():
+            if any_match(exclude_sheets, entry.sheet.title):
+                continue
+
+            if any_match(exclude_list_objects, entry.name):
+                continue
+
+            if not entry.is_table:
+                continue
+
+            yield entry
+
+
+def _lookup(
+    name: str,
+    exact: Mapping[str, object],
+    folded: Dict[str, str],
+    ci: bool | Literal["warn"],
+) -> Optional[str]:
+    """
+    Look up the original name of a table, optionally ignoring case.
+    """
+    if name in exact:
+        return name
+
+    if not ci:
+        return None
+
+    original_name = folded.get(name.casefold())
+    if original_name is not None and ci == "warn":
+        logger.warning(
+            f"Table with exact name `{name}` not found. Using case-insensitive match `{original_name}` instead."
+        )
+    return original_name
+
+
+def _named_range_entries(
+    name: str,
+    destinations: List[Tuple[str, str]],
+    sheets: Dict[str, "Worksheet"],
+    scope: Optional[str],
+) -> Generator[CatalogEntry, None, None]:
+    for sheet_name, table_range in destinations:
+        sheet = sheets.get(sheet_name)
+        if sheet is None:
+            continue
+
+        yield CatalogEntry(
+            name=name,
+            table_type="Named range",
+            sheet=sheet,
+            table_range=table_range,
+            boundaries=_parse_boundaries(table_range),
+            scope=scope,
+        )
+
+
+def _parse_boundaries(table_range: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse a range like `$B$2:$C$4`.
+
+    Examples:
+        >>> _parse_boundaries('$B$2:$C$4')
+        (2, 2, 3, 4)
+
+        >>> _parse_boundaries('A:A') is None
+        True
+
+        >>> _parse_boundaries('???') is None
+        True
+    """
+    from openpyxl.utils import range_boundaries
+
+    try:
+        min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    except ValueError:
+        return None
+
+    if min_col is None or min_row is None or max_col is None or max_row is None:
+        return None
+
+    return min_col, min_row, max_col, max_row
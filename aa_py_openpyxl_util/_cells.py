@@ -1,7 +1,19 @@
-from typing import Tuple, List, Any, Callable, TYPE_CHECKING
+from itertools import repeat
+from typing import (
+    Tuple,
+    List,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from openpyxl.cell import Cell
+    from openpyxl.worksheet.worksheet import Worksheet
+    from ._typing import TableCells
 
 
 def get_cell_values(cells: Tuple[Tuple["Cell", ...], ...]) -> List[List[Any]]:
@@ -36,3 +48,234 @@ def process_cells(
         2D list of processed cell values
     """
     return [[callback(cell) for cell in row] for row in cells]
+
+
+def get_range_values(
+    *,
+    sheet: "Worksheet",
+    table_range: str,
+) -> List[List[Any]]:
+    """
+    Get the values of the cells in the given range, without creating any `Cell` objects in read-only mode.
+
+    This is the values-only equivalent of `get_cell_values(sheet[table_range])`.
+
+    Args:
+        sheet: The sheet containing the range.
+        table_range: The range to read, e.g. `$B$2:$C$4`.
+
+    Returns:
+        2D list of cell values
+    """
+    return [
+        list(row) for row in iter_range_values(sheet=sheet, table_range=table_range)
+    ]
+
+
+def process_range_values(
+    *,
+    sheet: "Worksheet",
+    table_range: str,
+    callback: Callable[[Any], Any],
+) -> List[List[Any]]:
+    """
+    Process the values of the cells in the given range, without creating any `Cell` objects in read-only mode.
+
+    This is the values-only equivalent of `process_cells(cells=sheet[table_range], callback=...)`.
+
+    Args:
+        sheet: The sheet containing the range.
+        table_range: The range to read, e.g. `$B$2:$C$4`.
+        callback: The callback to process each cell value.
+
+    Returns:
+        2D list of processed cell values
+    """
+    return [
+        [callback(value) for value in row]
+        for row in iter_range_values(sheet=sheet, table_range=table_range)
+    ]
+
+
+def iter_range_values(
+    *,
+    sheet: "Worksheet",
+    table_range: str,
+    raw_dates: bool = False,
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Iterate over the rows of values in the given range.
+
+    Args:
+        sheet: The sheet containing the range.
+        table_range: The range to read, e.g. `$B$2:$C$4`.
+        raw_dates: See `iter_rows_values`.
+
+    Yields:
+        One tuple of values per row in the range.
+    """
+    from openpyxl.utils import range_boundaries
+
+    min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    yield from iter_rows_values(
+        sheet=sheet,
+        min_row=min_row,
+        max_row=max_row,
+        min_col=min_col,
+        max_col=max_col,
+        raw_dates=raw_dates,
+    )
+
+
+def iter_rows_values(
+    *,
+    sheet: "Worksheet",
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+    raw_dates: bool = False,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Like `sheet.iter_rows(..., values_only=True)`.
+
+    Args:
+        sheet: The sheet to read.
+        min_row: The number of the first row to read (1=1).
+        max_row: The number of the last row to read (1=1).
+        min_col: The number of the first column to read (1=A).
+        max_col: The number of the last column to read (1=A).
+        raw_dates: Whether to yield date-formatted values as Excel serial numbers. See `iter_raw_date_rows`.
+
+    Returns:
+        An iterator of tuples of values, one per row.
+        For normal worksheets, no cells are created for empty coordinates. See `iter_existing_values`.
+    """
+    if raw_dates:
+        from ._dates import iter_raw_date_rows
+
+        return iter_raw_date_rows(
+            sheet=sheet,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+        )
+
+    if not is_read_only_sheet(sheet):
+        return iter_existing_values(
+            sheet=sheet,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+        )
+
+    rows: Iterator[Tuple[Any, ...]] = sheet.iter_rows(
+        min_row=min_row,
+        max_row=max_row,
+        min_col=min_col,
+        max_col=max_col,
+        values_only=True,
+    )
+    return rows
+
+
+def iter_existing_values(
+    *,
+    sheet: "Worksheet",
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Like `sheet.iter_rows(..., values_only=True)` for a normal worksheet, but without creating cells.
+
+    `Worksheet.iter_rows` creates and stores a `Cell` for every empty coordinate in the range, which inflates the memory
+    use of the workbook and the time to save it. This only looks up the cells that exist, and yields None for the others.
+
+    When the range has more coordinates than the sheet has cells, e.g. for a mostly empty range like `$A$1:$Z$200000`,
+    the existing cells in the range are collected first, so the time taken scales with the number of cells rather than
+    with the size of the range.
+
+    Args:
+        sheet: The normal (not read-only) worksheet to read.
+        min_row: The number of the first row to read (1=1).
+        max_row: The number of the last row to read (1=1).
+        min_col: The number of the first column to read (1=A).
+        max_col: The number of the last column to read (1=A).
+
+    Yields:
+        One tuple of values per row.
+    """
+    cells: Dict[Tuple[int, int], "Cell"] = sheet._cells
+    columns = range(min_col, max_col + 1)
+
+    if (max_row + 1 - min_row) * len(columns) <= len(cells):
+        get = cells.get
+        for row in range(min_row, max_row + 1):
+            yield tuple(
+                None if cell is None else cell.value
+                for cell in map(get, zip(repeat(row), columns))
+            )
+        return
+
+    rows: Dict[int, Dict[int, Any]] = {}
+    for (row, column), cell in cells.items():
+        if min_row <= row <= max_row and min_col <= column <= max_col:
+            rows.setdefault(row, {})[column] = cell.value
+
+    empty_row = (None,) * len(columns)
+    for row in range(min_row, max_row + 1):
+        values = rows.get(row)
+        if values is None:
+            yield empty_row
+        else:
+            yield tuple(values.get(column) for column in columns)
+
+
+def get_range_cells(*, sheet: "Worksheet", table_range: str) -> "TableCells":
+    """
+    Like `sheet[table_range]`, but without storing new cells in a normal worksheet.
+
+    Empty coordinates get new cells which are not attached to the worksheet, so assigning to them has no effect.
+
+    Args:
+        sheet: The sheet containing the range.
+        table_range: The range to read, e.g. `$B$2:$C$4`.
+
+    Returns:
+        2D tuples of cells, one tuple per row.
+    """
+    from openpyxl.utils import range_boundaries
+
+    if is_read_only_sheet(sheet):
+        table_cells: "TableCells" = sheet[table_range]
+        return table_cells
+
+    from openpyxl.cell import Cell
+
+    min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    cells: Dict[Tuple[int, int], "Cell"] = sheet._cells
+
+    def get(row: int, column: int) -> "Cell":
+        cell = cells.get((row, column))
+        if cell is None:
+            cell = Cell(sheet, row=row, column=column)
+        return cell
+
+    return tuple(
+        tuple(get(row, column) for column in range(min_col, max_col + 1))
+        for row in range(min_row, max_row + 1)
+    )
+
+
+def is_read_only_sheet(sheet: "Worksheet") -> bool:
+    """
+    Check whether the given sheet is streamed from the workbook archive, i.e. each pass over it parses the sheet XML
+    from the start, and it does not support random access.
+    """
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+    return isinstance(sheet, ReadOnlyWorksheet)
@@ -0,0 +1,158 @@
+"""
+Utilities for converting whole columns of values into values that can be written to sheets.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date, datetime, timedelta
+from typing import Any, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+_PLAIN_TYPES = frozenset([type(None), bool, int, str])
+"""
+The types of values which don't need any conversion. Floats do, because NaN becomes None.
+"""
+
+
+def convert_column(
+    values: Sequence[Any] | "NDArray[Any]",
+    *,
+    epoch: datetime,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Convert a column of values in bulk, so that it can be written to a sheet.
+
+    - NaN and NaT become None, i.e. empty cells.
+    - NumPy scalars become the equivalent Python values.
+    - NumPy `datetime64` and `timedelta64` arrays become Excel serial numbers, which are faster to write than dates.
+
+    Args:
+        values: The values, as a list, `array`, NumPy array, pandas series, or any other sequence.
+        epoch: The epoch of the workbook to which the values will be written. See `Workbook.epoch`.
+
+    Returns:
+        The values as a list, and the default number format of the column. The latter is only given for NumPy arrays
+        of dates or durations, whose values have been converted to serial numbers.
+
+    Examples:
+        >>> from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+        >>> convert_column([1, float("nan"), "a", None], epoch=CALENDAR_WINDOWS_1900)
+        ([1, None, 'a', None], None)
+
+        >>> convert_column(array("d", [1.5, float("nan")]), epoch=CALENDAR_WINDOWS_1900)
+        ([1.5, None], None)
+    """
+    to_numpy = getattr(values, "to_numpy", None)
+    if to_numpy is not None:
+        # This is a pandas series.
+        values = to_numpy()
+
+    if type(values).__module__ == "numpy":
+        return convert_numpy_column(values, epoch=epoch)  # type: ignore[arg-type]
+
+    if isinstance(values, array):
+        result = values.tolist()
+        if values.typecode in ("f", "d"):
+            return replace_nan(result), None
+        return result, None
+
+    result = list(values)
+    types = set(map(type, result))
+    if types <= _PLAIN_TYPES:
+        return result, None
+    if float in types and types <= _PLAIN_TYPES | {float}:
+        return replace_nan(result), None
+    return [convert_value(v) for v in result], None
+
+
+def convert_numpy_column(
+    values: "NDArray[Any]",
+    *,
+    epoch: datetime,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Like `convert_column`, for a 1-dimensional NumPy array.
+    """
+    import numpy
+    from openpyxl.cell.cell import get_time_format
+    from openpyxl.utils.datetime import WINDOWS_EPOCH
+
+    if values.ndim != 1:
+        raise ValueError(
+            f"Columns must be 1-dimensional, but got an array with shape {values.shape}."
+        )
+
+    kind = values.dtype.kind
+    if kind in ("b", "i", "u", "U"):
+        return values.tolist(), None
+
+    if kind == "f":
+        return replace_nan_numpy(values.tolist(), numpy.isnan(values)), None
+
+    if kind == "M":
+        days = (values - numpy.datetime64(epoch, "us")) / numpy.timedelta64(1, "D")
+        if epoch == WINDOWS_EPOCH:
+            # Excel counts the non-existent 29 February 1900, so dates before March 1900 are one day earlier.
+            whole_days = numpy.floor(days)
+            days = numpy.where((whole_days > 0) & (whole_days <= 60), days - 1, days)
+        number_format = get_time_format(
+            date if values.dtype == numpy.dtype("datetime64[D]") else datetime
+        )
+        return replace_nan_numpy(days.tolist(), numpy.isnan(days)), number_format
+
+    if kind == "m":
+        days = values / numpy.timedelta64(1, "D")
+        return replace_nan_numpy(days.tolist(), numpy.isnan(days)), get_time_format(
+            timedelta
+        )
+
+    return [convert_value(v) for v in values.tolist()], None
+
+
+def convert_value(value: Any) -> Any:
+    """
+    Convert a single value, like `convert_column` would.
+
+    NumPy dates and durations become `datetime` and `timedelta`, instead of serial numbers, because their number format
+    depends on the rest of the column.
+    """
+    if isinstance(value, float):
+        return None if value != value else value
+
+    if type(value).__module__ != "numpy":
+        return value
+
+    import numpy
+
+    if isinstance(value, numpy.datetime64):
+        value = value.astype("datetime64[us]")
+    elif isinstance(value, numpy.timedelta64):
+        value = value.astype("timedelta64[us]")
+
+    return convert_value(value.item())
+
+
+def replace_nan(values: List[Any]) -> List[Any]:
+    """
+    Replace NaN with None in a list, in place.
+
+    Examples:
+        >>> replace_nan([1.0, float("nan"), None])
+        [1.0, None, None]
+    """
+    for i, value in enumerate(values):
+        if value != value:
+            values[i] = None
+    return values
+
+
+def replace_nan_numpy(values: List[Any], nan: "NDArray[Any]") -> List[Any]:
+    """
+    Replace values with None in a list, in place, where a NumPy boolean mask is true.
+    """
+    for i in nan.nonzero()[0].tolist():
+        values[i] = None
+    return values
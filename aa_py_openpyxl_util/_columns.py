@@ -0,0 +1,210 @@
+"""
+Utilities for reading tables column by column, instead of row by row.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    OrderedDict,
+    Sequence,
+    TYPE_CHECKING,
+)
+
+from pydicti import odicti
+
+from ._data_util import HeaderIndex
+from ._extract import read_table_values
+from ._find_table import find_table
+
+if TYPE_CHECKING:
+    import pandas
+    from numpy.typing import NDArray
+    from openpyxl import Workbook
+    from ._catalog import TableCatalog
+
+
+def read_table_columns(
+    *,
+    book: "Workbook",
+    table_name: str,
+    columns: List[str] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+    raw_dates: bool = False,
+) -> OrderedDict[str, Sequence[Any]]:
+    """
+    Read a table from a workbook and return its columns.
+
+    This fills one list per column directly while scanning the table, instead of building one mapping per row.
+    Columns containing only integers are returned as `array('q')`, and columns containing only floats are returned as
+    `array('d')`. All other columns are returned as lists, including columns mixing integers and floats, because
+    integers above 2**53 can't be stored exactly as floats. Empty rows are kept, like `read_table` does.
+
+    Use `columns_to_numpy` or `columns_to_pandas` to convert the result for vectorised calculations.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the table.
+        table_name: The name of the table (ListObject or named range) to read.
+        columns:
+            Optional list of column names to extract.
+            If not given, all columns are extracted.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+        raw_dates:
+            Whether to return date-formatted values as Excel serial numbers instead of dates. See `read_table`.
+            Date columns are then returned as typed arrays, which `serials_to_datetimes` converts in bulk.
+
+    Returns:
+        A case-insensitive ordered dictionary mapping column names to column values.
+    """
+    sheet, table_range = find_table(book=book, name=table_name, ci=ci, catalog=catalog)
+    return values_to_columns(
+        data=read_table_values(
+            sheet=sheet,
+            table_range=table_range,
+            columns=columns,
+            raw_dates=raw_dates,
+        ),
+        columns=None,
+    )
+
+
+def values_to_columns(
+    *,
+    data: Iterable[Sequence[Any]],
+    columns: Optional[List[str]],
+) -> OrderedDict[str, Sequence[Any]]:
+    """
+    Convert 2D data (rows and columns) into columns, assuming the first row is a header.
+
+    Args:
+        data: The data containing the rows and columns. The first dimension should represent the rows.
+        columns: A list of column names to keep. All other columns are ignored. If not specified, use all columns.
+
+    Returns:
+        A case-insensitive ordered dictionary mapping column names to column values.
+
+    Examples:
+        >>> values_to_columns(data=[("a", "b"), (1, "x"), (2, "y")], columns=None)
+        odicti({'a': array('q', [1, 2]), 'b': ['x', 'y']})
+
+        >>> values_to_columns(data=[("a", "b"), (1, 1.5)], columns=["B"])
+        odicti({'B': array('d', [1.5])})
+    """
+    it = iter(data)
+    header = [str(v) for v in next(it)]
+    index, picks = HeaderIndex.create(header=header, columns=columns)
+    if picks is None:
+        picks = tuple(range(len(index.keys)))
+
+    lists: List[List[Any]] = [[] for _ in picks]
+    appends = [(values.append, i) for values, i in zip(lists, picks)]
+    for row in it:
+        for append, i in appends:
+            append(row[i])
+
+    result: OrderedDict[str, Sequence[Any]] = odicti()
+    for key, values in zip(index.keys, lists):
+        result[key] = compact_column(values)
+    return result
+
+
+def compact_column(values: List[Any]) -> Sequence[Any]:
+    """
+    Store a column of values in a typed array, if possible.
+
+    Examples:
+        >>> compact_column([1, 2, 3])
+        array('q', [1, 2, 3])
+
+        >>> compact_column([1.5, 2.5])
+        array('d', [1.5, 2.5])
+
+        >>> compact_column([2**53 + 1, 2.5])
+        [9007199254740993, 2.5]
+
+        >>> compact_column([1, None])
+        [1, None]
+
+        >>> compact_column([True, 1])
+        [True, 1]
+
+        >>> compact_column([2**64])
+        [18446744073709551616]
+
+        >>> compact_column([])
+        []
+    """
+    if not values:
+        return values
+
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+
+    if types == {float}:
+        return array("d", values)
+
+    return values
+
+
+def columns_to_numpy(
+    columns: Mapping[str, Sequence[Any]],
+) -> OrderedDict[str, "NDArray[Any]"]:
+    """
+    Convert columns, as returned by `read_table_columns`, to NumPy arrays.
+
+    Typed arrays are converted without copying. Other columns become arrays with `dtype=object`.
+
+    Args:
+        columns: A mapping of column names to column values.
+
+    Returns:
+        A case-insensitive ordered dictionary mapping column names to NumPy arrays.
+    """
+    import numpy
+
+    result: OrderedDict[str, "NDArray[Any]"] = odicti()
+    for key, values in columns.items():
+        if isinstance(values, array) and values.typecode in ("d", "q"):
+            result[key] = numpy.frombuffer(
+                values,
+                dtype=numpy.float64 if values.typecode == "d" else numpy.int64,
+            )
+        else:
+            column = numpy.empty(len(values), dtype=object)
+            column[:] = values
+            result[key] = column
+
+    return result
+
+
+def columns_to_pandas(
+    columns: Mapping[str, Sequence[Any]],
+) -> "pandas.DataFrame":
+    """
+    Convert columns, as returned by `read_table_columns`, to a pandas DataFrame.
+
+    Args:
+        columns: A mapping of column names to column values.
+
+    Returns:
+        A DataFrame with the columns in their original order.
+    """
+    import pandas
+
+    return pandas.DataFrame(dict(columns_to_numpy(columns)), copy=False)
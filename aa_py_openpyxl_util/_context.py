@@ -4,7 +4,9 @@ Utilities for working with read-only openpyxl workbooks.
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, Dict, TYPE_CHECKING
+from typing import BinaryIO, Generator, Dict, TYPE_CHECKING
+
+from ._table_parts import attach_list_objects
 
 if TYPE_CHECKING:
     from openpyxl.workbook import Workbook
@@ -20,6 +22,9 @@ def safe_load_workbook(
     """
     Open a workbook with openpyxl. Make sure the file handle is closed afterward.
 
+    In read-only mode, ListObjects are read from the archive and attached to the worksheets, because openpyxl does not
+    do this itself. See `attach_list_objects`.
+
     This is a context manager.
 
     See Also:
@@ -33,6 +38,24 @@ def safe_load_workbook(
     Yields:
         The workbook.
     """
+    book = open_workbook(path=path, read_only=read_only, data_only=data_only)
+    try:
+        yield book
+    finally:
+        book.close()
+
+
+def open_workbook(
+    *,
+    path: Path | BinaryIO,
+    read_only: bool,
+    data_only: bool,
+) -> "Workbook":
+    """
+    Open a workbook like `safe_load_workbook` does, but leave it to the caller to close it.
+
+    The workbook may also be read from an open binary file, which the caller must close after closing the workbook.
+    """
     from openpyxl import load_workbook
 
     book: "Workbook" = load_workbook(
@@ -41,9 +64,12 @@ def safe_load_workbook(
         data_only=data_only,
     )
     try:
-        yield book
-    finally:
+        if read_only:
+            attach_list_objects(book=book)
+    except BaseException:
         book.close()
+        raise
+    return book
 
 
 @contextmanager
@@ -1,11 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
 from typing import (
     Iterable,
+    Iterator,
     Optional,
     List,
     Callable,
     Any,
+    Dict,
     Generator,
     OrderedDict,
+    Sequence,
+    Tuple,
     TypeVar,
 )
 
@@ -13,6 +20,7 @@ from pydicti import odicti
 
 T = TypeVar("T")
 U = TypeVar("U")
+M = TypeVar("M", bound=Mapping[str, Any])
 
 
 def data_to_dicts(
@@ -21,6 +29,7 @@ def data_to_dicts(
     value_callback: Callable[[T], U],
     header_callback: Callable[[T], str],
     columns: Optional[List[str]] = None,
+    skip_empty_rows: bool = True,
 ) -> Generator[OrderedDict[str, U], None, None]:
     """
     Convert 2D data (rows and columns) into a generator, assuming the first line is a header.
@@ -30,6 +39,9 @@ def data_to_dicts(
         columns: A list of column names to keep. All other columns are ignored. If not specified, use all columns.
         header_callback: A callback function used to process each header value.
         value_callback: A callback function used to process each cell value.
+        skip_empty_rows:
+            Whether to skip rows in which all the values are None. Disable this to keep the empty rows of a table, like
+            `read_table` does.
 
     Yields:
         One case-insensitive ordered dictionary for each row, using keys from the header.
@@ -58,7 +70,7 @@ def data_to_dicts(
     it = iter(data)
     header = [header_callback(c) for c in next(it)]
     for row in it:
-        if all_none(row):
+        if skip_empty_rows and all_none(row):
             # This is an empty row. Skip it.
             continue
 
@@ -71,9 +83,188 @@ def data_to_dicts(
             yield odicti(((k, value_callback(d[k])) for k in d))
 
 
+def data_to_row_views(
+    *,
+    data: Iterable[Iterable[T]],
+    header_callback: Callable[[T], str],
+    value_callback: Optional[Callable[[T], T]] = None,
+    columns: Optional[List[str]] = None,
+    skip_empty_rows: bool = True,
+) -> Generator[RowView[T], None, None]:
+    """
+    Like `data_to_dicts`, but yield lightweight `RowView` objects instead of case-insensitive ordered dictionaries.
+
+    All the views share one header index, so each row costs one tuple of values instead of two dictionaries.
+    The rows are assumed to be at least as wide as the header.
+
+    Args:
+        data: The data containing the rows and columns. The first dimension should represent the rows.
+        header_callback: A callback function used to process each header value.
+        value_callback: An optional callback function used to process each cell value.
+        columns: A list of column names to keep. All other columns are ignored. If not specified, use all columns.
+        skip_empty_rows: See `data_to_dicts`.
+
+    Yields:
+        One case-insensitive view for each row, using keys from the header.
+
+    Examples:
+        >>> d1 = (("a", "b", "c"), (1, 2, 3), (None, None, None), (4, 5, 6))
+
+        Use all columns in original order.
+        >>> g = data_to_row_views(data=d1, header_callback=lambda x:x)
+        >>> next(g)
+        RowView({'a': 1, 'b': 2, 'c': 3})
+        >>> next(g)['A']
+        4
+
+        Use specific columns in specified order.
+        >>> g = data_to_row_views(data=d1, header_callback=lambda x:x, columns=['B', 'a'])
+        >>> next(g).to_dict()
+        odicti({'B': 2, 'a': 1})
+    """
+    it = iter(data)
+    header = [header_callback(c) for c in next(it)]
+    index, picks = HeaderIndex.create(header=header, columns=columns)
+
+    for row in it:
+        if skip_empty_rows and all_none(row):
+            # This is an empty row. Skip it.
+            continue
+
+        values = tuple(row)
+        if picks is not None:
+            values = tuple([values[i] for i in picks])
+        if value_callback is not None:
+            values = tuple([value_callback(v) for v in values])
+
+        yield RowView(index, values)
+
+
+class HeaderIndex:
+    """
+    A case-insensitive mapping from column names to positions, shared by all the `RowView` objects of a table.
+    """
+
+    __slots__ = ("keys", "positions")
+
+    keys: Tuple[str, ...]
+    """
+    The column names, in their original case and order.
+    """
+
+    positions: Dict[object, int]
+    """
+    Maps each case-folded column name to its position in `keys`.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys = tuple(keys)
+        self.positions = {normalize_key(k): i for i, k in enumerate(self.keys)}
+
+    @staticmethod
+    def create(
+        *,
+        header: Sequence[str],
+        columns: Optional[Sequence[str]],
+    ) -> Tuple[HeaderIndex, Optional[Tuple[int, ...]]]:
+        """
+        Create a header index for a table.
+
+        Duplicate column names are handled like `odicti` does: the first name is kept, with the last value.
+
+        Args:
+            header: The table header.
+            columns: The column names to keep, or None to keep all columns.
+
+        Returns:
+            A tuple like (index, picks), where `picks` holds the positions in each row of the values to keep, or None
+            if the rows can be used as they are.
+
+        Raises:
+            KeyError: If any of the given columns are not in the header.
+        """
+        last: Dict[object, int] = {}
+        first: Dict[object, str] = {}
+        for i, k in enumerate(header):
+            n = normalize_key(k)
+            last[n] = i
+            first.setdefault(n, k)
+
+        if columns:
+            try:
+                picks = tuple(last[normalize_key(k)] for k in columns)
+            except KeyError as e:
+                raise KeyError(e.args[0]) from None
+            return HeaderIndex(columns), picks
+
+        if len(first) == len(header):
+            return HeaderIndex(header), None
+
+        return HeaderIndex(list(first.values())), tuple(last.values())
+
+
+class RowView(Mapping[str, T]):
+    """
+    A read-only, case-insensitive view of one table row.
+
+    This is much lighter than `odicti`: it only holds a reference to the shared `HeaderIndex` and a tuple of values.
+    Use `to_dict` to get an `odicti` if you need to modify the row.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: HeaderIndex, values: Tuple[T, ...]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> T:
+        try:
+            return self._values[self._index.positions[normalize_key(key)]]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return normalize_key(key) in self._index.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.keys)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(zip(self._index.keys, self._values))!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return RowView, (self._index, self._values)
+
+    def values_tuple(self) -> Tuple[T, ...]:
+        """
+        The row values, in column order.
+        """
+        return self._values
+
+    def to_dict(self) -> OrderedDict[str, T]:
+        """
+        Copy the row into a case-insensitive ordered dictionary, like the ones yielded by `data_to_dicts`.
+        """
+        result: OrderedDict[str, T] = odicti(zip(self._index.keys, self._values))
+        return result
+
+
+def normalize_key(key: object) -> object:
+    """
+    Normalize a key for case-insensitive lookups, like `odicti` does.
+    """
+    try:
+        return key.casefold()  # type: ignore[attr-defined]
+    except AttributeError:
+        return key
+
+
 def skip_empty_rows(
-    data: Iterable[OrderedDict[str, T]],
-) -> Generator[OrderedDict[str, T], None, None]:
+    data: Iterable[M],
+) -> Generator[M, None, None]:
     """
     Skip empty rows.
     """
@@ -0,0 +1,229 @@
+"""
+Utilities for reading dates as Excel serial numbers, and converting them in bulk.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import (
+    Any,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    overload,
+)
+
+from ._cells import get_range_cells, is_read_only_sheet, iter_rows_values
+from ._find_table import find_table
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
+    from openpyxl import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+    from ._catalog import TableCatalog
+
+_DATE_TYPES = (date, time, timedelta)
+"""
+The types of the values that openpyxl creates for date-formatted cells. `datetime` is a subclass of `date`.
+"""
+
+
+def iter_raw_date_rows(
+    *,
+    sheet: "Worksheet",
+    min_row: int,
+    max_row: int,
+    min_col: int,
+    max_col: int,
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Like `sheet.iter_rows(..., values_only=True)`, but yield date-formatted values as Excel serial numbers.
+
+    For read-only sheets, the sheet is parsed without any date formats, so that no date objects are created at all.
+    For other sheets, the dates have already been created when the workbook was loaded, so they are converted back.
+
+    Args:
+        sheet: The sheet to read.
+        min_row: The number of the first row to read (1=1).
+        max_row: The number of the last row to read (1=1).
+        min_col: The number of the first column to read (1=A).
+        max_col: The number of the last column to read (1=A).
+
+    Yields:
+        One tuple of values per row.
+    """
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+    if type(sheet) is not ReadOnlyWorksheet:
+        from openpyxl.utils.datetime import to_excel
+
+        epoch = sheet.parent.epoch
+        for row in iter_rows_values(
+            sheet=sheet,
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+        ):
+            for value in row:
+                if isinstance(value, _DATE_TYPES):
+                    break
+            else:
+                yield row
+                continue
+
+            yield tuple(
+                to_excel(v, epoch) if isinstance(v, _DATE_TYPES) else v for v in row
+            )
+        return
+
+    from openpyxl.worksheet._reader import WorkSheetParser
+
+    book = sheet.parent
+    empty_row = (None,) * (max_col + 1 - min_col)
+
+    # This follows `ReadOnlyWorksheet._cells_by_row`, including how it pads missing rows.
+    counter = min_row
+    row_number = 1
+    with sheet._get_source() as src:
+        parser = WorkSheetParser(
+            src,
+            sheet._shared_strings,
+            data_only=book.data_only,
+            epoch=book.epoch,
+            date_formats=set(),
+        )
+        for row_number, cells in parser.parse():
+            if row_number > max_row:
+                break
+
+            # Some rows are missing.
+            for _ in range(counter, row_number):
+                counter += 1
+                yield empty_row
+
+            if counter <= row_number:
+                counter += 1
+                yield sheet._get_row(cells, min_col, max_col, values_only=True)
+
+    if max_row < row_number:
+        for _ in range(counter, max_row + 1):
+            yield empty_row
+
+
+def find_date_columns(
+    *,
+    book: "Workbook",
+    table_name: str,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+) -> List[str]:
+    """
+    Find the columns of a table that hold dates, by looking at the number formats of the first row below the header.
+
+    Only the header and the first data row are read. Use this to find which columns to pass to `serials_to_datetimes`
+    after reading a table with `raw_dates=True`.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the table.
+        table_name: The name of the table (ListObject or named range).
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+
+    Returns:
+        The names of the date-formatted columns, in the order of the table.
+    """
+    from openpyxl.utils import get_column_letter, range_boundaries
+
+    sheet, table_range = find_table(book=book, name=table_name, ci=ci, catalog=catalog)
+    min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    if max_row <= min_row:
+        return []
+
+    header, first = get_range_cells(
+        sheet=sheet,
+        table_range=f"{get_column_letter(min_col)}{min_row}:{get_column_letter(max_col)}{min_row + 1}",
+    )
+    if not is_read_only_sheet(sheet):
+        return [str(h.value) for h, cell in zip(header, first) if cell.is_date]
+
+    # Look the style ids up in the date formats that openpyxl found once per style id when loading the workbook.
+    date_formats = book._date_formats
+    return [
+        str(h.value)
+        for h, cell in zip(header, first)
+        if getattr(cell, "_style_id", 0) in date_formats
+    ]
+
+
+@overload
+def serials_to_datetimes(
+    values: Sequence[Optional[float]],
+    *,
+    epoch: datetime,
+    numpy: Literal[False] = False,
+) -> List[Any]: ...
+
+
+@overload
+def serials_to_datetimes(
+    values: Sequence[Optional[float]],
+    *,
+    epoch: datetime,
+    numpy: Literal[True],
+) -> "NDArray[numpy.datetime64]": ...
+
+
+def serials_to_datetimes(
+    values: Sequence[Optional[float]],
+    *,
+    epoch: datetime,
+    numpy: bool = False,
+) -> List[Any] | "NDArray[numpy.datetime64]":
+    """
+    Convert a column of Excel serial numbers to dates.
+
+    Args:
+        values: The serial numbers. None is allowed for empty cells.
+        epoch: The epoch of the workbook. See `Workbook.epoch`.
+        numpy:
+            Whether to convert all the values at once into a NumPy `datetime64[ms]` array, with NaT for empty cells.
+            Otherwise, each value is converted like openpyxl does, to `datetime`, or to `time` for values below 1.
+
+    Returns:
+        The dates.
+
+    Examples:
+        >>> from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+        >>> serials_to_datetimes([45306, 45306.5, None], epoch=CALENDAR_WINDOWS_1900)
+        [datetime.datetime(2024, 1, 15, 0, 0), datetime.datetime(2024, 1, 15, 12, 0), None]
+    """
+    if not numpy:
+        from openpyxl.utils.datetime import from_excel
+
+        return [from_excel(v, epoch) for v in values]
+
+    import numpy as np
+    from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+
+    serials = np.asarray(values, dtype=np.float64)
+    if epoch == CALENDAR_WINDOWS_1900:
+        # Excel counts the non-existent 29 February 1900.
+        serials = np.where((serials > 0) & (serials < 60), serials + 1, serials)
+
+    milliseconds = np.round(serials * 86_400_000)
+    empty = np.isnan(milliseconds)
+    result = np.datetime64(epoch, "ms") + np.where(empty, 0, milliseconds).astype(
+        np.int64
+    ).astype("timedelta64[ms]")
+    result[empty] = np.datetime64("NaT")
+    return result
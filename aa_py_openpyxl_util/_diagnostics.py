@@ -0,0 +1,108 @@
+"""
+Utilities for reporting the issues found while reading tables, without logging every cell.
+"""
+
+from __future__ import annotations
+
+from logging import Logger, getLogger
+from typing import Dict, List, Optional, Tuple
+
+logger = getLogger(__name__)
+
+
+class ReadDiagnostics:
+    """
+    Collects the issues found while reading tables, so that they can be reported in a single summary.
+
+    Pass this to `read_table` or `extract_data_from_numbered_tables`, and call `log_summary` when done. Without it,
+    a warning is logged for every affected cell.
+
+    For each table and column, the number of affected cells is counted, and the coordinates of the first few are kept.
+    """
+
+    max_samples: int
+    """
+    The number of coordinates to keep per table and column.
+    """
+
+    def __init__(self, *, max_samples: int = 3):
+        self.max_samples = max_samples
+        self._counts: Dict[Tuple[str, int], int] = {}
+        self._samples: Dict[Tuple[str, int], List[int]] = {}
+
+    def add_carriage_return(self, *, table_name: str, column: int, row: int) -> None:
+        """
+        Record a cell containing a carriage return, which was replaced.
+
+        Args:
+            table_name: The name of the table containing the cell.
+            column: The number of the column of the cell (1=A).
+            row: The number of the row of the cell (1=1).
+        """
+        key = (table_name, column)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count < self.max_samples:
+            self._samples.setdefault(key, []).append(row)
+
+    @property
+    def carriage_returns(self) -> Dict[Tuple[str, str], int]:
+        """
+        The number of cells containing carriage returns, keyed by (table name, column letter).
+        """
+        from openpyxl.utils import get_column_letter
+
+        return {
+            (table_name, get_column_letter(column)): count
+            for (table_name, column), count in self._counts.items()
+        }
+
+    def summary(self) -> Optional[str]:
+        """
+        Describe all the recorded issues.
+
+        Returns:
+            The summary, or None if there were no issues.
+
+        Examples:
+            >>> diagnostics = ReadDiagnostics(max_samples=2)
+            >>> for row in [2, 3, 5]:
+            ...     diagnostics.add_carriage_return(table_name="Table1", column=2, row=row)
+            >>> diagnostics.summary()
+            'Cells contain carriage returns. This is not supported. Please replace the carriage returns with newlines. Table1 column B: 3 cells, e.g. B2, B3.'
+
+            >>> ReadDiagnostics().summary() is None
+            True
+        """
+        from openpyxl.utils import get_column_letter
+
+        if not self._counts:
+            return None
+
+        parts = []
+        for (table_name, column), count in self._counts.items():
+            letter = get_column_letter(column)
+            samples = ", ".join(
+                f"{letter}{row}" for row in self._samples[table_name, column]
+            )
+            parts.append(
+                f"{table_name} column {letter}: {count} cell{'' if count == 1 else 's'}, e.g. {samples}"
+            )
+
+        return (
+            "Cells contain carriage returns. This is not supported. "
+            "Please replace the carriage returns with newlines. "
+            + "; ".join(parts)
+            + "."
+        )
+
+    def log_summary(self, *, log: Optional[Logger] = None) -> None:
+        """
+        Log the summary as a single warning, if there were any issues.
+
+        Args:
+            log: The logger to use. Defaults to the logger of this module.
+        """
+        summary = self.summary()
+        if summary is not None:
+            (log or logger).warning(summary)
@@ -0,0 +1,351 @@
+"""
+A persistent cache of extracted tables, so that unchanged workbooks don't have to be parsed again.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from itertools import chain
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Literal,
+    Optional,
+    OrderedDict,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ._batch import TableValues, values_to_table_values
+from ._cache_format import read_tables, write_tables
+from ._context import safe_load_workbook
+from ._data_util import all_none
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
+
+class TableCache:
+    """
+    A cache of extracted tables in a local directory, in front of `read_table`, `read_dict_table` and
+    `extract_data_from_numbered_tables`.
+
+    Entries are keyed by the workbook path, size and modification time, the CRC32 of every part in the workbook
+    archive, and the arguments of the call. When the workbook changes, its old entries are removed the next time it is
+    read. On a cache hit, the workbook is not opened with openpyxl at all.
+
+    Each entry is one file holding the columns of the tables in a compact binary format, which is read through a
+    memory map. Reading an entry never runs any code from it. Entries that can't be read are removed and count as
+    misses, and tables holding values that the format can't store, e.g. array formulae, are not cached. The least
+    recently used entries are removed when the total size of the cache exceeds `max_bytes`.
+    """
+
+    cache_dir: Path
+    """
+    The directory holding the cache entries.
+    """
+
+    max_bytes: int
+    """
+    The maximum total size of the cache entries, in bytes.
+    """
+
+    def __init__(self, *, cache_dir: Path, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def read_table(
+        self,
+        *,
+        path: Path,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        ci: bool | Literal["warn"],
+        data_only: bool,
+    ) -> Generator[OrderedDict[str, Any], None, None]:
+        """
+        Like `read_table`, but for a workbook on the disk, using the cache.
+
+        Args:
+            path: The path to the workbook on the disk.
+            table_name: The name of the table (ListObject or named range) to read.
+            columns: Optional list of column names to extract. If not given, all columns are extracted.
+            ci:
+                Whether the table name lookup should be case-insensitive.
+                When this is "warn", a warning is logged when the provided case does not match the actual case.
+                This is only logged when the workbook is read, not on cache hits.
+            data_only: See `safe_load_workbook`.
+
+        Returns:
+            A generator of dictionaries, like `read_table`.
+        """
+        from ._extract import read_table_values
+        from ._find_table import find_table
+
+        def load(book: "Workbook") -> List[TableValues]:
+            sheet, table_range = find_table(book=book, name=table_name, ci=ci)
+            return [
+                values_to_table_values(
+                    data=read_table_values(
+                        sheet=sheet, table_range=table_range, columns=columns
+                    ),
+                    columns=None,
+                )
+            ]
+
+        (table,) = self._get(
+            path=path,
+            request=("read_table", table_name, ci, _tuple(columns), data_only),
+            data_only=data_only,
+            load=load,
+        )
+        return table_values_to_rows(table)
+
+    def read_dict_table(
+        self,
+        *,
+        path: Path,
+        table_name: str,
+        key_column: str,
+        value_column: str,
+        ci: bool | Literal["warn"],
+        data_only: bool,
+    ) -> Dict[str, Any]:
+        """
+        Like `read_dict_table`, but for a workbook on the disk, using the cache.
+
+        Args:
+            path: The path to the workbook on the disk.
+            table_name: The name of the table (ListObject or named range) to read.
+            key_column: The name of the column whose values to use as dictionary keys.
+            value_column: The name of the column whose values to use as dictionary values.
+            ci: See `TableCache.read_table`.
+            data_only: See `safe_load_workbook`.
+
+        Returns:
+            A dictionary, like `read_dict_table`.
+        """
+        data = self.read_table(
+            path=path,
+            table_name=table_name,
+            columns=[key_column, value_column],
+            ci=ci,
+            data_only=data_only,
+        )
+        return {row[key_column]: row[value_column] for row in data}
+
+    def extract_data_from_numbered_tables(
+        self,
+        *,
+        path: Path,
+        base_name: str,
+        columns: Optional[List[str]] = None,
+        data_only: bool,
+    ) -> Generator[OrderedDict[str, Any], None, None]:
+        """
+        Like `extract_data_from_numbered_tables`, but for a workbook on the disk, using the cache.
+
+        Args:
+            path: The path to the workbook on the disk.
+            base_name: See `get_numbered_tables`.
+            columns: The columns to extract. If not given, all columns will be extracted.
+            data_only: See `safe_load_workbook`.
+
+        Returns:
+            A generator of dictionaries, like `extract_data_from_numbered_tables`.
+        """
+        from ._extract import find_numbered_tables, read_table_values
+
+        def load(book: "Workbook") -> List[TableValues]:
+            tables = []
+            for _, sheet, table_range in find_numbered_tables(
+                book=book, base_name=base_name
+            ):
+                table = values_to_table_values(
+                    data=read_table_values(
+                        sheet=sheet, table_range=table_range, columns=columns
+                    ),
+                    columns=None,
+                )
+                # Skip the rows in which all the extracted columns are empty, like `extract_data_from_numbered_tables`.
+                tables.append(
+                    replace(
+                        table, rows=[row for row in table.rows if not all_none(row)]
+                    )
+                )
+            return tables
+
+        tables = self._get(
+            path=path,
+            request=("numbered_tables", base_name, _tuple(columns), data_only),
+            data_only=data_only,
+            load=load,
+        )
+        return (row for table in tables for row in table_values_to_rows(table))
+
+    def invalidate(self, *, path: Path) -> None:
+        """
+        Remove all the cache entries of a workbook.
+
+        Args:
+            path: The path to the workbook on the disk.
+        """
+        for entry in self.cache_dir.glob(f"{_path_key(path)}-*.bin"):
+            entry.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """
+        Remove all the cache entries.
+        """
+        for entry in self.cache_dir.glob("*.bin"):
+            entry.unlink(missing_ok=True)
+
+    def _get(
+        self,
+        *,
+        path: Path,
+        request: Tuple[Any, ...],
+        data_only: bool,
+        load: Callable[["Workbook"], List[TableValues]],
+    ) -> List[TableValues]:
+        path_key = _path_key(path)
+        fingerprint = _hash(workbook_fingerprint(path))
+        entry = self.cache_dir.joinpath(
+            f"{path_key}-{fingerprint}-{_hash(request)}.bin"
+        )
+
+        tables = _read_entry(entry)
+        if tables is not None:
+            # Mark the entry as recently used.
+            try:
+                os.utime(entry)
+            except FileNotFoundError:
+                # Another process evicted the entry after it was read.
+                pass
+            return tables
+
+        with safe_load_workbook(path=path, read_only=True, data_only=data_only) as book:
+            tables = load(book)
+
+        # Remove the entries for older versions of the workbook.
+        for old_entry in self.cache_dir.glob(f"{path_key}-*.bin"):
+            if not old_entry.name.startswith(f"{path_key}-{fingerprint}-"):
+                old_entry.unlink(missing_ok=True)
+
+        _write_entry(entry, tables)
+        self._evict()
+        return tables
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits within `max_bytes`.
+        """
+        entries = []
+        for entry in self.cache_dir.glob("*.bin"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def workbook_fingerprint(path: Path) -> Tuple[Any, ...]:
+    """
+    Identify the contents of a workbook, using the file metadata and the CRC32 of every part in the archive.
+
+    Only the central directory of the archive is read, so this does not decompress anything.
+    """
+    from zipfile import ZipFile
+
+    stat = path.stat()
+    with ZipFile(path) as archive:
+        crcs = tuple((info.filename, info.CRC) for info in archive.infolist())
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns, crcs
+
+
+def table_values_to_rows(
+    table: TableValues,
+) -> Generator[OrderedDict[str, Any], None, None]:
+    """
+    Convert `TableValues` into the dictionaries that `read_table` would yield.
+    """
+    from ._extract import values_to_rows
+
+    rows: Generator[OrderedDict[str, Any], None, None] = values_to_rows(
+        data=chain([table.header], table.rows),
+        columns=None,
+        row_views=False,
+    )  # type: ignore[assignment]
+    return rows
+
+
+def _read_entry(entry: Path) -> Optional[List[TableValues]]:
+    """
+    Read a cache entry. Return None if it does not exist, and remove it if it can't be read.
+    """
+    try:
+        return read_tables(entry)
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError, IndexError, OverflowError):
+        # The entry is truncated or corrupt, e.g. because it was written by another version of this package.
+        entry.unlink(missing_ok=True)
+        return None
+
+
+def _write_entry(entry: Path, tables: List[TableValues]) -> None:
+    """
+    Write a cache entry. Tables holding values that the cache format can't store are not cached.
+    """
+    from io import BytesIO
+    from tempfile import NamedTemporaryFile
+
+    buffer = BytesIO()
+    try:
+        write_tables(buffer, tables)
+    except ValueError:
+        return
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so that other processes never see a partial entry.
+    f = NamedTemporaryFile(dir=entry.parent, suffix=".tmp", delete=False)
+    try:
+        with f:
+            f.write(buffer.getbuffer())
+        os.replace(f.name, entry)
+    except BaseException:
+        # Don't leave the temporary file behind, e.g. when the disk is full.
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+
+def _path_key(path: Path) -> str:
+    return _hash(str(path.resolve()))
+
+
+def _hash(value: Any) -> str:
+    """
+    Examples:
+        >>> _hash(("read_table", "Table1", False, None, True))
+        'd2171da751f7d6c3c625eec2'
+    """
+    from hashlib import sha256
+
+    return sha256(repr(value).encode()).hexdigest()[:24]
+
+
+def _tuple(columns: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    return None if columns is None else tuple(columns)
@@ -4,20 +4,78 @@ import re
 from collections import OrderedDict
 from itertools import chain
 from logging import getLogger
-from typing import Generator, Optional, List, Any, Tuple, Dict, TYPE_CHECKING, Literal
-
-from ._data_util import data_to_dicts, skip_empty_rows
+from typing import (
+    Generator,
+    Optional,
+    List,
+    Any,
+    Tuple,
+    Dict,
+    TYPE_CHECKING,
+    Literal,
+    Mapping,
+    Sequence,
+    Iterable,
+    overload,
+)
+
+from ._cells import (
+    get_range_cells,
+    iter_range_values,
+    iter_rows_values,
+    is_read_only_sheet,
+)
+from ._data_util import (
+    HeaderIndex,
+    data_to_dicts,
+    data_to_row_views,
+    skip_empty_rows,
+)
 from ._find_table import find_table
-from ._iter_tables import iter_list_object_tables, iter_named_range_tables
+from ._iter_tables import is_table_range
+from ._table_parts import get_list_objects
 
 if TYPE_CHECKING:
+    from ._catalog import TableCatalog
+    from ._data_util import RowView
+    from ._diagnostics import ReadDiagnostics
     from ._typing import TableCells
     from openpyxl import Workbook
     from openpyxl.cell import Cell
+    from openpyxl.workbook.defined_name import DefinedName
+    from openpyxl.worksheet.worksheet import Worksheet
 
 logger = getLogger(__name__)
 
 
+@overload
+def read_table(
+    *,
+    book: "Workbook",
+    table_name: str,
+    columns: List[str] | None = None,
+    ci: bool | Literal["warn"] = False,
+    catalog: "TableCatalog | None" = None,
+    row_views: Literal[False] = False,
+    raw_dates: bool = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator[Dict[str, Any], None, None]: ...
+
+
+@overload
+def read_table(
+    *,
+    book: "Workbook",
+    table_name: str,
+    columns: List[str] | None = None,
+    ci: bool | Literal["warn"] = False,
+    catalog: "TableCatalog | None" = None,
+    row_views: Literal[True],
+    raw_dates: bool = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator["RowView[Any]", None, None]: ...
+
+
 def read_table(
     *,
     book: "Workbook",
@@ -26,7 +84,11 @@ def read_table(
     ci: (
         bool | Literal["warn"]
     ) = False,  # TODO: Make this required in the next major version.
-) -> Generator[Dict[str, Any], None, None]:
+    catalog: "TableCatalog | None" = None,
+    row_views: bool = False,
+    raw_dates: bool = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator[Dict[str, Any] | "RowView[Any]", None, None]:
     """
     Read a table from a workbook and yield its rows as dictionaries.
 
@@ -39,20 +101,94 @@ def read_table(
         ci:
             Whether the table name lookup should be case-insensitive.
             When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+        row_views:
+            Whether to yield lightweight, read-only `RowView` objects instead of case-insensitive ordered dictionaries.
+            This uses much less memory and time for large tables. Use `RowView.to_dict` to get a dictionary.
+        raw_dates:
+            Whether to return date-formatted values as Excel serial numbers instead of dates.
+            In read-only mode, this avoids creating a date object for every cell.
+            Use `find_date_columns` and `serials_to_datetimes` to convert the date columns in bulk.
+        diagnostics:
+            Optional collector of the issues found in the cells, e.g. carriage returns.
+            If not given, a warning is logged for every cell with an issue.
 
     Returns:
         A generator of dictionaries mapping column names to cell values for
-        each non-header row in the table.
+        each non-header row in the table, including the empty rows.
     """
-    sheet, table_range = find_table(book=book, name=table_name, ci=ci)
-    return data_to_dicts(
-        data=sheet[table_range],
-        columns=columns,
-        value_callback=get_cell_value,
-        header_callback=get_cell_value_as_str,
+    sheet, table_range = find_table(book=book, name=table_name, ci=ci, catalog=catalog)
+    return values_to_rows(
+        data=read_table_values(
+            sheet=sheet,
+            table_range=table_range,
+            columns=columns,
+            raw_dates=raw_dates,
+            diagnostics=diagnostics,
+            table_name=table_name,
+        ),
+        columns=None,
+        row_views=row_views,
     )
 
 
+def read_table_batches(
+    *,
+    book: "Workbook",
+    table_name: str,
+    batch_size: int,
+    columns: List[str] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+) -> Generator[Tuple[Tuple[str, ...], List[Tuple[Any, ...]]], None, None]:
+    """
+    Read a table from a workbook in blocks of rows, e.g. for inserting them into a database with `executemany`.
+
+    This yields the same rows as `read_table` does, but does not build a mapping for each row.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the table.
+        table_name: The name of the table (ListObject or named range) to read.
+        batch_size: The maximum number of rows in each block.
+        columns:
+            Optional list of column names to extract.
+            If not given, all columns are extracted.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+
+    Returns:
+        A generator of tuples like (header, rows), where `header` is the same tuple of column names for every block,
+        and `rows` is a list of at most `batch_size` tuples of values, in the order of `header`.
+    """
+    if batch_size < 1:
+        raise ValueError(f"The batch size must be at least 1, not {batch_size}.")
+
+    sheet, table_range = find_table(book=book, name=table_name, ci=ci, catalog=catalog)
+    it = read_table_values(sheet=sheet, table_range=table_range, columns=columns)
+    index, picks = HeaderIndex.create(header=[str(v) for v in next(it)], columns=None)
+    header = index.keys
+
+    batch: List[Tuple[Any, ...]] = []
+    for row in it:
+        if picks is not None:
+            # Drop the columns with duplicate names, like `read_table` does.
+            row = tuple([row[i] for i in picks])
+
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield header, batch
+            batch = []
+
+    if batch:
+        yield header, batch
+
+
 def read_dict_table(
     *,
     book: "Workbook",
@@ -62,6 +198,7 @@ def read_dict_table(
     ci: (
         bool | Literal["warn"]
     ) = False,  # TODO: Make this required in the next major version.
+    catalog: "TableCatalog | None" = None,
 ) -> Dict[str, Any]:
     """
     Read a two-column table from a workbook and return it as a dictionary.
@@ -74,6 +211,9 @@ def read_dict_table(
         ci:
             Whether the table name lookup should be case-insensitive.
             When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
 
     Returns:
         A dictionary that maps each value from `key_column` in the specified table
@@ -84,15 +224,186 @@ def read_dict_table(
         table_name=table_name,
         columns=[key_column, value_column],
         ci=ci,
+        catalog=catalog,
+        row_views=True,
     )
     return {row[key_column]: row[value_column] for row in data}
 
 
+@overload
+def read_tables(
+    *,
+    book: "Workbook",
+    table_names: Sequence[str],
+    columns: Mapping[str, List[str]] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+    row_views: Literal[False] = False,
+) -> Dict[str, List[OrderedDict[str, Any]]]: ...
+
+
+@overload
+def read_tables(
+    *,
+    book: "Workbook",
+    table_names: Sequence[str],
+    columns: Mapping[str, List[str]] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+    row_views: Literal[True],
+) -> Dict[str, List["RowView[Any]"]]: ...
+
+
+def read_tables(
+    *,
+    book: "Workbook",
+    table_names: Sequence[str],
+    columns: Mapping[str, List[str]] | None = None,
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+    row_views: bool = False,
+) -> Dict[str, List[Any]]:
+    """
+    Read multiple tables from a workbook at once.
+
+    The result is the same as calling `read_table` for each name, but in read-only mode, each sheet is streamed only
+    once, no matter how many of the requested tables it contains. With `read_table`, every table access streams the
+    sheet from the first row again.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the tables.
+        table_names: The names of the tables (ListObjects or named ranges) to read.
+        columns:
+            Optional mapping from table name to the list of column names to extract from that table.
+            For tables not in the mapping, all columns are extracted.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+        row_views:
+            Whether to return lightweight, read-only `RowView` objects instead of case-insensitive ordered dictionaries.
+            This uses much less memory and time for large tables. Use `RowView.to_dict` to get a dictionary.
+
+    Returns:
+        A dictionary mapping each table name (as given) to a list of rows, like those yielded by `read_table`.
+    """
+    values = read_tables_values(
+        book=book, table_names=table_names, ci=ci, catalog=catalog
+    )
+
+    return {
+        name: list(
+            values_to_rows(
+                data=table_values,
+                columns=(columns or {}).get(name),
+                row_views=row_views,
+            )
+        )
+        for name, table_values in values.items()
+    }
+
+
+def read_tables_values(
+    *,
+    book: "Workbook",
+    table_names: Sequence[str],
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+) -> Dict[str, List[Sequence[Any]]]:
+    """
+    Read the raw values of multiple tables, like `read_table_values` does, streaming each read-only sheet only once.
+
+    See `read_tables`.
+
+    Returns:
+        A dictionary mapping each table name (as given) to the rows of the table, including the header row.
+    """
+    from openpyxl.utils import range_boundaries
+
+    # Find all the tables before reading anything, so that a missing table fails fast. Each name is read only once,
+    # even if it is requested more than once.
+    found = [
+        (name, *find_table(book=book, name=name, ci=ci, catalog=catalog))
+        for name in dict.fromkeys(table_names)
+    ]
+
+    values: Dict[str, List[Sequence[Any]]] = {name: [] for name, _, _ in found}
+
+    # Group the tables on read-only sheets by sheet, and stream each sheet once over the union of the table windows.
+    by_sheet: Dict[str, List[Tuple[str, int, int, int, int]]] = {}
+    sheets: Dict[str, "Worksheet"] = {}
+    for name, sheet, table_range in found:
+        if not is_read_only_sheet(sheet):
+            # Normal worksheets support random access, and reading the union of the table windows would create cells
+            # in between the tables.
+            values[name] = list(read_table_values(sheet=sheet, table_range=table_range))
+            continue
+
+        min_col, min_row, max_col, max_row = range_boundaries(table_range)
+        by_sheet.setdefault(sheet.title, []).append(
+            (name, min_col, min_row, max_col, max_row)
+        )
+        sheets[sheet.title] = sheet
+
+    for title, windows in by_sheet.items():
+        sheet_min_col = min(w[1] for w in windows)
+        sheet_min_row = min(w[2] for w in windows)
+        sheet_max_col = max(w[3] for w in windows)
+        sheet_max_row = max(w[4] for w in windows)
+
+        for i_row, row in enumerate(
+            sheets[title].iter_rows(
+                min_row=sheet_min_row,
+                max_row=sheet_max_row,
+                min_col=sheet_min_col,
+                max_col=sheet_max_col,
+                values_only=True,
+            ),
+            start=sheet_min_row,
+        ):
+            row = fix_row_values(row=row, row_number=i_row, min_col=sheet_min_col)
+            for name, min_col, min_row, max_col, max_row in windows:
+                if min_row <= i_row <= max_row:
+                    values[name].append(
+                        row[min_col - sheet_min_col : max_col - sheet_min_col + 1]
+                    )
+
+    return values
+
+
+@overload
+def extract_data_from_numbered_tables(
+    book: "Workbook",
+    base_name: str,
+    columns: Optional[List[str]] = None,
+    catalog: "TableCatalog | None" = None,
+    row_views: Literal[False] = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator[OrderedDict[str, Any], None, None]: ...
+
+
+@overload
+def extract_data_from_numbered_tables(
+    book: "Workbook",
+    base_name: str,
+    columns: Optional[List[str]] = None,
+    catalog: "TableCatalog | None" = None,
+    *,
+    row_views: Literal[True],
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator["RowView[Any]", None, None]: ...
+
+
 def extract_data_from_numbered_tables(
     book: "Workbook",
     base_name: str,
     columns: Optional[List[str]] = None,
-) -> Generator[OrderedDict[str, Any], None, None]:
+    catalog: "TableCatalog | None" = None,
+    row_views: bool = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+) -> Generator[OrderedDict[str, Any] | "RowView[Any]", None, None]:
     """
     Stack multiple numbered tables in order, and extract data from all of them.
 
@@ -100,21 +411,264 @@ def extract_data_from_numbered_tables(
         book: The workbook, opened using openpyxl.
         base_name: See `get_numbered_tables`.
         columns: The columns to extract. If not given, all columns will be extracted.
+        catalog: Optional catalog of the tables in `book`, to avoid searching the whole workbook.
+        row_views: Whether to yield lightweight `RowView` objects instead of dictionaries. See `read_table`.
+        diagnostics: Optional collector of the issues found in the cells. See `read_table`.
 
     Returns:
         A generator of ordered, case-insensitive dictionaries.
     """
-    for name, cells in get_numbered_tables(book=book, base_name=base_name):
+    for name, sheet, table_range in find_numbered_tables(
+        book=book, base_name=base_name, catalog=catalog
+    ):
         yield from skip_empty_rows(
-            data_to_dicts(
-                data=cells,
-                columns=columns,
-                value_callback=get_cell_value,
-                header_callback=get_cell_value_as_str,
+            values_to_rows(
+                data=read_table_values(
+                    sheet=sheet,
+                    table_range=table_range,
+                    columns=columns,
+                    diagnostics=diagnostics,
+                    table_name=name,
+                ),
+                columns=None,
+                row_views=row_views,
             )
         )
 
 
+def values_to_rows(
+    *,
+    data: Iterable[Sequence[Any]],
+    columns: Optional[List[str]],
+    row_views: bool,
+) -> Generator[OrderedDict[str, Any] | "RowView[Any]", None, None]:
+    """
+    Convert the values of a table, as yielded by `read_table_values`, into dictionaries or row views.
+
+    Empty rows are kept, because `read_table` yields every row of the table.
+    """
+    if row_views:
+        return data_to_row_views(
+            data=data,
+            columns=columns,
+            header_callback=str,
+            skip_empty_rows=False,
+        )
+
+    return data_to_dicts(
+        data=data,
+        columns=columns,
+        value_callback=lambda value: value,
+        header_callback=str,
+        skip_empty_rows=False,
+    )
+
+
+def read_table_values(
+    *,
+    sheet: "Worksheet",
+    table_range: str,
+    columns: Optional[List[str]] = None,
+    raw_dates: bool = False,
+    diagnostics: "ReadDiagnostics | None" = None,
+    table_name: str = "",
+) -> Generator[Tuple[Any, ...], None, None]:
+    """
+    Iterate over the rows of values in a table, without creating any `Cell` objects in read-only mode.
+
+    The values are processed like `get_cell_value` does.
+
+    When `columns` is given, the header is read first to find the requested columns, and then only those columns are
+    read. In read-only mode, the rows are read between the first and last requested columns. In normal mode, only the
+    requested cells are accessed. Values in other columns are never processed.
+
+    Args:
+        sheet: The sheet containing the table.
+        table_range: The range of the table, e.g. `$B$2:$C$4`.
+        columns:
+            Optional list of column names to read, in the order in which they should be yielded.
+            If not given, all columns are read.
+        raw_dates: Whether to yield date-formatted values as Excel serial numbers. See `read_table`.
+        diagnostics: Optional collector of the issues found in the cells. See `read_table`.
+        table_name: The name of the table, for `diagnostics`. Defaults to the range.
+
+    Yields:
+        One tuple of values per row in the table, including the header row.
+        When `columns` is given, the header row consists of the given column names.
+
+    Raises:
+        KeyError: If any of the given columns are not in the header.
+    """
+    from openpyxl.utils import range_boundaries
+
+    min_col, min_row, max_col, max_row = range_boundaries(table_range)
+    table_name = table_name or table_range
+
+    if not columns:
+        for row_number, row in enumerate(
+            iter_range_values(
+                sheet=sheet, table_range=table_range, raw_dates=raw_dates
+            ),
+            start=min_row,
+        ):
+            yield fix_row_values(
+                row=row,
+                row_number=row_number,
+                min_col=min_col,
+                diagnostics=diagnostics,
+                table_name=table_name,
+            )
+        return
+
+    # Resolve the column names to sheet column numbers, using only the header row.
+    header = fix_row_values(
+        row=next(
+            iter_rows_values(
+                sheet=sheet,
+                min_row=min_row,
+                max_row=min_row,
+                min_col=min_col,
+                max_col=max_col,
+            )
+        ),
+        row_number=min_row,
+        min_col=min_col,
+        diagnostics=diagnostics,
+        table_name=table_name,
+    )
+    _, picks = HeaderIndex.create(header=[str(v) for v in header], columns=columns)
+    assert picks is not None
+    col_numbers = [min_col + i for i in picks]
+
+    yield tuple(columns)
+
+    if max_row <= min_row:
+        return
+
+    if is_read_only_sheet(sheet):
+        # Every pass over a read-only sheet parses it from the start, so read one window.
+        runs = [(min(col_numbers), max(col_numbers))]
+    else:
+        runs = contiguous_runs(col_numbers)
+
+    # Where each requested column ends up when the runs are concatenated.
+    offsets: Dict[int, int] = {}
+    for first, last in runs:
+        for c in range(first, last + 1):
+            offsets[c] = len(offsets)
+    positions = [offsets[c] for c in col_numbers]
+
+    run_rows = [
+        iter_rows_values(
+            sheet=sheet,
+            min_row=min_row + 1,
+            max_row=max_row,
+            min_col=first,
+            max_col=last,
+            raw_dates=raw_dates,
+        )
+        for first, last in runs
+    ]
+    rows = run_rows[0] if len(run_rows) == 1 else map(concat_tuples, *run_rows)
+
+    for row_number, row in enumerate(rows, start=min_row + 1):
+        yield fix_row_values(
+            row=tuple([row[i] for i in positions]),
+            row_number=row_number,
+            min_col=min_col,
+            col_numbers=col_numbers,
+            diagnostics=diagnostics,
+            table_name=table_name,
+        )
+
+
+def contiguous_runs(col_numbers: Iterable[int]) -> List[Tuple[int, int]]:
+    """
+    Group column numbers into runs of adjacent columns.
+
+    Examples:
+        >>> contiguous_runs([5, 1, 2, 3, 9, 5])
+        [(1, 3), (5, 5), (9, 9)]
+
+        >>> contiguous_runs([])
+        []
+    """
+    runs: List[Tuple[int, int]] = []
+    for c in sorted(set(col_numbers)):
+        if runs and runs[-1][1] == c - 1:
+            runs[-1] = (runs[-1][0], c)
+        else:
+            runs.append((c, c))
+    return runs
+
+
+def concat_tuples(*parts: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return sum(parts, ())
+
+
+def fix_row_values(
+    *,
+    row: Tuple[Any, ...],
+    row_number: int,
+    min_col: int,
+    col_numbers: Optional[Sequence[int]] = None,
+    diagnostics: "ReadDiagnostics | None" = None,
+    table_name: str = "",
+) -> Tuple[Any, ...]:
+    """
+    Process a row of values like `get_cell_value` does.
+
+    The cell coordinate is only computed when a warning is emitted.
+
+    Args:
+        row: The values in the row.
+        row_number: The number of the row in the sheet (1=1).
+        min_col: The number of the column of the first value (1=A).
+        col_numbers:
+            The number of the column of each value, if the values are not from adjacent columns.
+            When given, `min_col` is ignored.
+        diagnostics:
+            Optional collector of the issues found. If not given, a warning is logged for every cell with an issue.
+        table_name: The name of the table, for `diagnostics`.
+
+    Returns:
+        The given row if nothing had to be changed, otherwise a new tuple.
+    """
+    for value in row:
+        if isinstance(value, str) and "_x" in value:
+            break
+    else:
+        return row
+
+    fixed: Optional[List[Any]] = None
+    for i, value in enumerate(row):
+        if not (isinstance(value, str) and "_x" in value):
+            continue
+
+        decoded, carriage_returns = decode_escapes(value)
+        if decoded is value:
+            continue
+
+        if fixed is None:
+            fixed = list(row)
+        fixed[i] = decoded
+
+        if carriage_returns:
+            column = col_numbers[i] if col_numbers else min_col + i
+            if diagnostics is None:
+                from openpyxl.utils import get_column_letter
+
+                warn_carriage_returns(
+                    coordinate=f"{get_column_letter(column)}{row_number}"
+                )
+            else:
+                diagnostics.add_carriage_return(
+                    table_name=table_name, column=column, row=row_number
+                )
+
+    return row if fixed is None else tuple(fixed)
+
+
 def get_cell_value_as_str(cell: "Cell") -> Any:
     return str(get_cell_value(cell))
 
@@ -122,33 +676,81 @@ def get_cell_value_as_str(cell: "Cell") -> Any:
 def get_cell_value(cell: "Cell") -> Any:
     value = cell.value
 
+    if isinstance(value, str) and "_x" in value:
+        value, carriage_returns = decode_escapes(value)
+        if carriage_returns:
+            warn_carriage_returns(coordinate=cell.coordinate)
+
+    return value
+
+
+_ESCAPE = re.compile(r"_x([0-9A-Fa-f]{4})_(\n?)")
+
+
+def decode_escapes(value: str) -> Tuple[str, int]:
+    r"""
+    Decode the `_xHHHH_` escapes that Excel uses for special characters, in a single pass.
+
+    An escaped carriage return followed by a newline is replaced by just the newline. This is unsafe, so the number of
+    such replacements is returned too.
+
+    Returns:
+        A tuple like (decoded string, number of carriage returns replaced). The decoded string is the given string if
+        there were no escapes.
+
+    Examples:
+        >>> decode_escapes("one_x000D_\ntwo_x000d_\nthree")
+        ('one\ntwo\nthree', 2)
+
+        >>> decode_escapes("tab_x0009_and_x005F_x0041_")
+        ('tab\tand_x0041_', 0)
+
+        >>> decode_escapes("max_x")
+        ('max_x', 0)
+    """
     # Workaround for:
     # - https://github.com/AutoActuary/aa-py-autory-normalize/issues/4
     # - https://foss.heptapod.net/openpyxl/openpyxl/-/issues/1410
     # - https://foss.heptapod.net/openpyxl/openpyxl/-/issues/1975
-    if isinstance(value, str) and "_x000D_\n" in value:
-        value = value.replace("_x000D_\n", "\n")
-
-        # Emit a warning, because the replacement is unsafe. The user should fix the Excel file.
-        logger.warning(
-            f"Cell {cell.coordinate} contains a carriage return. "
-            f"This is not supported. Please replace the carriage return with a newline."
-        )
-
-    return value
+    carriage_returns = 0
+
+    def replace(match: "re.Match[str]") -> str:
+        nonlocal carriage_returns
+        char = chr(int(match.group(1), 16))
+        if char == "\r" and match.group(2):
+            carriage_returns += 1
+            return "\n"
+        return char + match.group(2)
+
+    decoded, n = _ESCAPE.subn(replace, value)
+    if n == 0:
+        return value, 0
+    return decoded, carriage_returns
+
+
+def warn_carriage_returns(*, coordinate: str) -> None:
+    # Emit a warning, because the replacement is unsafe. The user should fix the Excel file.
+    logger.warning(
+        f"Cell {coordinate} contains a carriage return. "
+        f"This is not supported. Please replace the carriage return with a newline."
+    )
 
 
 def get_numbered_tables(
     book: "Workbook",
     base_name: str,
+    catalog: "TableCatalog | None" = None,
 ) -> List[Tuple[str, "TableCells"]]:
     """
     Get a list of all tables that match ``name123`` where name is the given base name and 123 is any integer.
     The list is sorted in ascending numerical order.
 
+    This loads the cells of all the matching tables at once. Use `iter_numbered_tables` to load them one at a time.
+
     Args:
         book: The Excel workbook, opened by xlwings.
         base_name: The table base name.
+        catalog: Optional catalog of the tables in `book`, to avoid searching the whole workbook.
 
     Returns:
         List of tables.
@@ -158,33 +760,82 @@ def get_numbered_tables(
         get_numbered_tables(book, "MyTable")
         ["MyTable", "MyTable3", "MyTable15"]
     """
-    re_name = re.escape(base_name.casefold())
-    pattern = re.compile(rf"^{re_name}(\d+)?$")
+    return list(iter_numbered_tables(book=book, base_name=base_name, catalog=catalog))
 
-    def gen() -> Generator[Tuple[int, str, "TableCells"], None, None]:
-        lo_names_and_cells = (
-            (table.name, sheet[table.ref])
-            for sheet, table in iter_list_object_tables(
-                book=book, exclude_list_objects=[], exclude_sheets=[]
-            )
-        )
 
-        nr_names_and_cells = (
-            (table_name, sheet[table_range])
-            for sheet, table_name, table_range in iter_named_range_tables(
-                book=book, exclude_names=[], exclude_sheets=[]
-            )
-        )
+def iter_numbered_tables(
+    book: "Workbook",
+    base_name: str,
+    catalog: "TableCatalog | None" = None,
+) -> Generator[Tuple[str, "TableCells"], None, None]:
+    """
+    Like `get_numbered_tables`, but load the cells of each table only when it is reached.
 
-        for name, cells in chain(
-            lo_names_and_cells,
-            nr_names_and_cells,
-        ):
-            match = pattern.fullmatch(name.casefold())
-            if match:
-                num = int(match.group(1) or "-1")
-                yield num, name, cells
+    The matching tables are found and sorted using only their names, before any cells are loaded.
+    """
+    for name, sheet, table_range in find_numbered_tables(
+        book=book, base_name=base_name, catalog=catalog
+    ):
+        yield name, get_range_cells(sheet=sheet, table_range=table_range)
+
+
+def find_numbered_tables(
+    book: "Workbook",
+    base_name: str,
+    catalog: "TableCatalog | None" = None,
+) -> List[Tuple[str, "Worksheet", str]]:
+    """
+    Like `get_numbered_tables`, but return the location of each table instead of its cells.
 
-    tables = sorted(list(gen()))
+    Names are matched before anything else is looked at, so the ranges and sheets of other tables are never parsed or
+    loaded.
+
+    Returns:
+        List of tuples like (name, sheet, range), sorted in ascending numerical order.
+    """
+    re_name = re.escape(base_name.casefold())
+    pattern = re.compile(rf"^{re_name}(\d+)?$")
 
-    return [(name, cells) for i, name, cells in tables]
+    def get_number(name: str) -> Optional[int]:
+        match = pattern.fullmatch(name.casefold())
+        if match is None:
+            return None
+        return int(match.group(1) or "-1")
+
+    def gen() -> Generator[Tuple[int, str, "Worksheet", str], None, None]:
+        if catalog is not None:
+            for entry in chain(
+                catalog.iter_list_object_entries(
+                    exclude_list_objects=[], exclude_sheets=[]
+                ),
+                catalog.iter_named_range_entries(exclude_names=[], exclude_sheets=[]),
+            ):
+                num = get_number(entry.name)
+                if num is not None:
+                    yield num, entry.name, entry.sheet, entry.table_range
+            return
+
+        for sheet in book.worksheets:
+            for table in get_list_objects(sheet).values():
+                num = get_number(table.name)
+                if num is not None and is_table_range(table.ref):
+                    yield num, table.name, sheet, table.ref
+
+        defined_name: "DefinedName"
+        for defined_name in book.defined_names.values():
+            num = get_number(defined_name.name)
+            if num is None:
+                continue
+
+            try:
+                destinations = list(defined_name.destinations)
+            except AttributeError:
+                continue
+
+            for sheet_name, table_range in destinations:
+                if is_table_range(table_range):
+                    yield num, defined_name.name, book[sheet_name], table_range
+
+    tables = sorted(gen(), key=lambda t: (t[0], t[1]))
+
+    return [(name, sheet, table_range) for i, name, sheet, table_range in tables]
@@ -3,7 +3,10 @@ from typing import Tuple, TYPE_CHECKING, Literal
 
 from pydicti import dicti
 
+from ._table_parts import get_list_objects
+
 if TYPE_CHECKING:
+    from ._catalog import TableCatalog
     from openpyxl import Workbook
     from openpyxl.workbook.defined_name import DefinedName
     from openpyxl.worksheet.table import Table
@@ -20,6 +23,7 @@ def find_table(
     ci: (
         bool | Literal["warn"]
     ) = False,  # TODO: Make this required in the next major version.
+    catalog: "TableCatalog | None" = None,
 ) -> Tuple["Worksheet", str]:
     """
     Find a table in the given workbook. The table can be a named range or a ListObject.
@@ -30,10 +34,17 @@ def find_table(
         ci:
             Whether the table name lookup should be case-insensitive.
             When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when looking up many tables in the same workbook, to avoid searching the whole workbook each time.
 
     Returns:
         A tuple of (sheet, range).
     """
+    if catalog is not None:
+        entry = catalog.find(name=name, ci=ci)
+        return entry.sheet, entry.table_range
+
     try:
         sheet, table_range = find_named_range_by_name(book=book, name=name, ci=ci)
         table_type = "Named range"
@@ -125,11 +136,12 @@ def find_list_object_by_name(
     """
     sheet: "Worksheet"
     for sheet in book.worksheets:
-        sheet_tables = dicti(sheet.tables) if ci else sheet.tables
+        tables = get_list_objects(sheet)
+        sheet_tables = dicti(tables) if ci else tables
         if name in sheet_tables:
             if ci == "warn":
                 # Check for case mismatch
-                original_name = dicti((k, k) for k in sheet.tables.keys())[name]
+                original_name = dicti((k, k) for k in tables.keys())[name]
                 if original_name != name:
                     logger.warning(
                         f"Table with exact name `{name}` not found. Using case-insensitive match `{original_name}` instead."
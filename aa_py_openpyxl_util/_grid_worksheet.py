@@ -0,0 +1,114 @@
+"""
+A read-only worksheet backed by values that were parsed ahead of time.
+
+This module imports openpyxl at the top level, so only import it lazily.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Generator, List, Optional, Tuple, TYPE_CHECKING
+
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
+ValueGrid = Dict[int, Tuple[int, Tuple[Any, ...]]]
+"""
+The values of a worksheet, keyed by row number. Each row is stored as a tuple like (first column number, values), where
+the values run from the first to the last non-empty cell in the row. Empty rows are left out.
+"""
+
+
+class GridWorksheet(ReadOnlyWorksheet):  # type: ignore[misc]
+    """
+    A read-only worksheet whose values have already been parsed into a `ValueGrid`.
+
+    Iterating over values, e.g. with `iter_rows(values_only=True)`, uses the grid. Iterating over cells streams the
+    worksheet from the archive, like `ReadOnlyWorksheet` does.
+    """
+
+    def __init__(
+        self,
+        parent_workbook: "Workbook",
+        title: str,
+        worksheet_path: str,
+        shared_strings: List[str],
+        *,
+        grid: ValueGrid,
+    ):
+        super().__init__(parent_workbook, title, worksheet_path, shared_strings)
+        self._grid = grid
+
+    def _cells_by_row(
+        self,
+        min_col: int,
+        min_row: int,
+        max_col: Optional[int],
+        max_row: Optional[int],
+        values_only: bool = False,
+    ) -> Generator[Tuple[Any, ...], None, None]:
+        if not values_only:
+            yield from super()._cells_by_row(
+                min_col, min_row, max_col, max_row, values_only
+            )
+            return
+
+        grid = self._grid
+        max_col = max_col or self.max_column or grid_max_col(grid)
+        max_row = max_row or self.max_row or max(grid, default=0)
+        empty_row = (None,) * (max_col + 1 - min_col)
+
+        for row_number in range(min_row, max_row + 1):
+            entry = grid.get(row_number)
+            if entry is None:
+                yield empty_row
+            else:
+                yield window(*entry, min_col=min_col, max_col=max_col)
+
+
+def grid_max_col(grid: ValueGrid) -> int:
+    """
+    Examples:
+        >>> grid_max_col({1: (2, ("b", "c")), 3: (1, ("a",))})
+        3
+
+        >>> grid_max_col({})
+        1
+    """
+    return max((first + len(values) - 1 for first, values in grid.values()), default=1)
+
+
+def window(
+    first: int,
+    values: Tuple[Any, ...],
+    *,
+    min_col: int,
+    max_col: int,
+) -> Tuple[Any, ...]:
+    """
+    Get the values from `min_col` to `max_col` of a row stored as (first column number, values).
+
+    Examples:
+        >>> window(3, ("c", "d"), min_col=1, max_col=5)
+        (None, None, 'c', 'd', None)
+
+        >>> window(3, ("c", "d"), min_col=4, max_col=4)
+        ('d',)
+
+        >>> window(3, ("c", "d"), min_col=5, max_col=6)
+        (None, None)
+    """
+    lo = max(min_col, first)
+    hi = min(max_col, first + len(values) - 1)
+    if lo > hi:
+        return (None,) * (max_col + 1 - min_col)
+
+    if lo == min_col and hi == max_col and len(values) == hi - lo + 1:
+        return values
+
+    return (
+        (None,) * (lo - min_col)
+        + values[lo - first : hi - first + 1]
+        + (None,) * (max_col - hi)
+    )
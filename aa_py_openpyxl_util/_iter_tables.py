@@ -1,5 +1,7 @@
 from typing import Collection, Generator, Tuple, Pattern, Union, TYPE_CHECKING
 
+from ._table_parts import get_list_objects
+
 if TYPE_CHECKING:
     from openpyxl import Workbook
     from openpyxl.workbook.defined_name import DefinedName
@@ -70,11 +72,12 @@ def iter_list_object_tables(
         if any_match(exclude_sheets, sheet.title):
             continue
 
-        for table_name in sheet.tables.keys():
+        tables = get_list_objects(sheet)
+        for table_name in tables.keys():
             if any_match(exclude_list_objects, table_name):
                 continue
 
-            table = sheet.tables[table_name]
+            table = tables[table_name]
             if not is_table_range(table.ref):
                 continue
 
@@ -0,0 +1,215 @@
+"""
+Utilities for parsing the worksheets of one large workbook in parallel.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+)
+
+from ._context import safe_load_workbook
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from zipfile import ZipFile
+    from openpyxl import Workbook
+    from ._grid_worksheet import ValueGrid
+
+
+@contextmanager
+def safe_load_workbook_parallel(
+    *,
+    path: Path,
+    data_only: bool,
+    workers: Optional[int] = None,
+    max_memory: Optional[int] = None,
+) -> Generator["Workbook", None, None]:
+    """
+    Open a workbook in read-only mode, and parse its worksheets into value grids using a pool of worker processes.
+    Make sure the file handle is closed afterward.
+
+    openpyxl parses the sheets of a workbook one after another. For large workbooks with many sheets, this does the
+    parsing in parallel instead. Each worker process parses whole worksheets into compact grids of values, which are
+    then attached to the read-only worksheets of the workbook. Reading values from these worksheets, e.g. with
+    `read_table`, `read_tables` or `extract_data_from_numbered_tables`, uses the grids instead of parsing the sheets
+    again. Reading cells (not values) still streams from the archive, like for any read-only worksheet.
+
+    This is a context manager.
+
+    Args:
+        path: The path to the workbook on the disk.
+        data_only: https://openpyxl.readthedocs.io/en/stable/api/openpyxl.workbook.workbook.html?highlight=data_only#openpyxl.workbook.workbook.Workbook.data_only
+        workers: The number of worker processes. Defaults to the number of CPUs.
+        max_memory:
+            Optional limit on the memory used by the grids, in bytes.
+            This is estimated from the uncompressed size of the worksheet parts, which is larger than the grids.
+            The largest sheets that fit within the limit are parsed into grids. The other sheets are streamed from the
+            archive as usual.
+
+    Yields:
+        The workbook.
+    """
+    with safe_load_workbook(path=path, read_only=True, data_only=data_only) as book:
+        attach_value_grids(book=book, path=path, workers=workers, max_memory=max_memory)
+        yield book
+
+
+def attach_value_grids(
+    *,
+    book: "Workbook",
+    path: Path,
+    workers: Optional[int],
+    max_memory: Optional[int],
+) -> None:
+    """
+    Parse the read-only worksheets of a workbook in worker processes, and replace them with `GridWorksheet` objects.
+    See `safe_load_workbook_parallel`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_all_start_methods, get_context
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+    from ._grid_worksheet import GridWorksheet
+
+    # noinspection PyProtectedMember
+    archive: "ZipFile" = book._archive
+
+    # Parse the largest sheets first, so that the workers finish at about the same time.
+    sizes = {
+        sheet.title: archive.getinfo(sheet._worksheet_path).file_size
+        for sheet in book.worksheets
+        if type(sheet) is ReadOnlyWorksheet
+    }
+    titles = sorted(sizes, key=sizes.__getitem__, reverse=True)
+    if max_memory is not None:
+        titles = list(_fit(titles, sizes=sizes, budget=max_memory))
+
+    if not titles:
+        return
+
+    # Don't fork this process, because the workers would inherit the open handle of the archive.
+    start_method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+
+    # noinspection PyProtectedMember
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context(start_method),
+        initializer=_init_worker,
+        initargs=(path, book.data_only, book.epoch, set(book._date_formats)),
+    ) as executor:
+        grids = executor.map(
+            parse_value_grid,
+            [book[title]._worksheet_path for title in titles],
+        )
+        for title, grid in zip(titles, grids):
+            sheet = book[title]
+            grid_sheet = GridWorksheet(
+                book, title, sheet._worksheet_path, sheet._shared_strings, grid=grid
+            )
+            grid_sheet.sheet_state = sheet.sheet_state
+            grid_sheet.tables = sheet.tables
+            # noinspection PyProtectedMember
+            book._sheets[book._sheets.index(sheet)] = grid_sheet
+
+
+def _fit(
+    titles: Iterable[str],
+    *,
+    sizes: Dict[str, int],
+    budget: int,
+) -> Generator[str, None, None]:
+    """
+    Select the titles of the sheets that fit within the budget, largest first.
+
+    Examples:
+        >>> list(_fit(["a", "b", "c"], sizes={"a": 5, "b": 4, "c": 1}, budget=6))
+        ['a', 'c']
+    """
+    for title in titles:
+        if sizes[title] <= budget:
+            budget -= sizes[title]
+            yield title
+
+
+class _Worker:
+    """
+    The state of a worker process, set up once by `_init_worker`.
+    """
+
+    path: Path
+    shared_strings: List[str]
+    data_only: bool
+    epoch: "datetime"
+    date_formats: Set[int]
+
+
+def _init_worker(
+    path: Path,
+    data_only: bool,
+    epoch: "datetime",
+    date_formats: Set[int],
+) -> None:
+    """
+    Read the shared strings once per worker process.
+    """
+    from zipfile import ZipFile
+    from openpyxl.packaging.manifest import Manifest
+    from openpyxl.reader.strings import read_string_table
+    from openpyxl.xml.constants import ARC_CONTENT_TYPES, SHARED_STRINGS
+    from openpyxl.xml.functions import fromstring
+
+    _Worker.path = path
+    _Worker.data_only = data_only
+    _Worker.epoch = epoch
+    _Worker.date_formats = date_formats
+
+    with ZipFile(path) as archive:
+        manifest = Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+        ct = manifest.find(SHARED_STRINGS)
+        if ct is None:
+            _Worker.shared_strings = []
+        else:
+            with archive.open(ct.PartName[1:]) as src:
+                _Worker.shared_strings = read_string_table(src)
+
+
+def parse_value_grid(worksheet_path: str) -> "ValueGrid":
+    """
+    Parse a worksheet part into a `ValueGrid`. This runs in a worker process, after `_init_worker`.
+
+    The archive is opened for each worksheet, so that no file handle is left open in the worker processes.
+    """
+    from zipfile import ZipFile
+    from openpyxl.worksheet._reader import WorkSheetParser
+
+    grid: "ValueGrid" = {}
+    with ZipFile(_Worker.path) as archive, archive.open(worksheet_path) as src:
+        parser = WorkSheetParser(
+            src,
+            _Worker.shared_strings,
+            data_only=_Worker.data_only,
+            epoch=_Worker.epoch,
+            date_formats=_Worker.date_formats,
+        )
+        for row_number, cells in parser.parse():
+            cells = [cell for cell in cells if cell["value"] is not None]
+            if not cells:
+                continue
+
+            first = cells[0]["column"]
+            values: List[Any] = [None] * (cells[-1]["column"] - first + 1)
+            for cell in cells:
+                values[cell["column"] - first] = cell["value"]
+            grid[row_number] = (first, tuple(values))
+
+    return grid
@@ -0,0 +1,157 @@
+"""
+Utilities for loading only the parts of a workbook that contain the tables you need.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Collection, Generator, List, Set, TYPE_CHECKING
+
+from ._table_parts import get_list_objects, read_table_parts
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.reader.excel import ExcelReader
+
+
+@contextmanager
+def safe_load_workbook_for_tables(
+    *,
+    path: Path,
+    table_names: Collection[str] | Callable[[str], bool],
+    data_only: bool,
+) -> Generator["Workbook", None, None]:
+    """
+    Open a workbook with openpyxl, but only parse the worksheets that contain the given tables.
+    Make sure the file handle is closed afterward.
+
+    The workbook part, the defined names and the table parts are read first, to find out which sheets contain the
+    tables. Only those sheets are parsed into normal worksheets. All other sheets are left as read-only worksheets,
+    which are streamed from the archive only if and when they are accessed.
+
+    The tables can then be read with `read_table`, `read_dict_table`, etc. as usual. Don't save the workbook, because
+    the read-only worksheets can't be written.
+
+    This is a context manager.
+
+    Args:
+        path: The path to the workbook on the disk.
+        table_names:
+            The names of the tables (named ranges or ListObjects) to load, matched case-insensitively.
+            Alternatively, a callback which receives each table name and returns whether that table is needed.
+        data_only: https://openpyxl.readthedocs.io/en/stable/api/openpyxl.workbook.workbook.html?highlight=data_only#openpyxl.workbook.workbook.Workbook.data_only
+
+    Yields:
+        The workbook.
+    """
+    if callable(table_names):
+        is_needed = table_names
+    else:
+        folded = {name.casefold() for name in table_names}
+
+        def is_needed(name: str) -> bool:
+            return name.casefold() in folded
+
+    book = load_partial_workbook(path=path, is_needed=is_needed, data_only=data_only)
+    try:
+        yield book
+    finally:
+        book.close()
+
+
+def load_partial_workbook(
+    *,
+    path: Path,
+    is_needed: Callable[[str], bool],
+    data_only: bool,
+) -> "Workbook":
+    """
+    See `safe_load_workbook_for_tables`. The caller must close the returned workbook.
+    """
+    from openpyxl.reader.excel import ExcelReader
+    from openpyxl.styles.stylesheet import apply_stylesheet
+
+    reader = ExcelReader(path, read_only=False, data_only=data_only)
+    try:
+        reader.read_manifest()
+        reader.read_strings()
+        reader.read_workbook()
+        reader.read_properties()
+        reader.read_custom()
+        reader.read_theme()
+        apply_stylesheet(reader.archive, reader.wb)
+
+        # The read-only worksheets are streamed from the archive, so keep it open until the workbook is closed.
+        reader.wb._archive = reader.archive
+
+        read_needed_worksheets(
+            reader=reader,
+            needed_sheets=find_needed_sheets(reader=reader, is_needed=is_needed),
+        )
+        reader.parser.assign_names()
+    except BaseException:
+        reader.archive.close()
+        raise
+
+    book: "Workbook" = reader.wb
+    return book
+
+
+def find_needed_sheets(
+    *,
+    reader: "ExcelReader",
+    is_needed: Callable[[str], bool],
+) -> Set[str]:
+    """
+    Find the names of the sheets containing the needed tables, using only the defined names and the table parts.
+    """
+    needed: Set[str] = set()
+
+    # Both workbook-scoped and sheet-scoped names are listed here, before `assign_names` sorts them out.
+    for defined_name in reader.parser.defined_names.definedName:
+        if not is_needed(defined_name.name):
+            continue
+        try:
+            needed.update(sheet_name for sheet_name, _ in defined_name.destinations)
+        except AttributeError:
+            continue
+
+    for sheet, rel in reader.parser.find_sheets():
+        if rel.target not in reader.valid_files:
+            continue
+        if any(
+            is_needed(table.name)
+            for table in read_table_parts(
+                archive=reader.archive, worksheet_path=rel.target
+            )
+        ):
+            needed.add(sheet.name)
+
+    return needed
+
+
+def read_needed_worksheets(
+    *,
+    reader: "ExcelReader",
+    needed_sheets: Set[str],
+) -> None:
+    """
+    Read the worksheets like `ExcelReader.read_worksheets` does, but only parse the needed sheets. The other sheets
+    become read-only worksheets, with their ListObjects attached.
+    """
+    all_sheets: List[object] = list(reader.parser.sheets)
+    try:
+        for sheet, _ in list(reader.parser.find_sheets()):
+            # Let openpyxl read one sheet at a time, in workbook order, in read-only mode for the sheets we don't need.
+            reader.parser.sheets = [sheet]
+            reader.read_only = sheet.name not in needed_sheets
+            reader.read_worksheets()
+
+            if reader.read_only:
+                # openpyxl expects every sheet to have `tables` when it checks for duplicate names in later sheets.
+                for ws in reader.wb._sheets:
+                    get_list_objects(ws)
+    finally:
+        reader.parser.sheets = all_sheets
+        reader.read_only = False
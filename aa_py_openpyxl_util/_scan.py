@@ -0,0 +1,347 @@
+"""
+Utilities for listing the tables in a workbook without loading it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from ._catalog import TableType, _parse_boundaries
+from ._extract import fix_row_values
+from ._table_parts import read_table_parts
+
+if TYPE_CHECKING:
+    from zipfile import ZipFile
+
+
+@dataclass(frozen=True)
+class ScannedTable:
+    """
+    A named range destination or a ListObject, as found by `scan_workbook`.
+    """
+
+    name: str
+    """
+    The name of the table, in its original case.
+    """
+
+    table_type: TableType
+    """
+    Whether this is a named range or a ListObject.
+    """
+
+    sheet_name: str
+    """
+    The name of the sheet on which the table lives.
+    """
+
+    table_range: str
+    """
+    The range of the table, as written in the workbook, e.g. `$B$2:$C$4` or `E2:F3`.
+    """
+
+    boundaries: Tuple[int, int, int, int]
+    """
+    The parsed range as `(min_col, min_row, max_col, max_row)`.
+    """
+
+    scope: Optional[str] = None
+    """
+    The sheet name for sheet-scoped named ranges. None for workbook-scoped named ranges and ListObjects.
+    """
+
+    header: Optional[Tuple[str, ...]] = None
+    """
+    The column names of the table, as `read_table` would use them. None unless headers were requested.
+    """
+
+
+def scan_workbook(
+    *,
+    path: Path,
+    headers: bool = False,
+) -> List[ScannedTable]:
+    """
+    List the tables in a workbook by reading only its metadata from the archive.
+
+    Only `workbook.xml`, the relationships and the `xl/tables/*.xml` parts are parsed. Styles, shared strings and cell
+    data are not loaded, so this is much faster than opening the workbook with `safe_load_workbook`.
+
+    When `headers` is true, each sheet containing tables is additionally streamed up to its last header row, and only
+    the shared strings used in the headers are looked up. Formulas in headers are reported as their cached values.
+
+    Like `iter_named_range_tables` and `iter_list_object_tables`, only ranges that can be tables are returned.
+
+    Args:
+        path: The path to the workbook on the disk.
+        headers: Whether to read the header row of each table.
+
+    Returns:
+        The workbook-scoped named ranges, then the sheet-scoped named ranges, then the ListObjects, each in workbook
+        order.
+    """
+    from zipfile import ZipFile
+
+    from openpyxl.packaging.manifest import Manifest
+    from openpyxl.packaging.relationship import get_dependents, get_rels_path
+    from openpyxl.packaging.workbook import WorkbookPackage
+    from openpyxl.reader.excel import _find_workbook_part
+    from openpyxl.xml.constants import ARC_CONTENT_TYPES, SHARED_STRINGS
+    from openpyxl.xml.functions import fromstring
+
+    with ZipFile(path) as archive:
+        manifest = Manifest.from_tree(fromstring(archive.read(ARC_CONTENT_TYPES)))
+        workbook_path = _find_workbook_part(manifest).PartName[1:]
+        package = WorkbookPackage.from_tree(fromstring(archive.read(workbook_path)))
+        rels = {
+            rel.Id: rel
+            for rel in get_dependents(
+                archive, get_rels_path(workbook_path)
+            ).Relationship
+        }
+        names = set(archive.namelist())
+
+        # Map each worksheet name to its part in the archive. Chartsheets are left out.
+        sheet_names: List[str] = []
+        worksheet_paths: Dict[str, str] = {}
+        for sheet in package.sheets:
+            sheet_names.append(sheet.name)
+            if not sheet.id:
+                continue
+            rel = rels.get(sheet.id)
+            if rel is None or "chartsheet" in rel.Type:
+                continue
+            if rel.target in names:
+                worksheet_paths[sheet.name] = rel.target
+
+        tables = list(
+            _scan_tables(
+                archive=archive,
+                package=package,
+                sheet_names=sheet_names,
+                worksheet_paths=worksheet_paths,
+            )
+        )
+
+        if headers:
+            ct = manifest.find(SHARED_STRINGS)
+            tables = _add_headers(
+                archive=archive,
+                tables=tables,
+                worksheet_paths=worksheet_paths,
+                strings_path=None if ct is None else ct.PartName[1:],
+            )
+
+    return tables
+
+
+def _scan_tables(
+    *,
+    archive: "ZipFile",
+    package: Any,
+    sheet_names: List[str],
+    worksheet_paths: Dict[str, str],
+) -> Generator[ScannedTable, None, None]:
+    global_names = []
+    local_names = []
+    defined_names = package.definedNames.definedName if package.definedNames else []
+    for defined_name in defined_names:
+        if defined_name.localSheetId is None:
+            global_names.append((defined_name, None))
+        else:
+            try:
+                scope: Optional[str] = sheet_names[int(defined_name.localSheetId)]
+            except IndexError:
+                continue
+            local_names.append((defined_name, scope))
+
+    for defined_name, scope in global_names + local_names:
+        if defined_name.is_reserved is not None:
+            continue
+        try:
+            destinations = list(defined_name.destinations)
+        except AttributeError:
+            continue
+
+        for sheet_name, table_range in destinations:
+            if sheet_name not in worksheet_paths:
+                continue
+
+            boundaries = _table_boundaries(table_range)
+            if boundaries is None:
+                continue
+
+            yield ScannedTable(
+                name=defined_name.name,
+                table_type="Named range",
+                sheet_name=sheet_name,
+                table_range=table_range,
+                boundaries=boundaries,
+                scope=scope,
+            )
+
+    for sheet_name, worksheet_path in worksheet_paths.items():
+        for table in read_table_parts(archive=archive, worksheet_path=worksheet_path):
+            boundaries = _table_boundaries(table.ref)
+            if boundaries is None:
+                continue
+
+            yield ScannedTable(
+                name=table.name,
+                table_type="ListObject",
+                sheet_name=sheet_name,
+                table_range=table.ref,
+                boundaries=boundaries,
+            )
+
+
+def _table_boundaries(table_range: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Parse a range, if it can be a table. See `is_table_range`.
+    """
+    boundaries = _parse_boundaries(table_range)
+    if boundaries is None:
+        return None
+
+    min_col, min_row, max_col, max_row = boundaries
+    if max_row - min_row + 1 < 2 or max_col - min_col + 1 < 1:
+        return None
+
+    return boundaries
+
+
+class _SharedString(int):
+    """
+    The index of a shared string, standing in for the string until it is looked up.
+    """
+
+
+class _SharedStringIndices:
+    """
+    Used instead of the shared strings table when parsing a sheet, so that the table does not have to be loaded first.
+    """
+
+    def __getitem__(self, i: int) -> _SharedString:
+        return _SharedString(i)
+
+
+def _add_headers(
+    *,
+    archive: "ZipFile",
+    tables: List[ScannedTable],
+    worksheet_paths: Dict[str, str],
+    strings_path: Optional[str],
+) -> List[ScannedTable]:
+    cells: Dict[Tuple[str, int, int], Any] = {}
+    for sheet_name in {table.sheet_name for table in tables}:
+        wanted = {
+            (min_row, col)
+            for table in tables
+            if table.sheet_name == sheet_name
+            for min_col, min_row, max_col, _ in [table.boundaries]
+            for col in range(min_col, max_col + 1)
+        }
+        for (row, col), value in _read_cells(
+            archive=archive,
+            worksheet_path=worksheet_paths[sheet_name],
+            wanted=wanted,
+        ):
+            cells[sheet_name, row, col] = value
+
+    indices = {v for v in cells.values() if isinstance(v, _SharedString)}
+    if indices:
+        assert strings_path is not None
+        strings = _read_shared_strings(
+            archive=archive, strings_path=strings_path, indices=indices
+        )
+        for key, value in cells.items():
+            if isinstance(value, _SharedString):
+                cells[key] = strings.get(value)
+
+    result = []
+    for table in tables:
+        min_col, min_row, max_col, _ = table.boundaries
+        header = fix_row_values(
+            row=tuple(
+                cells.get((table.sheet_name, min_row, col))
+                for col in range(min_col, max_col + 1)
+            ),
+            row_number=min_row,
+            min_col=min_col,
+        )
+        result.append(replace(table, header=tuple(str(v) for v in header)))
+
+    return result
+
+
+def _read_cells(
+    *,
+    archive: "ZipFile",
+    worksheet_path: str,
+    wanted: Set[Tuple[int, int]],
+) -> Generator[Tuple[Tuple[int, int], Any], None, None]:
+    """
+    Stream a worksheet and yield the values of the wanted cells, stopping after the last wanted row.
+    Shared strings are yielded as `_SharedString` indices.
+    """
+    from openpyxl.worksheet._reader import WorkSheetParser
+
+    if not wanted:
+        return
+
+    last_row = max(row for row, _ in wanted)
+    with archive.open(worksheet_path) as src:
+        parser = WorkSheetParser(src, _SharedStringIndices(), data_only=True)
+        for row, row_cells in parser.parse():
+            for cell in row_cells:
+                if (cell["row"], cell["column"]) in wanted:
+                    yield (cell["row"], cell["column"]), cell["value"]
+            if row >= last_row:
+                break
+
+
+def _read_shared_strings(
+    *,
+    archive: "ZipFile",
+    strings_path: str,
+    indices: Iterable[int],
+) -> Dict[int, str]:
+    """
+    Stream the shared strings table like `read_string_table` does, stopping after the last wanted string.
+    """
+    from openpyxl.cell.text import Text
+    from openpyxl.xml.constants import SHEET_MAIN_NS
+    from openpyxl.xml.functions import iterparse
+
+    wanted = set(indices)
+    last = max(wanted)
+    string_tag = f"{{{SHEET_MAIN_NS}}}si"
+
+    strings: Dict[int, str] = {}
+    i = 0
+    with archive.open(strings_path) as src:
+        for _, node in iterparse(src):
+            if node.tag != string_tag:
+                continue
+
+            if i in wanted:
+                strings[i] = Text.from_tree(node).content.replace("x005F_", "")
+            node.clear()
+
+            if i >= last:
+                break
+            i += 1
+
+    return strings
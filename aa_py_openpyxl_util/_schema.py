@@ -0,0 +1,337 @@
+"""
+Utilities for reading tables with typed columns.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    OrderedDict,
+    Sequence,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+from pydicti import odicti
+
+from ._data_util import all_none
+from ._extract import read_table_values
+from ._find_table import find_table
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from ._catalog import TableCatalog
+
+Converter = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """
+    The expected type of the values in a table column.
+    """
+
+    type: Type[Any]
+    """
+    One of `int`, `float`, `str`, `bool`, `datetime` or `date`.
+    """
+
+    nullable: bool = True
+    """
+    Whether empty cells are allowed. Empty cells become None, unless a default is given.
+    """
+
+    default: Any = None
+    """
+    The value to use for empty cells, if not None.
+    """
+
+
+@dataclass(frozen=True)
+class ColumnError:
+    """
+    A value that could not be converted to the type of its column.
+    """
+
+    column: str
+    """
+    The name of the column.
+    """
+
+    row_number: int
+    """
+    The number of the row in the sheet (1=1).
+    """
+
+    value: Any
+    """
+    The value as read from the sheet.
+    """
+
+    message: str
+    """
+    Why the value could not be converted.
+    """
+
+
+class SchemaError(ValueError):
+    """
+    Raised by `read_typed_table` when some values don't match the schema.
+    """
+
+    errors: Dict[str, List[ColumnError]]
+    """
+    The errors, per column name.
+    """
+
+    def __init__(self, errors: Dict[str, List[ColumnError]]):
+        self.errors = errors
+        super().__init__(
+            "Some values don't match the schema: "
+            + "; ".join(
+                f"column `{column}` has {len(column_errors)} error(s), "
+                f"e.g. row {column_errors[0].row_number}: {column_errors[0].message}"
+                for column, column_errors in errors.items()
+            )
+        )
+
+
+def read_typed_table(
+    *,
+    book: "Workbook",
+    table_name: str,
+    schema: Mapping[str, ColumnSchema],
+    ci: bool | Literal["warn"],
+    catalog: "TableCatalog | None" = None,
+) -> List[OrderedDict[str, Any]]:
+    """
+    Read the columns in a schema from a table, and convert their values to the types in the schema.
+
+    The schema is compiled once into one converter per column, and each row is converted as it is read. Values that
+    already have the right type are left as they are. Numbers stored as text, dates stored as serial numbers, etc. are
+    converted. Values that can't be converted are collected per column, and reported together at the end.
+
+    Args:
+        book: The workbook, opened using openpyxl, from which to read the table.
+        table_name: The name of the table (ListObject or named range) to read.
+        schema: The columns to read, mapped to their expected types, in the order in which to return them.
+        ci:
+            Whether the table name lookup should be case-insensitive.
+            When this is "warn", a warning is logged when the provided case does not match the actual case.
+        catalog:
+            Optional catalog of the tables in `book`.
+            Use this when reading many tables from the same workbook, to avoid searching the whole workbook each time.
+
+    Returns:
+        A list of case-insensitive ordered dictionaries, one for each row. Unlike `read_table`, rows in which all the
+        columns of the schema are empty are skipped.
+
+    Raises:
+        KeyError: If any of the columns in the schema are not in the table.
+        SchemaError: If any values can't be converted.
+    """
+    from openpyxl.utils import range_boundaries
+
+    names = list(schema)
+    converters = compile_schema(schema, epoch=book.epoch)
+
+    sheet, table_range = find_table(book=book, name=table_name, ci=ci, catalog=catalog)
+    _, min_row, _, _ = range_boundaries(table_range)
+
+    it = read_table_values(sheet=sheet, table_range=table_range, columns=names)
+    next(it)
+
+    errors: Dict[str, List[ColumnError]] = {name: [] for name in names}
+    rows: List[OrderedDict[str, Any]] = []
+    for row_number, row in enumerate(it, start=min_row + 1):
+        if all_none(row):
+            # All the columns of the schema are empty in this row. Skip it.
+            continue
+
+        try:
+            values = [convert(value) for convert, value in zip(converters, row)]
+        except (TypeError, ValueError, OverflowError):
+            values = convert_row(
+                row=row,
+                converters=converters,
+                names=names,
+                row_number=row_number,
+                errors=errors,
+            )
+        rows.append(odicti(zip(names, values)))
+
+    errors = {
+        name: column_errors for name, column_errors in errors.items() if column_errors
+    }
+    if errors:
+        raise SchemaError(errors)
+
+    return rows
+
+
+def compile_schema(
+    schema: Mapping[str, ColumnSchema],
+    *,
+    epoch: datetime,
+) -> Tuple[Converter, ...]:
+    """
+    Compile a schema into one converter function per column.
+
+    Each converter returns the converted value, or raises `ValueError` or `TypeError`.
+
+    Args:
+        schema: The expected types of the columns.
+        epoch: The epoch of the workbook, used for converting serial numbers to dates. See `Workbook.epoch`.
+
+    Returns:
+        The converters, in the order of the schema.
+    """
+    return tuple(compile_column(column, epoch=epoch) for column in schema.values())
+
+
+def compile_column(column: ColumnSchema, *, epoch: datetime) -> Converter:
+    """
+    Compile a column schema into a converter function.
+
+    Examples:
+        >>> from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+        >>> convert = compile_column(ColumnSchema(int, default=0), epoch=CALENDAR_WINDOWS_1900)
+        >>> convert(" 12 "), convert(3.0), convert(None)
+        (12, 3, 0)
+
+        >>> convert = compile_column(ColumnSchema(date), epoch=CALENDAR_WINDOWS_1900)
+        >>> convert(45306), convert("2024-01-15"), convert(None)
+        (datetime.date(2024, 1, 15), datetime.date(2024, 1, 15), None)
+    """
+    target = column.type
+    try:
+        parse = _PARSERS[target]
+    except KeyError:
+        raise TypeError(f"Unsupported column type: {target!r}") from None
+
+    default = column.default
+    nullable = column.nullable
+
+    def convert(value: Any) -> Any:
+        if type(value) is target:
+            return value
+
+        if value is None or (
+            isinstance(value, str) and target is not str and not value.strip()
+        ):
+            if default is not None:
+                return default
+            if nullable:
+                return None
+            raise ValueError("The value is missing.")
+
+        return parse(value, epoch)
+
+    return convert
+
+
+def convert_row(
+    *,
+    row: Sequence[Any],
+    converters: Sequence[Converter],
+    names: Sequence[str],
+    row_number: int,
+    errors: Dict[str, List[ColumnError]],
+) -> List[Any]:
+    """
+    Convert the values of a row, collecting the errors per column instead of raising them.
+
+    Values that can't be converted become None.
+    """
+    result: List[Any] = []
+    append = result.append
+    for name, convert, value in zip(names, converters, row):
+        try:
+            append(convert(value))
+        except (TypeError, ValueError, OverflowError) as e:
+            errors[name].append(
+                ColumnError(
+                    column=name, row_number=row_number, value=value, message=str(e)
+                )
+            )
+            append(None)
+    return result
+
+
+def _to_int(value: Any, epoch: datetime) -> int:
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value!r} is not a whole number.")
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return _to_int(float(value), epoch)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(value)
+    raise TypeError(f"Expected a whole number, not {value!r}.")
+
+
+def _to_float(value: Any, epoch: datetime) -> float:
+    if isinstance(value, (int, str)) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"Expected a number, not {value!r}.")
+
+
+def _to_str(value: Any, epoch: datetime) -> str:
+    if isinstance(value, float) and value.is_integer():
+        # Numbers are stored as floats, but codes like 123 should not become "123.0".
+        return str(int(value))
+    return str(value)
+
+
+def _to_bool(value: Any, epoch: datetime) -> bool:
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1"):
+            return True
+        if lowered in ("false", "0"):
+            return False
+    raise ValueError(f"Expected true or false, not {value!r}.")
+
+
+def _to_datetime(value: Any, epoch: datetime) -> datetime:
+    from openpyxl.utils.datetime import from_excel
+
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        result = from_excel(value, epoch)
+        if not isinstance(result, datetime):
+            raise ValueError(f"{value!r} is not a date.")
+        return result
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.strip())
+    raise TypeError(f"Expected a date, not {value!r}.")
+
+
+def _to_date(value: Any, epoch: datetime) -> date:
+    return _to_datetime(value, epoch).date()
+
+
+_PARSERS: Dict[Type[Any], Callable[[Any, datetime], Any]] = {
+    int: _to_int,
+    float: _to_float,
+    str: _to_str,
+    bool: _to_bool,
+    datetime: _to_datetime,
+    date: _to_date,
+}
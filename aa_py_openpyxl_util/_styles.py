@@ -0,0 +1,139 @@
+"""
+Utilities for styling many cells with few distinct styles.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, Fill
+    from openpyxl.styles.cell_style import StyleArray
+    from openpyxl.worksheet.worksheet import Worksheet
+
+_interners: "WeakKeyDictionary[Workbook, StyleInterner]" = WeakKeyDictionary()
+
+
+class StyleInterner:
+    """
+    Maps (number format, font, fill) to the `StyleArray` of a workbook, computing each distinct style only once.
+
+    Assigning `number_format`, `font` and `fill` to a cell looks each of them up in the workbook's style lists. With an
+    interner, this happens once per distinct style, and new cells just copy the resulting `StyleArray`.
+
+    Styles are looked up by the identity of the font and fill first, which is cheap. Fonts and fills that are equal but
+    not identical, e.g. created separately by different callers, are then matched by value, and share a style.
+
+    Use `get_style_interner` to get the interner of a workbook.
+    """
+
+    max_identities: int = 10_000
+    """
+    The maximum number of fonts and fills to remember by identity. The identity cache is cleared when it grows beyond
+    this, e.g. when a new font object is created for every cell.
+    """
+
+    def __init__(self) -> None:
+        self._by_identity: Dict[
+            Tuple[Optional[str], int, int],
+            Tuple["StyleArray", Optional["Font"], Optional["Fill"]],
+        ] = {}
+        self._by_value: Dict[
+            Tuple[Optional[str], Optional["Font"], Optional["Fill"]], "StyleArray"
+        ] = {}
+        self._ids: Dict[Tuple[Optional[str], int, int], int] = {}
+
+    def get(
+        self,
+        *,
+        sheet: "Worksheet",
+        number_format: Optional[str],
+        font: Optional["Font"],
+        fill: Optional["Fill"],
+    ) -> "StyleArray":
+        """
+        Get the style of cells with the given formatting.
+
+        Args:
+            sheet: A sheet of the workbook to which the style belongs.
+            number_format: The number format, if any.
+            font: The font, if any.
+            fill: The fill, if any.
+
+        Returns:
+            The style. Don't modify it. Copy it into the cells that use it.
+        """
+        identity = (number_format, id(font), id(fill))
+        found = self._by_identity.get(identity)
+        if found is not None:
+            return found[0]
+
+        key = (number_format, font, fill)
+        style = self._by_value.get(key)
+        if style is None:
+            style = self._by_value[key] = _create_style(
+                sheet=sheet, number_format=number_format, font=font, fill=fill
+            )
+
+        if len(self._by_identity) >= self.max_identities:
+            self._by_identity.clear()
+            self._ids.clear()
+        # Keep the font and fill alive, so that their ids are not reused.
+        self._by_identity[identity] = (style, font, fill)
+        return style
+
+    def get_id(
+        self,
+        *,
+        sheet: "Worksheet",
+        number_format: Optional[str],
+        font: Optional["Font"],
+        fill: Optional["Fill"],
+    ) -> int:
+        """
+        Like `get`, but return the style id, i.e. the index of the style in the workbook, as written in the `s`
+        attribute of cells in the worksheet XML.
+        """
+        identity = (number_format, id(font), id(fill))
+        style_id = self._ids.get(identity)
+        if style_id is None:
+            style = self.get(
+                sheet=sheet, number_format=number_format, font=font, fill=fill
+            )
+            style_id = self._ids[identity] = sheet.parent._cell_styles.add(style)
+        return style_id
+
+
+def get_style_interner(book: "Workbook") -> StyleInterner:
+    """
+    Get the style interner of a workbook, creating it if necessary. It is dropped when the workbook is.
+    """
+    interner = _interners.get(book)
+    if interner is None:
+        interner = _interners[book] = StyleInterner()
+    return interner
+
+
+def _create_style(
+    *,
+    sheet: "Worksheet",
+    number_format: Optional[str],
+    font: Optional["Font"],
+    fill: Optional["Fill"],
+) -> "StyleArray":
+    from openpyxl.cell import Cell
+    from openpyxl.styles.cell_style import StyleArray
+
+    # Let openpyxl register the formatting in the workbook, exactly like assigning it to a real cell.
+    cell: Any = Cell(sheet, row=1, column=1, style_array=StyleArray())
+    if number_format:
+        cell.number_format = number_format
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+
+    style: "StyleArray" = cell._style
+    return style
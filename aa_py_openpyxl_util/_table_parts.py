@@ -0,0 +1,90 @@
+"""
+Utilities for finding ListObjects in read-only openpyxl workbooks.
+
+In read-only mode, openpyxl never looks at the worksheet relationships, so `ReadOnlyWorksheet` has no `tables`
+attribute. The functions in this module read the `xl/tables/*.xml` parts straight from the archive instead, without
+loading any cell data.
+"""
+
+from __future__ import annotations
+
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from zipfile import ZipFile
+    from openpyxl import Workbook
+    from openpyxl.worksheet.table import Table, TableList
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+def read_table_parts(
+    *,
+    archive: "ZipFile",
+    worksheet_path: str,
+) -> List["Table"]:
+    """
+    Read the ListObjects belonging to a worksheet directly from the workbook archive.
+
+    Args:
+        archive: The open workbook archive.
+        worksheet_path: The path of the worksheet part inside the archive, e.g. `xl/worksheets/sheet1.xml`.
+
+    Returns:
+        The ListObjects defined on the worksheet, in the order in which they appear in the sheet relationships.
+    """
+    from openpyxl.packaging.relationship import get_rels_path, get_dependents
+    from openpyxl.worksheet.table import Table
+    from openpyxl.xml.functions import fromstring
+
+    rels_path = get_rels_path(worksheet_path)
+    if rels_path not in archive.namelist():
+        return []
+
+    return [
+        Table.from_tree(fromstring(archive.read(rel.target)))
+        for rel in get_dependents(archive, rels_path).find(Table._rel_type)
+    ]
+
+
+def attach_list_objects(*, book: "Workbook") -> None:
+    """
+    Attach ListObjects to every worksheet of a read-only workbook, so that `sheet.tables` works like it does in normal
+    mode. Worksheets which already have a `tables` attribute are left alone.
+
+    This is done automatically by `safe_load_workbook`. Use it directly if you opened the workbook some other way.
+
+    Args:
+        book: The workbook, opened using openpyxl.
+    """
+    for sheet in book.worksheets:
+        get_list_objects(sheet)
+
+
+def get_list_objects(sheet: "Worksheet") -> "TableList":
+    """
+    Get the ListObjects of a worksheet, reading them from the archive first if the sheet is read-only.
+
+    Args:
+        sheet: A normal or read-only worksheet.
+
+    Returns:
+        The `TableList` of the sheet, keyed by ListObject name.
+    """
+    try:
+        tables: "TableList" = sheet.tables
+        return tables
+    except AttributeError:
+        pass
+
+    from openpyxl.worksheet.table import TableList
+
+    tables = TableList()
+    # noinspection PyProtectedMember
+    for table in read_table_parts(
+        archive=sheet.parent._archive,
+        worksheet_path=sheet._worksheet_path,
+    ):
+        tables.add(table)
+
+    sheet.tables = tables
+    return tables
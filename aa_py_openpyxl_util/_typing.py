@@ -4,11 +4,12 @@ Type definitions to make code more readable.
 
 from __future__ import annotations
 
-from typing import Dict, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from openpyxl.cell import Cell
     from openpyxl.worksheet.table import Table
+    from ._write_only import FormattedCell
 
     TableCells = Tuple[Tuple[Cell, ...], ...]
     """
@@ -34,3 +35,9 @@ if TYPE_CHECKING:
     """
     Tables that have been written to the same workbook, keyed by sheet name.
     """
+
+    SparseRow = List[Tuple[int, Sequence[Any], Optional[Sequence[FormattedCell]]]]
+    """
+    A row of cells to write, as segments of adjacent cells: (0-based index of the first column, cells, formats).
+    When formats is None, the cells are `FormattedCell`s. Otherwise, they are values, formatted like the cells in formats.
+    """
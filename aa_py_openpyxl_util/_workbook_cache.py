@@ -0,0 +1,242 @@
+"""
+An in-process cache of opened workbooks, for services that open the same workbooks over and over.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import BinaryIO, Generator, Optional, Tuple, TYPE_CHECKING
+
+from ._context import open_workbook
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+
+_Key = Tuple[str, int, int, bool, bool]
+
+
+@dataclass
+class _Entry:
+    book: "Workbook"
+    memory: int
+    users: int = 0
+    evicted: bool = False
+    snapshot: Optional[bytes] = None
+    file: Optional[BinaryIO] = None
+    """
+    The file from which a read-only workbook reads its worksheets, closed together with the workbook.
+    """
+
+    def close(self) -> None:
+        self.book.close()
+        if self.file is not None:
+            self.file.close()
+
+
+class WorkbookCache:
+    """
+    A bounded cache of opened workbooks, keyed by path, modification time, size, `read_only` and `data_only`.
+
+    Use `WorkbookCache.safe_load_workbook` instead of `safe_load_workbook`. When the same workbook is requested again
+    and it has not changed on the disk, the already opened workbook is handed out instead of parsing it again.
+
+    The least recently used workbooks are evicted when there are more than `max_count` of them, or when their estimated
+    memory use exceeds `max_memory`. Read-only workbooks are closed when they are evicted, or when they are released
+    after being evicted while in use.
+
+    The cache is thread-safe. By default, each user of a workbook in normal mode gets a private copy, which may be
+    modified. Read-only workbooks are shared, so don't read from the same read-only workbook in multiple threads at once.
+    """
+
+    max_count: int
+    """
+    The maximum number of cached workbooks.
+    """
+
+    max_memory: Optional[int]
+    """
+    Optional limit on the estimated memory use of the cached workbooks, in bytes. See `estimate_workbook_memory`.
+    """
+
+    def __init__(self, *, max_count: int, max_memory: Optional[int] = None):
+        self.max_count = max_count
+        self.max_memory = max_memory
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._lock = Lock()
+
+    @contextmanager
+    def safe_load_workbook(
+        self,
+        *,
+        path: Path,
+        read_only: bool,
+        data_only: bool,
+        copy: Optional[bool] = None,
+    ) -> Generator["Workbook", None, None]:
+        """
+        Like `safe_load_workbook`, but reuse the workbook if it is already in the cache.
+
+        This is a context manager.
+
+        Args:
+            path: The path to the workbook on the disk.
+            read_only: See `safe_load_workbook`.
+            data_only: See `safe_load_workbook`.
+            copy:
+                Whether to hand out a private copy of the workbook, which may be modified.
+                The copy is unpickled from a snapshot of the cached workbook, which is much faster than parsing it.
+                Defaults to true in normal mode. Read-only workbooks can't be copied.
+
+        Yields:
+            The workbook. Unless `copy` is true, this is shared, so don't modify it.
+        """
+        if copy is None:
+            copy = not read_only
+        if copy and read_only:
+            raise ValueError("Read-only workbooks can't be copied.")
+
+        entry = self._acquire(path=path, read_only=read_only, data_only=data_only)
+        try:
+            if copy:
+                yield self._copy(entry)
+            else:
+                yield entry.book
+        finally:
+            self._release(entry)
+
+    def clear(self) -> None:
+        """
+        Evict all the workbooks. Workbooks that are still in use are closed when they are released.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _acquire(self, *, path: Path, read_only: bool, data_only: bool) -> _Entry:
+        # Stat and read the same open file, so that a workbook replaced in the meantime is not cached under the key of
+        # the old one.
+        file = path.open("rb")
+        try:
+            stat = os.fstat(file.fileno())
+            resolved = str(path.resolve())
+            key: _Key = (resolved, stat.st_mtime_ns, stat.st_size, read_only, data_only)
+
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    entry.users += 1
+                    file.close()
+                    return entry
+
+            # Load the workbook without holding the lock, so that other workbooks can be handed out in the meantime.
+            memory = estimate_workbook_memory(path=file, read_only=read_only)
+            file.seek(0)
+            book = open_workbook(path=file, read_only=read_only, data_only=data_only)
+        except BaseException:
+            file.close()
+            raise
+
+        if read_only:
+            # Read-only workbooks read their worksheets from the file until they are closed.
+            entry = _Entry(book=book, memory=memory, users=1, file=file)
+        else:
+            file.close()
+            entry = _Entry(book=book, memory=memory, users=1)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                # Another thread loaded the same workbook in the meantime.
+                entry.close()
+                self._entries.move_to_end(key)
+                existing.users += 1
+                return existing
+
+            # Evict older versions of the same workbook.
+            for old_key in [
+                k for k in self._entries if k[0] == resolved and k[1:3] != key[1:3]
+            ]:
+                self._evict(old_key)
+
+            if self.max_memory is not None and entry.memory > self.max_memory:
+                # Too large to cache. Close it as soon as it is released.
+                entry.evicted = True
+                return entry
+
+            self._entries[key] = entry
+            self._evict_to_fit()
+            return entry
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.users -= 1
+            if entry.evicted and entry.users == 0:
+                entry.close()
+
+    def _copy(self, entry: _Entry) -> "Workbook":
+        import pickle
+
+        with self._lock:
+            if entry.snapshot is None:
+                entry.snapshot = pickle.dumps(
+                    entry.book, protocol=pickle.HIGHEST_PROTOCOL
+                )
+                entry.memory += len(entry.snapshot)
+                if not entry.evicted:
+                    self._evict_to_fit()
+            snapshot = entry.snapshot
+
+        book: "Workbook" = pickle.loads(snapshot)
+        return book
+
+    def _evict(self, key: _Key) -> None:
+        """
+        Remove a workbook from the cache, and close it if it is not in use. The lock must be held.
+        """
+        entry = self._entries.pop(key)
+        entry.evicted = True
+        if entry.users == 0:
+            entry.close()
+
+    def _evict_to_fit(self) -> None:
+        """
+        Evict the least recently used workbooks until the limits are satisfied. The lock must be held.
+        """
+        while len(self._entries) > self.max_count or (
+            self.max_memory is not None
+            and sum(e.memory for e in self._entries.values()) > self.max_memory
+        ):
+            self._evict(next(iter(self._entries)))
+
+
+def estimate_workbook_memory(*, path: Path | BinaryIO, read_only: bool) -> int:
+    """
+    Roughly estimate the memory used by an opened workbook, from the uncompressed sizes of the parts in its archive.
+
+    In normal mode, all the parts are counted. In read-only mode, the worksheets are not loaded, so only the other
+    parts are counted.
+
+    Args:
+        path: The path to the workbook on the disk, or the open file.
+        read_only: Whether the workbook is opened in read-only mode.
+
+    Returns:
+        The estimated memory use, in bytes.
+    """
+    from zipfile import ZipFile
+
+    with ZipFile(path) as archive:
+        return sum(
+            info.file_size
+            for info in archive.infolist()
+            if not (read_only and info.filename.startswith("xl/worksheets/"))
+        )
@@ -7,7 +7,9 @@ has been written, because that would mean reading it back in, which is not allow
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, replace
+from datetime import datetime
 from itertools import zip_longest
 from logging import getLogger
 from typing import (
@@ -17,22 +19,32 @@ from typing import (
     Generator,
     List,
     Iterable,
+    Iterator,
     Callable,
+    Literal,
+    Mapping,
     TYPE_CHECKING,
 )
 
 from ._list_objects import define_list_object
+from ._styles import get_style_interner
 
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
     from openpyxl import Workbook
     from openpyxl.cell import Cell
     from openpyxl.styles import Font, Fill
     from openpyxl.worksheet.worksheet import Worksheet
     from openpyxl.worksheet.table import TableStyleInfo
-    from ._typing import WrittenTables, WrittenTablesInSheet
+    from ._typing import SparseRow, WrittenTables, WrittenTablesInSheet
 
 logger = getLogger(__name__)
 
+_PLAIN_TYPES = frozenset([type(None), bool, int, float, str])
+"""
+The types of the values that openpyxl writes without a style.
+"""
+
 
 @dataclass(
     kw_only=False,  # TODO: Make this True in the next major version
@@ -88,14 +100,7 @@ class FormattedCell:
         Raises:
             ValueError: If the cell would cause problems.
         """
-        if isinstance(self.value, str) and self.value.startswith("="):
-            # This is a formula. Check that it's not longer than 8192 characters.
-            formula = self.value[1:]
-            if len(formula) > 8192:
-                raise ValueError(
-                    f"Formula is too long: {len(formula)} characters. The maximum is 8192.\n{formula}"
-                )
-
+        check_value(self.value)
         return self
 
     def create_openpyxl_cell(
@@ -117,7 +122,7 @@ class FormattedCell:
             An openpyxl `WriteOnlyCell` instance.
         """
         from openpyxl.worksheet.formula import ArrayFormula
-        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.cell import Cell
 
         value = (
             ArrayFormula(
@@ -128,21 +133,45 @@ class FormattedCell:
             else self.value
         )
 
-        cell: "Cell" = WriteOnlyCell(ws=sheet, value=value)
+        # This is what `WriteOnlyCell` does. Binding the value gives dates a default number format.
+        cell: "Cell" = Cell(sheet, row=1, column=1, value=value)
+
+        if self.number_format or self.font or self.fill:
+            # Look the style up once per distinct formatting, instead of assigning each attribute to each cell.
+            # Like assigning the attributes after binding the value, the given number format overrides the default one.
+            style = get_style_interner(sheet.parent).get(
+                sheet=sheet,
+                number_format=self.number_format
+                or (cell.number_format if cell.has_style else None),
+                font=self.font,
+                fill=self.fill,
+            )
+            # noinspection PyProtectedMember
+            cell._style = copy(style)
+
+        return cell
 
-        if self.number_format:
-            # noinspection PyUnresolvedReferences,PyDunderSlots
-            cell.number_format = self.number_format
 
-        if self.font:
-            # noinspection PyUnresolvedReferences,PyDunderSlots
-            cell.font = self.font
+BLANK_CELL = FormattedCell(None)
+"""
+An empty cell without formatting, shared by all the padding written around tables. Don't modify it.
+"""
 
-        if self.fill:
-            # noinspection PyUnresolvedReferences,PyDunderSlots
-            cell.fill = self.fill
 
-        return cell
+def check_value(value: Any) -> None:
+    """
+    Check a cell value for potential errors before writing it to a sheet. See `FormattedCell.check`.
+
+    Raises:
+        ValueError: If the value would cause problems.
+    """
+    if isinstance(value, str) and value.startswith("="):
+        # This is a formula. Check that it's not longer than 8192 characters.
+        formula = value[1:]
+        if len(formula) > 8192:
+            raise ValueError(
+                f"Formula is too long: {len(formula)} characters. The maximum is 8192.\n{formula}"
+            )
 
 
 def get_default_table_style() -> "TableStyleInfo":
@@ -198,6 +227,22 @@ class TableInfo:
     A table description to write below the table name.
     """
 
+    column_values: Optional[List[List[Any]]]
+    """
+    For tables created with `from_columns`, the converted values of each column. Otherwise None.
+    """
+
+    column_formats: Optional[List[FormattedCell]]
+    """
+    For tables created with `from_columns`, the formatting of each column, as cells without values. Otherwise None.
+    """
+
+    epoch: Optional[datetime]
+    """
+    For tables created with `from_columns`, the epoch with which dates were converted to serial numbers. The table can
+    only be written to workbooks with the same epoch. Otherwise None.
+    """
+
     def __init__(
         self,
         *,
@@ -215,6 +260,9 @@ class TableInfo:
         self.pre_rows = pre_rows or []
         self.style = style or get_default_table_style()
         self.description = description or ""
+        self.column_values = None
+        self.column_formats = None
+        self.epoch = None
 
         if rows is None:
             if n_rows is None or get_cell is None:
@@ -231,6 +279,93 @@ class TableInfo:
             self.n_rows = len(rows)
             self.get_cell = lambda i_row, i_col: rows[i_row][i_col]  # type: ignore[index]
 
+    @classmethod
+    def from_columns(
+        cls,
+        *,
+        name: str,
+        columns: Mapping[str, Sequence[Any] | "NDArray[Any]"],
+        number_formats: Mapping[str, str] | None = None,
+        fonts: Mapping[str, "Font"] | None = None,
+        fills: Mapping[str, "Fill"] | None = None,
+        pre_rows: Sequence[Sequence[FormattedCell]] | None = None,
+        style: Optional["TableStyleInfo"] | None = None,
+        description: str | None = None,
+        epoch: datetime | None = None,
+    ) -> TableInfo:
+        """
+        Create a table from columns of values, e.g. NumPy arrays, instead of cells.
+
+        Each column is converted in bulk, using `convert_column`: NaN and NaT become empty cells, NumPy scalars become
+        Python values, and NumPy dates and durations become serial numbers with a default date or duration format.
+        The tables are then written without creating a `FormattedCell` for each value.
+
+        Args:
+            name: The table name.
+            columns: The values of each column, keyed by column name. All the columns must have the same length.
+            number_formats: Optional number formats, keyed by column name.
+            fonts: Optional fonts, keyed by column name.
+            fills: Optional fills, keyed by column name.
+            pre_rows: See `TableInfo.pre_rows`.
+            style: See `TableInfo.style`.
+            description: See `TableInfo.description`.
+            epoch:
+                The epoch of the workbook to which the table will be written, for converting NumPy dates. See
+                `Workbook.epoch`. Defaults to 1900, like new workbooks. `write_tables_side_by_side` raises an error if
+                this is not the epoch of the workbook.
+
+        Returns:
+            The table info.
+        """
+        from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+        from ._column_values import convert_column
+
+        number_formats = number_formats or {}
+        fonts = fonts or {}
+        fills = fills or {}
+        for formats in (number_formats, fonts, fills):
+            unknown = [k for k in formats if k not in columns]
+            if unknown:
+                raise ValueError(f"Unknown columns in table '{name}': {unknown}")
+
+        epoch = epoch or CALENDAR_WINDOWS_1900
+        column_values: List[List[Any]] = []
+        column_formats: List[FormattedCell] = []
+        for column_name, values in columns.items():
+            converted, default_number_format = convert_column(values, epoch=epoch)
+            column_values.append(converted)
+            column_formats.append(
+                FormattedCell(
+                    None,
+                    number_format=number_formats.get(column_name)
+                    or default_number_format,
+                    font=fonts.get(column_name),
+                    fill=fills.get(column_name),
+                )
+            )
+
+        lengths = {len(values) for values in column_values}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"The columns of table '{name}' have different lengths: {sorted(lengths)}"
+            )
+
+        table = cls(
+            name=name,
+            column_names=list(columns),
+            n_rows=lengths.pop() if lengths else 0,
+            get_cell=lambda i_row, i_col: replace(
+                column_formats[i_col], value=column_values[i_col][i_row]
+            ),
+            pre_rows=pre_rows,
+            style=style,
+            description=description,
+        )
+        table.column_values = column_values
+        table.column_formats = column_formats
+        table.epoch = epoch
+        return table
+
     @property
     def width(self) -> int:
         """
@@ -263,6 +398,7 @@ def write_tables_side_by_side_over_multiple_sheets(
     write_captions: bool,
     write_pre_rows: bool,
     max_sheet_width: int,
+    engine: Literal["openpyxl", "xml"] = "openpyxl",
 ) -> "WrittenTables":
     """
     Create one or more sheets containing one or more tables, stacked horizontally.
@@ -284,6 +420,7 @@ def write_tables_side_by_side_over_multiple_sheets(
             The maximum number of columns to write to a single sheet. If the tables are too wide, they will be split
             across multiple sheets. The maximum sheet width in Excel from 2007 is 16384 columns. Before 2007 it was 256
             columns. See https://support.microsoft.com/en-us/office/use-excel-with-earlier-versions-of-excel-2fd9ffcb-6fce-485b-85af-fecfd651a5ac
+        engine: How to write the rows. See `write_tables_side_by_side`.
 
     Returns: A dictionary with:
         - Keys: The sheet names.
@@ -312,6 +449,7 @@ def write_tables_side_by_side_over_multiple_sheets(
             col_margin_width=col_margin_width,
             write_captions=write_captions,
             write_pre_rows=write_pre_rows,
+            engine=engine,
         )
 
     return result
@@ -327,6 +465,7 @@ def write_tables_side_by_side(
     col_margin_width: int | None = None,
     write_captions: bool,
     write_pre_rows: bool,
+    engine: Literal["openpyxl", "xml"] = "openpyxl",
 ) -> "WrittenTablesInSheet":
     """
     Create a new sheet containing one or more tables, stacked horizontally.
@@ -346,6 +485,12 @@ def write_tables_side_by_side(
         col_margin_width: The width of the margin columns. If None, the column width is left at the default.
         write_captions: Whether to write the table name and description above the table. This shifts the table down.
         write_pre_rows: Whether to write the pre_rows (below the name and description, but above the table header).
+        engine:
+            How to write the rows:
+            - "openpyxl": Create an openpyxl cell for each cell, and append the rows to the sheet.
+            - "xml": Serialise the cells straight to the worksheet XML, which is several times faster for large tables.
+              Values other than numbers, strings, booleans and dates are still written by openpyxl. When openpyxl uses
+              lxml, or `et_xmlfile` is older than 2.0, this falls back to "openpyxl". See `can_write_xml`.
 
     Returns: A dictionary with:
         - Keys: The table names.
@@ -354,29 +499,33 @@ def write_tables_side_by_side(
             - The openpyxl table object.
     """
     from openpyxl.utils import get_column_letter
+    from ._xml_writer import append_rows_xml, can_write_xml
+
+    if engine not in ("openpyxl", "xml"):
+        raise ValueError(f"Unknown engine: {engine!r}")
+
+    for t in tables:
+        if t.epoch is not None and t.epoch != book.epoch:
+            raise ValueError(
+                f"The dates in table '{t.name}' were converted with the epoch {t.epoch}, "
+                f"but the workbook uses {book.epoch}. Pass `epoch=book.epoch` to `TableInfo.from_columns`."
+            )
 
     sheet: "Worksheet" = book.create_sheet(title=sheet_name)
 
     # Write rows
-    for i_row, row in enumerate(
-        stack_table_rows_side_by_side(
-            tables=tables,
-            row_margin=row_margin,
-            col_margin=col_margin,
-            write_captions=write_captions,
-            write_pre_rows=write_pre_rows,
-        ),
-        start=1,
-    ):
-        sheet.append(
-            (
-                cell.check().create_openpyxl_cell(
-                    sheet=sheet,
-                    ref=f"{get_column_letter(i_col)}{i_row}",
-                )
-                for i_col, cell in enumerate(row, start=1)
-            )
-        )
+    rows = stack_table_cells_side_by_side(
+        tables=tables,
+        row_margin=row_margin,
+        col_margin=col_margin,
+        write_captions=write_captions,
+        write_pre_rows=write_pre_rows,
+    )
+    if engine == "xml" and can_write_xml():
+        append_rows_xml(sheet=sheet, rows=rows)
+    else:
+        for i_row, row in enumerate(rows, start=1):
+            sheet.append(to_openpyxl_row(sheet=sheet, row=row, i_row=i_row))
 
     # Define ListObjects
     results: "WrittenTablesInSheet" = {}
@@ -421,6 +570,67 @@ def write_tables_side_by_side(
     return results
 
 
+def to_openpyxl_row(
+    *,
+    sheet: "Worksheet",
+    row: "SparseRow",
+    i_row: int,
+) -> Generator[Any, None, None]:
+    """
+    Convert a sparse row of cells into values for `sheet.append`.
+
+    The gaps between the segments are passed as None, which openpyxl skips. Cells without formatting are passed as
+    plain values, for which openpyxl reuses a single cell object, and which it skips when they are empty. Other cells
+    are converted with `FormattedCell.create_openpyxl_cell`.
+
+    Args:
+        sheet: The write-only sheet to which the row will be appended.
+        row: The segments of the row. See `stack_table_cells_side_by_side`.
+        i_row: The number of the row (1=1).
+    """
+    from openpyxl.utils import get_column_letter
+
+    i_col = 1
+    for first_column, cells, formats in row:
+        for _ in range(i_col, first_column + 1):
+            yield None
+
+        if formats is not None:
+            for value, cell in zip(cells, formats):
+                check_value(value)
+                if (
+                    cell.number_format
+                    or cell.font
+                    or cell.fill
+                    or type(value) not in _PLAIN_TYPES
+                ):
+                    yield replace(cell, value=value).create_openpyxl_cell(
+                        sheet=sheet, ref=""
+                    )
+                else:
+                    yield value
+
+        else:
+            for i_col, cell in enumerate(cells, start=first_column + 1):
+                cell.check()
+                if (
+                    cell.array
+                    or cell.number_format
+                    or cell.font
+                    or cell.fill
+                    or type(cell.value) not in _PLAIN_TYPES
+                ):
+                    yield cell.create_openpyxl_cell(
+                        sheet=sheet,
+                        # The ref is only used by array formulas.
+                        ref=f"{get_column_letter(i_col)}{i_row}" if cell.array else "",
+                    )
+                else:
+                    yield cell.value
+
+        i_col = first_column + len(cells) + 1
+
+
 def distribute_tables_over_multiple_sheets(
     *,
     tables: Iterable[TableInfo],
@@ -495,65 +705,112 @@ def stack_table_rows_side_by_side(
         A generator that yields one row at a time, in such a way that a sheet can be written from this data,
         top to bottom, without ever going back to a previous row.
     """
+    total_width = sum(col_margin + t.width for t in tables)
+
+    for segments in stack_table_cells_side_by_side(
+        tables=tables,
+        row_margin=row_margin,
+        col_margin=col_margin,
+        write_captions=write_captions,
+        write_pre_rows=write_pre_rows,
+    ):
+        if not segments:
+            yield []
+            continue
+
+        row: List[FormattedCell] = []
+        for first_column, cells, formats in segments:
+            row += [BLANK_CELL] * (first_column - len(row))
+            if formats is None:
+                row += cells
+            else:
+                row += [replace(f, value=v) for v, f in zip(cells, formats)]
+        row += [BLANK_CELL] * (total_width - len(row))
+        yield row
+
+
+def stack_table_cells_side_by_side(
+    tables: Sequence[TableInfo],
+    row_margin: int,
+    col_margin: int,
+    write_captions: bool,
+    write_pre_rows: bool,
+) -> Generator["SparseRow", None, None]:
+    """
+    Like `stack_table_rows_side_by_side`, but yield only the cells of the tables, with their column offsets, leaving
+    out the margins and the padding below tables which have run out of rows.
+
+    Tables which have run out of rows are dropped, so that each row costs time in proportion to the tables which still
+    have rows, rather than to all the tables.
+
+    Returns:
+        A generator that yields one sparse row at a time. Each row is a list of segments of adjacent cells, in
+        increasing order of column, as (0-based index of the first column, cells, formats). When formats is None, the
+        cells are `FormattedCell`s. Otherwise, they are the values of the cells of a table created with
+        `TableInfo.from_columns`, and formats holds the formatting of each of them, as cells without values.
+    """
     if row_margin < 0:
         raise ValueError("Row margin must be a positive integer.")
     if col_margin < 0:
         raise ValueError("Column margin must be a positive integer.")
 
-    def table_name_row() -> Generator[FormattedCell, None, None]:
-        for t in tables:
-            yield from [FormattedCell(None)] * col_margin
-            yield FormattedCell(t.name)
-            yield from [FormattedCell(None)] * (t.width - 1)
-
-    def table_description_row() -> Generator[FormattedCell, None, None]:
-        for t in tables:
-            yield from [FormattedCell(None)] * col_margin
-            yield FormattedCell(t.description)
-            yield from [FormattedCell(None)] * (t.width - 1)
-
-    def header_row() -> Generator[FormattedCell, None, None]:
-        for t in tables:
-            yield from [FormattedCell(None)] * col_margin
-            for c in t.column_names:
-                yield FormattedCell(c)
-            yield from [FormattedCell(None)] * (t.width - len(t.column_names))
-
-    widths = [t.width for t in tables]
-
-    def row(
-        data: Iterable[Optional[Iterable[FormattedCell]]],
-    ) -> Generator[FormattedCell, None, None]:
-        for w, d in zip(widths, data):
-            yield from [FormattedCell(None)] * col_margin
-
-            if d is None:
-                yield from [FormattedCell(None)] * w
-            else:
-                d_len = 0
-                for cell in d:
-                    yield cell
-                    d_len += 1
-                yield from [FormattedCell(None)] * (w - d_len)
+    first_columns: List[int] = []
+    column = 0
+    for t in tables:
+        first_columns.append(column + col_margin)
+        column += col_margin + t.width
 
     for _ in range(row_margin):
         yield []
 
     if write_captions:
-        yield list(table_name_row())
-        yield list(table_description_row())
+        yield [
+            (c, [FormattedCell(t.name)], None) for t, c in zip(tables, first_columns)
+        ]
+        yield [
+            (c, [FormattedCell(t.description)], None)
+            for t, c in zip(tables, first_columns)
+        ]
 
     if write_pre_rows:
         for pre_row_data in zip_longest(*(t.pre_rows for t in tables), fillvalue=None):
-            yield list(row(pre_row_data))
+            yield [(c, d, None) for c, d in zip(first_columns, pre_row_data) if d]
+
+    yield [
+        (c, [FormattedCell(name) for name in t.column_names], None)
+        for t, c in zip(tables, first_columns)
+    ]
+
+    # The tables which still have rows, as (first column, number of rows, iterator over the rows, formats).
+    active = [
+        (c, t.n_rows, iter_table_rows(t), t.column_formats)
+        for t, c in zip(tables, first_columns)
+        if t.n_rows
+    ]
+
+    i_row = 0
+    while active:
+        # Write the rows up to the end of the shortest table, and then drop it.
+        end = min(n_rows for _, n_rows, _, _ in active)
+        for _ in range(i_row, end):
+            yield [(c, next(rows), formats) for c, _, rows, formats in active]
+        i_row = end
+        active = [a for a in active if a[1] > end]
+
+    if i_row < 1:
+        # Tables are not allowed to have zero rows. Add an empty row.
+        yield []
 
-    yield list(header_row())
 
-    n_data_rows = 0
-    for row_data in zip_longest(*(t.rows for t in tables), fillvalue=None):
-        yield list(row(row_data))
-        n_data_rows += 1
+def iter_table_rows(table: TableInfo) -> Iterator[Sequence[Any]]:
+    """
+    Iterate over the rows of a table, as its cells, or as its values if it was created with `TableInfo.from_columns`.
+    """
+    if table.column_values is not None:
+        return zip(*table.column_values)
 
-    if n_data_rows < 1:
-        # Tables are not allowed to have zero rows. Add an empty row.
-        yield []
+    get_cell = table.get_cell
+    columns = range(len(table.column_names))
+    return (
+        [get_cell(i_row, i_col) for i_col in columns] for i_row in range(table.n_rows)
+    )
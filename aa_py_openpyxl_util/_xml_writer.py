@@ -0,0 +1,306 @@
+"""
+A fast engine for writing rows of `FormattedCell`s to write-only worksheets, by serialising them straight to the
+worksheet XML instead of creating an openpyxl cell for each of them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta
+from math import isfinite
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+from xml.sax.saxutils import escape
+
+from ._styles import get_style_interner
+from ._write_only import check_value
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+    from ._typing import SparseRow
+    from ._write_only import FormattedCell
+
+_DATE_TYPES = (datetime, date, time, timedelta)
+
+
+def can_write_xml() -> bool:
+    """
+    Check whether rows can be written with `append_rows_xml`.
+
+    This requires openpyxl to write worksheets using `et_xmlfile` 2 or later, whose writer accepts raw XML. When openpyxl
+    uses lxml, or an older `et_xmlfile`, the XML can only be written one element at a time.
+    """
+    import et_xmlfile
+    from openpyxl import LXML
+
+    return not LXML and int(et_xmlfile.__version__.split(".")[0]) >= 2
+
+
+def append_rows_xml(
+    *,
+    sheet: "WriteOnlyWorksheet",
+    rows: Iterable["SparseRow"],
+) -> None:
+    """
+    Append rows of cells to a new write-only worksheet, like `sheet.append` would, but much faster.
+
+    Numbers, strings, booleans, dates and formulas are serialised directly, with the style ids looked up once per
+    distinct style. Other values are written by openpyxl, like `sheet.append` would. Empty cells without formatting, and
+    the gaps between the segments of the rows, are skipped.
+
+    Args:
+        sheet: A write-only worksheet to which no rows have been appended yet.
+        rows:
+            The rows, as segments of adjacent cells. See `stack_table_cells_side_by_side`. Each value is checked like
+            `FormattedCell.check` does before it is written.
+
+    Raises:
+        ValueError: If rows have already been appended to the sheet, or `can_write_xml` is false.
+    """
+    if not can_write_xml():
+        raise ValueError(
+            "Rows can't be written as XML when openpyxl uses lxml or et_xmlfile<2."
+        )
+    if sheet._rows is not None:
+        raise ValueError("Rows have already been appended to the sheet.")
+
+    sheet._get_writer()
+
+    # Closing the sheet closes this generator, like the generator created by `sheet.append`.
+    sheet._rows = _write_rows(sheet)
+    next(sheet._rows)
+    for row in rows:
+        sheet._rows.send(row)
+
+
+def _write_rows(
+    sheet: "WriteOnlyWorksheet",
+) -> Generator[None, "SparseRow", None]:
+    """
+    Like `WriteOnlyWorksheet._write_rows`.
+    """
+    try:
+        xf = sheet._writer.xf.send(True)
+    except StopIteration:
+        sheet._already_saved()
+
+    row_writer = _RowWriter(sheet=sheet, xf=xf)
+    with xf.element("sheetData"):
+        row_idx = 1
+        try:
+            while True:
+                row = yield
+                row_writer.write_row(row, row_idx)
+                row_idx += 1
+        except GeneratorExit:
+            pass
+
+    sheet._writer.xf.send(None)
+
+
+class _RowWriter:
+    def __init__(self, *, sheet: "WriteOnlyWorksheet", xf: Any):
+        from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+
+        self.sheet = sheet
+        self.xf = xf
+        # The function which writes raw text to the XML stream.
+        self.write: Callable[[str], None] = xf._file
+        self.book = sheet.parent
+        self.interner = get_style_interner(self.book)
+        self.letters: List[str] = []
+        self.style_attrs: Dict[Tuple[Optional[str], int, int], Tuple[str, Any, Any]] = (
+            {}
+        )
+        self.error_codes = frozenset(ERROR_CODES)
+        self.illegal_characters = ILLEGAL_CHARACTERS_RE
+
+    def column_letters(self, n: int) -> List[str]:
+        """
+        Get the letters of the first `n` columns, or more.
+        """
+        letters = self.letters
+        if len(letters) < n:
+            from openpyxl.utils import get_column_letter
+
+            letters += map(get_column_letter, range(len(letters) + 1, n + 1))
+        return letters
+
+    def style_attr(self, cell: "FormattedCell", value: Any) -> str:
+        """
+        Get the `s` attribute of a cell, including the leading space, or an empty string if the cell is not styled.
+        """
+        number_format = cell.number_format
+        if isinstance(value, _DATE_TYPES):
+            number_format = self.date_format(number_format, value)
+        elif not (number_format or cell.font or cell.fill):
+            return ""
+
+        font, fill = cell.font, cell.fill
+        identity = (number_format, id(font), id(fill))
+        found = self.style_attrs.get(identity)
+        if found is not None:
+            return found[0]
+
+        style_id = self.interner.get_id(
+            sheet=self.sheet, number_format=number_format, font=font, fill=fill
+        )
+        attr = f' s="{style_id}"' if style_id else ""
+        if len(self.style_attrs) >= self.interner.max_identities:
+            self.style_attrs.clear()
+        # Keep the font and fill alive, so that their ids are not reused.
+        self.style_attrs[identity] = (attr, font, fill)
+        return attr
+
+    @staticmethod
+    def date_format(number_format: Optional[str], value: Any) -> str:
+        """
+        Like `Cell._bind_value`, use a default date format for dates in cells without one. A given number format is
+        kept, even if it is not a date format, like `FormattedCell.create_openpyxl_cell` does.
+        """
+        from openpyxl.cell.cell import get_time_format
+
+        if number_format:
+            return number_format
+        format: str = get_time_format(type(value))
+        return format
+
+    def write_row(self, row: "SparseRow", row_idx: int) -> None:
+        r = str(row_idx)
+        parts = [f'<row r="{r}">']
+        append = parts.append
+
+        for first_column, cells, formats in row:
+            if formats is None:
+                formats = cells
+                cells = [cell.value for cell in formats]
+
+            letters = self.column_letters(first_column + len(cells))
+            for i_col, (value, cell) in enumerate(zip(cells, formats), first_column):
+                t = type(value)
+
+                if cell.array and not (t is str and len(value) > 1 and value[0] == "="):
+                    # Only array formulas are serialised directly.
+                    self.write_openpyxl_cell(parts, cell, value, i_col, row_idx)
+
+                elif t is float or t is int:
+                    s = self.style_attr(cell, value)
+                    if isfinite(value):
+                        append(
+                            f'<c r="{letters[i_col]}{r}"{s} t="n"><v>{"%.16g" % value}</v></c>'
+                        )
+                    else:
+                        append(f'<c r="{letters[i_col]}{r}"{s} t="n"/>')
+
+                elif t is type(None):
+                    s = self.style_attr(cell, value)
+                    if s:
+                        append(f'<c r="{letters[i_col]}{r}"{s} t="n"/>')
+
+                elif t is str:
+                    append(self.string_cell(cell, value, f"{letters[i_col]}{r}"))
+
+                elif t is bool:
+                    s = self.style_attr(cell, value)
+                    append(
+                        f'<c r="{letters[i_col]}{r}"{s} t="b"><v>{int(value)}</v></c>'
+                    )
+
+                elif t in _DATE_TYPES:
+                    append(self.date_cell(cell, value, f"{letters[i_col]}{r}"))
+
+                else:
+                    # Let openpyxl write anything else, e.g. rich text, decimals and NumPy numbers.
+                    self.write_openpyxl_cell(parts, cell, value, i_col, row_idx)
+
+        append("</row>")
+        self.write("".join(parts))
+
+    def string_cell(self, cell: "FormattedCell", value: str, coordinate: str) -> str:
+        """
+        Serialise a cell with a string value, which may be a formula, like openpyxl would.
+        """
+        from openpyxl.utils.exceptions import IllegalCharacterError
+
+        check_value(value)
+        value = value[:32767]
+        if self.illegal_characters.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+
+        s = self.style_attr(cell, value)
+        if len(value) > 1 and value[0] == "=":
+            formula = escape(value[1:])
+            if cell.array:
+                return f'<c r="{coordinate}"{s}><f t="array" ref="{coordinate}">{formula}</f><v/></c>'
+            return f'<c r="{coordinate}"{s}><f>{formula}</f><v/></c>'
+
+        if value in self.error_codes:
+            return f'<c r="{coordinate}"{s} t="e"><v>{value}</v></c>'
+
+        if not value:
+            return f'<c r="{coordinate}"{s} t="inlineStr"/>'
+
+        stripped = value.strip()
+        space = ' xml:space="preserve"' if stripped and stripped != value else ""
+        return f'<c r="{coordinate}"{s} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'
+
+    def date_cell(self, cell: "FormattedCell", value: Any, coordinate: str) -> str:
+        """
+        Serialise a cell with a date, time or duration, like openpyxl would.
+        """
+        from openpyxl.utils.datetime import to_excel, to_ISO8601
+
+        if getattr(value, "tzinfo", None) is not None:
+            raise TypeError(
+                "Excel does not support timezones in datetimes. "
+                "The tzinfo in the datetime/time object must be set to None."
+            )
+
+        s = self.style_attr(cell, value)
+        if self.book.iso_dates and not isinstance(value, timedelta):
+            return f'<c r="{coordinate}"{s} t="d"><v>{to_ISO8601(value)}</v></c>'
+        return f'<c r="{coordinate}"{s} t="n"><v>{"%.16g" % to_excel(value, self.book.epoch)}</v></c>'
+
+    def write_openpyxl_cell(
+        self,
+        parts: List[str],
+        cell: "FormattedCell",
+        value: Any,
+        i_col: int,
+        row_idx: int,
+    ) -> None:
+        """
+        Write the serialised parts of the row so far, and then let openpyxl write the cell, with the given value.
+        """
+        from openpyxl.cell._writer import write_cell
+
+        self.write("".join(parts))
+        parts.clear()
+
+        if cell.value is not value:
+            cell = replace(cell, value=value)
+        cell.check()
+
+        openpyxl_cell = cell.create_openpyxl_cell(
+            sheet=self.sheet,
+            # The ref is only used by array formulas.
+            ref=(
+                f"{self.column_letters(i_col + 1)[i_col]}{row_idx}"
+                if cell.array
+                else ""
+            ),
+        )
+        openpyxl_cell.column = i_col + 1
+        openpyxl_cell.row = row_idx
+        if openpyxl_cell._value is None and not openpyxl_cell.has_style:
+            return
+        write_cell(self.xf, self.sheet, openpyxl_cell, openpyxl_cell.has_style)
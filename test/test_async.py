@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Any, Generator, List
+from unittest.mock import MagicMock, patch
+
+from locate import this_dir
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import (
+    open_workbook_async,
+    read_table_async,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestReadTableAsync(unittest.IsolatedAsyncioTestCase):
+    async def test_read_table(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                async with open_workbook_async(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=True,
+                ) as book:
+                    rows = [
+                        row
+                        async for row in read_table_async(
+                            book=book, table_name="FooBar1", ci=False, chunk_size=2
+                        )
+                    ]
+                self.assertEqual(
+                    [
+                        {"i": 1, "j": 4, "k": 7},
+                        {"i": 2, "j": 5, "k": 8},
+                        {"i": 3, "j": 6, "k": 9},
+                    ],
+                    rows,
+                )
+
+    async def test_cancel_while_opening(self) -> None:
+        book = MagicMock()
+        opening = Event()
+        release = Event()
+
+        def open_workbook(**kwargs: Any) -> Any:
+            opening.set()
+            release.wait()
+            return book
+
+        async def open_and_read() -> None:
+            async with open_workbook_async(
+                path=data_dir.joinpath("tables.xlsx"), read_only=True, data_only=True
+            ):
+                self.fail("The workbook should not be used after cancelling.")
+
+        with patch("aa_py_openpyxl_util._async.open_workbook", open_workbook):
+            task = asyncio.create_task(open_and_read())
+            await asyncio.to_thread(opening.wait)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            # The workbook is closed once it has been opened.
+            book.close.assert_not_called()
+            release.set()
+            for _ in range(100):
+                if book.close.called:
+                    break
+                await asyncio.sleep(0.01)
+            book.close.assert_called_once_with()
+
+    async def test_error(self) -> None:
+        async with open_workbook_async(
+            path=data_dir.joinpath("tables.xlsx"), read_only=True, data_only=True
+        ) as book:
+            with self.assertRaises(KeyError):
+                async for _ in read_table_async(
+                    book=book, table_name="Missing", ci=False
+                ):
+                    pass
+
+    async def test_backpressure_and_early_stop(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        sheet.append(["x"])
+        for i in range(100):
+            sheet.append([i])
+        book.defined_names.add(
+            DefinedName(name="Table1", attr_text="Sheet1!$A$1:$A$101")
+        )
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        read: List[Any] = []
+        iter_rows = sheet.iter_rows
+
+        def counting_iter_rows(*args: Any, **kwargs: Any) -> Generator[Any, None, None]:
+            for row in iter_rows(*args, **kwargs):
+                read.append(row)
+                yield row
+
+        with patch.object(sheet, "iter_rows", counting_iter_rows):
+            rows = read_table_async(
+                book=book,
+                table_name="Table1",
+                ci=False,
+                executor=executor,
+                chunk_size=10,
+                max_chunks=2,
+            )
+            self.assertEqual({"x": 0}, await rows.__anext__())
+            await asyncio.sleep(0.1)
+
+            # The reader is paused with a full queue, instead of reading the whole table.
+            self.assertLess(len(read), 60)
+
+            await rows.aclose()
+
+            # The reader has stopped, so the executor is free again.
+            await asyncio.get_running_loop().run_in_executor(executor, lambda: None)
+            self.assertLess(len(read), 60)
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
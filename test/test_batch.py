@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import (
+    read_tables_from_workbooks,
+    TableValues,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestReadTablesFromWorkbooks(unittest.TestCase):
+    def test_tables(self) -> None:
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                results = list(
+                    read_tables_from_workbooks(
+                        paths=[data_dir.joinpath("tables.xlsx")] * 3,
+                        table_names=["Table1", "foobar1"],
+                        columns={"foobar1": ["K", "i"]},
+                        ci=True,
+                        read_only=True,
+                        data_only=True,
+                        workers=workers,
+                    )
+                )
+                self.assertEqual(3, len(results))
+                for result in results:
+                    self.assertIsNone(result.error)
+                    self.assertEqual(
+                        TableValues(header=("a", "b"), rows=[(1, 2), (3, 4)]),
+                        result.tables["Table1"],
+                    )
+                    self.assertEqual(("K", "i"), result.tables["foobar1"].header)
+                    self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+
+    def test_errors_are_reported_per_file(self) -> None:
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                results = {
+                    result.path.name: result
+                    for result in read_tables_from_workbooks(
+                        paths=[
+                            data_dir.joinpath("tables.xlsx"),
+                            data_dir.joinpath("does_not_exist.xlsx"),
+                            data_dir.joinpath("number_formats.xlsx"),
+                        ],
+                        table_names=["Table1"],
+                        ci=False,
+                        read_only=True,
+                        data_only=True,
+                        workers=workers,
+                    )
+                }
+                self.assertIsNone(results["tables.xlsx"].error)
+                self.assertIsInstance(
+                    results["does_not_exist.xlsx"].error, FileNotFoundError
+                )
+                self.assertIsInstance(results["number_formats.xlsx"].error, KeyError)
+                self.assertEqual({}, results["number_formats.xlsx"].tables)
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
@@ -0,0 +1,139 @@
+import re
+import unittest
+from logging import WARNING
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    find_table,
+    iter_named_range_tables,
+    iter_list_object_tables,
+    read_table,
+    TableCatalog,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestTableCatalog(unittest.TestCase):
+    def test_find(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=False,
+                ) as book:
+                    catalog = TableCatalog(book=book)
+
+                    entry = catalog.find(name="Table1", ci=False)
+                    self.assertEqual("Named range", entry.table_type)
+                    self.assertEqual("Sheet1", entry.sheet.title)
+                    self.assertEqual("$B$2:$C$4", entry.table_range)
+                    self.assertEqual((2, 2, 3, 4), entry.boundaries)
+
+                    entry = catalog.find(name="Table2", ci=False)
+                    self.assertEqual("ListObject", entry.table_type)
+                    self.assertEqual("E2:F3", entry.table_range)
+                    self.assertIsNotNone(entry.table)
+
+                    for name in ["table1", "TABLE2", "Table999", "SingleCell1"]:
+                        with self.assertRaises(KeyError):
+                            catalog.find(name=name, ci=False)
+
+    def test_same_as_find_table(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=False,
+            data_only=False,
+        ) as book:
+            catalog = TableCatalog(book=book)
+            for name in ["Table1", "table1", "Table2", "TABLE2", "FooBar1", "foobar2"]:
+                for ci in [False, True]:
+                    with self.subTest(name=name, ci=ci):
+                        try:
+                            expected = find_table(book=book, name=name, ci=ci)
+                        except KeyError:
+                            with self.assertRaises(KeyError):
+                                find_table(book=book, name=name, ci=ci, catalog=catalog)
+                        else:
+                            self.assertEqual(
+                                expected,
+                                find_table(
+                                    book=book, name=name, ci=ci, catalog=catalog
+                                ),
+                            )
+
+    def test_case_insensitive_warn(self) -> None:
+        with self.assertLogs(level=WARNING) as logs:
+            with safe_load_workbook(
+                path=data_dir.joinpath("tables.xlsx"),
+                read_only=False,
+                data_only=False,
+            ) as book:
+                catalog = TableCatalog(book=book)
+                for name in ["Table1", "table1", "table2"]:
+                    catalog.find(name=name, ci="warn")
+
+        self.assertEqual(
+            [
+                "Table with exact name `table1` not found. Using case-insensitive match `Table1` instead.",
+                "Table with exact name `table2` not found. Using case-insensitive match `Table2` instead.",
+            ],
+            [r.message for r in logs.records],
+        )
+
+    def test_iter_tables(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=False,
+            data_only=False,
+        ) as book:
+            catalog = TableCatalog(book=book)
+            for exclude in [[], [re.compile(r"table\d*", re.IGNORECASE)]]:
+                with self.subTest(exclude=exclude):
+                    self.assertEqual(
+                        list(
+                            iter_named_range_tables(
+                                book=book, exclude_names=exclude, exclude_sheets=[]
+                            )
+                        ),
+                        list(
+                            catalog.iter_named_range_tables(
+                                exclude_names=exclude, exclude_sheets=[]
+                            )
+                        ),
+                    )
+                    self.assertEqual(
+                        list(
+                            iter_list_object_tables(
+                                book=book,
+                                exclude_list_objects=exclude,
+                                exclude_sheets=[],
+                            )
+                        ),
+                        list(
+                            catalog.iter_list_object_tables(
+                                exclude_list_objects=exclude, exclude_sheets=[]
+                            )
+                        ),
+                    )
+
+    def test_read_table(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            catalog = TableCatalog(book=book)
+            self.assertEqual(
+                list(read_table(book=book, table_name="FooBar1")),
+                list(read_table(book=book, table_name="FooBar1", catalog=catalog)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
@@ -0,0 +1,113 @@
+import unittest
+
+from locate import this_dir
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    get_cell_values,
+    get_range_values,
+    process_range_values,
+    read_table,
+)
+from aa_py_openpyxl_util._extract import get_numbered_tables
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestGetRangeValues(unittest.TestCase):
+    def test_same_as_get_cell_values(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=False,
+                ) as book:
+                    sheet = book["Sheet2"]
+                    self.assertEqual(
+                        get_cell_values(sheet["B2:D5"]),
+                        get_range_values(sheet=sheet, table_range="B2:D5"),
+                    )
+
+    def test_process_range_values(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            self.assertEqual(
+                [["a", "b"], ["1", "2"], ["3", "4"]],
+                process_range_values(
+                    sheet=book["Sheet1"], table_range="$B$2:$C$4", callback=str
+                ),
+            )
+
+
+class TestNoCellsCreated(unittest.TestCase):
+    def create_book(self) -> Workbook:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        sheet["A1"], sheet["B1"], sheet["C1"] = "a", "b", "c"
+        sheet["A2"], sheet["C3"] = 1, 2
+        sheet["B5000"] = 3
+        for name, attr_text in [
+            ("Data", "Sheet1!$A$1:$Z$20000"),
+            ("Small1", "Sheet1!$A$1:$C$3"),
+        ]:
+            book.defined_names.add(DefinedName(name=name, attr_text=attr_text))
+        return book
+
+    def test_read_table(self) -> None:
+        book = self.create_book()
+        sheet = book["Sheet1"]
+        n_cells = len(sheet._cells)
+
+        for columns in [None, ["c", "b"]]:
+            with self.subTest(columns=columns):
+                rows = list(
+                    read_table(book=book, table_name="Data", columns=columns, ci=False)
+                )
+                # Every row in the range is returned, including the empty ones.
+                self.assertEqual(19999, len(rows))
+                self.assertEqual(
+                    {3: 2, 5000: 3},
+                    {
+                        i_row: row["b"] or row["c"]
+                        for i_row, row in enumerate(rows, start=2)
+                        if row["b"] or row["c"]
+                    },
+                )
+                self.assertEqual(n_cells, len(sheet._cells))
+
+    def test_dense_range(self) -> None:
+        book = self.create_book()
+        sheet = book["Sheet1"]
+        n_cells = len(sheet._cells)
+
+        self.assertEqual(
+            [["a", "b"], [1, None], [None, None]],
+            get_range_values(sheet=sheet, table_range="A1:B3"),
+        )
+        self.assertEqual(n_cells, len(sheet._cells))
+
+    def test_get_numbered_tables(self) -> None:
+        book = self.create_book()
+        sheet = book["Sheet1"]
+        n_cells = len(sheet._cells)
+
+        ((name, cells),) = get_numbered_tables(book=book, base_name="Small")
+        self.assertEqual(
+            [["a", "b", "c"], [1, None, None], [None, None, 2]],
+            get_cell_values(cells),
+        )
+        self.assertEqual("B2", cells[1][1].coordinate)
+        self.assertEqual(n_cells, len(sheet._cells))
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
@@ -0,0 +1,79 @@
+import unittest
+from array import array
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    read_table,
+    read_table_columns,
+    columns_to_numpy,
+    columns_to_pandas,
+)
+from aa_py_openpyxl_util._columns import compact_column
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestReadTableColumns(unittest.TestCase):
+    def test_same_as_read_table(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=False,
+                ) as book:
+                    rows = list(read_table(book=book, table_name="FooBar1"))
+                    columns = read_table_columns(
+                        book=book, table_name="FooBar1", ci=False
+                    )
+                    self.assertEqual(list(rows[0].keys()), list(columns.keys()))
+                    for key, values in columns.items():
+                        self.assertEqual([row[key] for row in rows], list(values))
+
+    def test_typed_arrays(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            columns = read_table_columns(
+                book=book, table_name="table1", columns=["B", "a"], ci=True
+            )
+            self.assertEqual(["B", "a"], list(columns.keys()))
+            self.assertEqual(array("q", [2, 4]), columns["b"])
+            self.assertEqual(array("q", [1, 3]), columns["A"])
+
+    def test_mixed_numbers(self) -> None:
+        # Integers above 2**53 can't be stored exactly as floats.
+        values = [2**53 + 1, 0.5, -(2**63)]
+        compacted = compact_column(list(values))
+        self.assertEqual(values, list(compacted))
+        self.assertEqual([int, float, int], [type(v) for v in compacted])
+
+        self.assertEqual(array("q", [2**53 + 1, 1]), compact_column([2**53 + 1, 1]))
+        self.assertEqual(array("d", [0.5, 1.0]), compact_column([0.5, 1.0]))
+
+    def test_numpy(self) -> None:
+        import numpy
+
+        numpy_columns = columns_to_numpy(
+            {"a": array("q", [1, 2]), "b": array("d", [1.5, 2]), "c": ["x", None]}
+        )
+        self.assertEqual(numpy.int64, numpy_columns["a"].dtype)
+        self.assertEqual(numpy.float64, numpy_columns["b"].dtype)
+        self.assertEqual(object, numpy_columns["c"].dtype)
+        self.assertEqual(["x", None], list(numpy_columns["c"]))
+
+    def test_pandas(self) -> None:
+        df = columns_to_pandas({"a": array("q", [1, 2]), "b": ["x", "y"]})
+        self.assertEqual(["a", "b"], list(df.columns))
+        self.assertEqual([1, 2], df["a"].tolist())
+        self.assertEqual(["x", "y"], df["b"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
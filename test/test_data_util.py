@@ -0,0 +1,124 @@
+import pickle
+import unittest
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    read_table,
+    extract_data_from_numbered_tables,
+    RowView,
+)
+
+# noinspection PyProtectedMember
+from aa_py_openpyxl_util._data_util import data_to_dicts, data_to_row_views
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestDataToRowViews(unittest.TestCase):
+    def test_same_as_data_to_dicts(self) -> None:
+        data = (("a", "B", "c"), (1, 2, 3), (None, None, None), (4, None, 6))
+        for columns in [None, ["b", "A"], ["C"]]:
+            with self.subTest(columns=columns):
+                expected = list(
+                    data_to_dicts(
+                        data=data,
+                        columns=columns,
+                        value_callback=lambda x: x,
+                        header_callback=str,
+                    )
+                )
+                actual = list(
+                    data_to_row_views(data=data, columns=columns, header_callback=str)
+                )
+                self.assertEqual(expected, [row.to_dict() for row in actual])
+                self.assertEqual(
+                    [list(row.keys()) for row in expected],
+                    [list(row.keys()) for row in actual],
+                )
+
+    def test_mapping(self) -> None:
+        rows = list(
+            data_to_row_views(
+                data=(("Key", "Value"), ("x", 1), ("y", 2)), header_callback=str
+            )
+        )
+        row = rows[0]
+        self.assertEqual("x", row["key"])
+        self.assertEqual(1, row["VALUE"])
+        self.assertIn("kEy", row)
+        self.assertNotIn("Other", row)
+        self.assertIsNone(row.get("Other"))
+        self.assertEqual(2, len(row))
+        self.assertEqual({"Key": "x", "Value": 1}, row)
+        with self.assertRaises(KeyError):
+            row["Other"]
+
+        # All rows share the same header index.
+        self.assertIs(rows[0]._index, rows[1]._index)
+
+    def test_duplicate_header(self) -> None:
+        data = (("a", "A", "b"), (1, 2, 3))
+        self.assertEqual(
+            list(
+                data_to_dicts(
+                    data=data, value_callback=lambda x: x, header_callback=str
+                )
+            ),
+            [
+                row.to_dict()
+                for row in data_to_row_views(data=data, header_callback=str)
+            ],
+        )
+
+    def test_missing_column(self) -> None:
+        with self.assertRaises(KeyError):
+            list(
+                data_to_row_views(
+                    data=(("a",), (1,)), columns=["b"], header_callback=str
+                )
+            )
+
+    def test_pickle(self) -> None:
+        (row,) = data_to_row_views(data=(("a",), (1,)), header_callback=str)
+        self.assertEqual(row, pickle.loads(pickle.dumps(row)))
+
+
+class TestReadTableRowViews(unittest.TestCase):
+    def test_read_table(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            for name in ["Table1", "FooBar1"]:
+                with self.subTest(name=name):
+                    rows = list(read_table(book=book, table_name=name, row_views=True))
+                    self.assertTrue(all(isinstance(row, RowView) for row in rows))
+                    self.assertEqual(
+                        list(read_table(book=book, table_name=name)),
+                        [row.to_dict() for row in rows],
+                    )
+
+    def test_extract(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("extract/dates.xlsx"),
+            read_only=True,
+            data_only=True,
+        ) as book:
+            self.assertEqual(
+                list(extract_data_from_numbered_tables(book=book, base_name="Table")),
+                [
+                    row.to_dict()
+                    for row in extract_data_from_numbered_tables(
+                        book=book, base_name="Table", row_views=True
+                    )
+                ],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
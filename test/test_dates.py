@@ -0,0 +1,113 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from openpyxl import Workbook
+from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    read_table,
+    read_table_columns,
+    find_date_columns,
+    serials_to_datetimes,
+)
+
+
+class TestRawDates(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name, "dates.xlsx")
+
+        book = Workbook()
+        sheet = book.active
+        sheet.append(["Name", "Date", "Amount"])
+        sheet.append(["a", datetime(2024, 1, 15), 1.5])
+        sheet.append(["b", datetime(2024, 1, 16, 12), 2])
+        sheet.append([None, None, None])
+        sheet.append(["c", datetime(1900, 1, 1), 3])
+        book.defined_names["Dates"] = DefinedName("Dates", attr_text="Sheet!$A$1:$C$5")
+        book.save(self.path)
+
+    def test_read_table(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=self.path, read_only=read_only, data_only=False
+                ) as book:
+                    rows = list(
+                        read_table(
+                            book=book, table_name="Dates", ci=False, raw_dates=True
+                        )
+                    )
+                    self.assertEqual(
+                        [45306, 45307.5, None, 1], [r["Date"] for r in rows]
+                    )
+                    self.assertEqual([1.5, 2, None, 3], [r["Amount"] for r in rows])
+
+                    rows = list(
+                        read_table(
+                            book=book,
+                            table_name="Dates",
+                            columns=["date"],
+                            ci=False,
+                            raw_dates=True,
+                        )
+                    )
+                    self.assertEqual(
+                        [45306, 45307.5, None, 1], [r["Date"] for r in rows]
+                    )
+
+    def test_find_date_columns(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=self.path, read_only=read_only, data_only=False
+                ) as book:
+                    self.assertEqual(
+                        ["Date"],
+                        find_date_columns(book=book, table_name="Dates", ci=False),
+                    )
+
+    def test_round_trip(self) -> None:
+        with safe_load_workbook(
+            path=self.path, read_only=True, data_only=False
+        ) as book:
+            expected = [
+                r["Date"] for r in read_table(book=book, table_name="Dates", ci=False)
+            ]
+            columns = read_table_columns(
+                book=book, table_name="Dates", ci=False, raw_dates=True
+            )
+            self.assertEqual(
+                expected,
+                serials_to_datetimes(columns["Date"], epoch=book.epoch),
+            )
+
+            import numpy
+
+            self.assertEqual(
+                numpy.array(expected, dtype="datetime64[ms]").tolist(),
+                serials_to_datetimes(
+                    columns["Date"], epoch=book.epoch, numpy=True
+                ).tolist(),
+            )
+
+    def test_numpy_empty_values(self) -> None:
+        import numpy
+
+        result = serials_to_datetimes(
+            [45306.25, None], epoch=CALENDAR_WINDOWS_1900, numpy=True
+        )
+        self.assertEqual(numpy.dtype("datetime64[ms]"), result.dtype)
+        self.assertEqual(datetime(2024, 1, 15, 6), result[0].item())
+        self.assertTrue(numpy.isnat(result[1]))
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
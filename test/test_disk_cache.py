@@ -0,0 +1,312 @@
+import shutil
+import unittest
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Tuple
+from unittest.mock import patch
+
+from locate import this_dir
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import (
+    TableCache,
+    safe_load_workbook,
+    read_table,
+    read_dict_table,
+    extract_data_from_numbered_tables,
+)
+from aa_py_openpyxl_util._batch import TableValues
+from aa_py_openpyxl_util._cache_format import read_tables, write_tables
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestTableCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_dir = Path(self.temp_dir.name, "cache")
+        self.path = Path(self.temp_dir.name, "tables.xlsx")
+        shutil.copy(data_dir.joinpath("tables.xlsx"), self.path)
+
+    def test_warm_cache_skips_openpyxl(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+
+        with safe_load_workbook(
+            path=self.path, read_only=False, data_only=True
+        ) as book:
+            expected_table = list(
+                read_table(
+                    book=book, table_name="FooBar1", columns=["k", "I"], ci=False
+                )
+            )
+            expected_dict = read_dict_table(
+                book=book,
+                table_name="Table1",
+                key_column="a",
+                value_column="b",
+                ci=False,
+            )
+            expected_numbered = list(
+                extract_data_from_numbered_tables(book=book, base_name="FooBar")
+            )
+
+        expected = (expected_table, expected_dict, expected_numbered)
+        self.assertEqual(expected, self.read_all(cache))
+        with patch(
+            "openpyxl.load_workbook",
+            side_effect=AssertionError("The workbook should not be loaded."),
+        ):
+            self.assertEqual(expected, self.read_all(cache))
+
+        self.assertEqual(3, len(list(self.cache_dir.glob("*.bin"))))
+
+    def read_all(self, cache: TableCache) -> Tuple[Any, ...]:
+        return (
+            list(
+                cache.read_table(
+                    path=self.path,
+                    table_name="FooBar1",
+                    columns=["k", "I"],
+                    ci=False,
+                    data_only=True,
+                )
+            ),
+            cache.read_dict_table(
+                path=self.path,
+                table_name="Table1",
+                key_column="a",
+                value_column="b",
+                ci=False,
+                data_only=True,
+            ),
+            list(
+                cache.extract_data_from_numbered_tables(
+                    path=self.path, base_name="FooBar", data_only=True
+                )
+            ),
+        )
+
+    def test_numbered_tables_with_columns(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        for row in [["k", "v"], ["a", 3], ["b", None], [None, None], ["c", 1]]:
+            sheet.append(row)
+        for name, attr_text in [
+            ("Data1", "Sheet1!$A$1:$B$3"),
+            ("Data2", "Sheet1!$A$1:$B$5"),
+        ]:
+            book.defined_names.add(DefinedName(name=name, attr_text=attr_text))
+        book.save(self.path)
+
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        for columns in [None, ["v"], ["V", "k"]]:
+            with self.subTest(columns=columns):
+                with safe_load_workbook(
+                    path=self.path, read_only=True, data_only=True
+                ) as book:
+                    expected = list(
+                        extract_data_from_numbered_tables(
+                            book=book, base_name="Data", columns=columns
+                        )
+                    )
+
+                # Once to fill the cache, and once to read from it.
+                for _ in range(2):
+                    self.assertEqual(
+                        expected,
+                        list(
+                            cache.extract_data_from_numbered_tables(
+                                path=self.path,
+                                base_name="Data",
+                                columns=columns,
+                                data_only=True,
+                            )
+                        ),
+                    )
+
+    def test_changed_workbook(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        cache.read_table(path=self.path, table_name="Table1", ci=False, data_only=True)
+        old_entries = set(self.cache_dir.glob("*.bin"))
+
+        shutil.copy(data_dir.joinpath("extract", "dates.xlsx"), self.path)
+        self.assertEqual(
+            2,
+            len(
+                list(
+                    cache.read_table(
+                        path=self.path, table_name="Table1", ci=False, data_only=True
+                    )
+                )
+            ),
+        )
+        new_entries = set(self.cache_dir.glob("*.bin"))
+        self.assertEqual(1, len(new_entries))
+        self.assertFalse(old_entries & new_entries)
+
+    def test_invalidate_and_clear(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        cache.read_table(path=self.path, table_name="Table1", ci=False, data_only=True)
+        cache.read_table(path=self.path, table_name="Table2", ci=False, data_only=True)
+        self.assertEqual(2, len(list(self.cache_dir.glob("*.bin"))))
+
+        cache.invalidate(path=data_dir.joinpath("tables.xlsx"))
+        self.assertEqual(2, len(list(self.cache_dir.glob("*.bin"))))
+
+        cache.invalidate(path=self.path)
+        self.assertEqual(0, len(list(self.cache_dir.glob("*.bin"))))
+
+        cache.read_table(path=self.path, table_name="Table1", ci=False, data_only=True)
+        cache.clear()
+        self.assertEqual(0, len(list(self.cache_dir.glob("*.bin"))))
+
+    def test_eviction(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        cache.read_table(path=self.path, table_name="Table1", ci=False, data_only=True)
+        (entry,) = self.cache_dir.glob("*.bin")
+
+        # Room for about one entry.
+        cache.max_bytes = entry.stat().st_size + 10
+        cache.read_table(path=self.path, table_name="Table2", ci=False, data_only=True)
+        (newest,) = self.cache_dir.glob("*.bin")
+        self.assertNotEqual(entry, newest)
+
+    def test_corrupt_entry(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        expected = list(
+            cache.read_table(
+                path=self.path, table_name="Table1", ci=False, data_only=True
+            )
+        )
+        (entry,) = self.cache_dir.glob("*.bin")
+        data = entry.read_bytes()
+
+        for name, corrupt in [
+            ("empty", b""),
+            ("truncated", data[: len(data) // 2]),
+            ("garbage", data[:40] + b"garbage"),
+            ("not an entry", b"garbage"),
+        ]:
+            with self.subTest(name):
+                entry.write_bytes(corrupt)
+
+                # The entry is a miss, and it is replaced.
+                with patch(
+                    "aa_py_openpyxl_util._disk_cache.safe_load_workbook",
+                    wraps=safe_load_workbook,
+                ) as load:
+                    actual = list(
+                        cache.read_table(
+                            path=self.path,
+                            table_name="Table1",
+                            ci=False,
+                            data_only=True,
+                        )
+                    )
+                self.assertEqual(expected, actual)
+                self.assertEqual(1, load.call_count)
+                self.assertEqual(data, entry.read_bytes())
+
+    def test_entry_removed_after_reading(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        expected = list(
+            cache.read_table(
+                path=self.path, table_name="Table1", ci=False, data_only=True
+            )
+        )
+
+        # Another process evicts the entry between reading it and marking it as used.
+        with patch(
+            "aa_py_openpyxl_util._disk_cache.os.utime", side_effect=FileNotFoundError
+        ):
+            actual = list(
+                cache.read_table(
+                    path=self.path, table_name="Table1", ci=False, data_only=True
+                )
+            )
+        self.assertEqual(expected, actual)
+
+    def test_failed_write(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+
+        with patch(
+            "aa_py_openpyxl_util._disk_cache.os.replace", side_effect=OSError("Full")
+        ):
+            with self.assertRaises(OSError):
+                cache.read_table(
+                    path=self.path, table_name="Table1", ci=False, data_only=True
+                )
+
+        # The temporary file is removed.
+        self.assertEqual([], list(self.cache_dir.iterdir()))
+
+    def test_values_that_cant_be_stored(self) -> None:
+        cache = TableCache(cache_dir=self.cache_dir, max_bytes=1_000_000)
+        table = TableValues(header=("a",), rows=[(object(),)])
+
+        actual = cache._get(
+            path=self.path, request=("test",), data_only=True, load=lambda _: [table]
+        )
+        self.assertEqual([table], actual)
+        self.assertEqual([], list(self.cache_dir.glob("*.bin")))
+
+
+class TestCacheFormat(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        tables = [
+            TableValues(
+                header=("none", "int", "float", "str", "mixed"),
+                rows=[
+                    (None, 1, 1.5, "a", None),
+                    (None, -(2**63), float("inf"), "", True),
+                    (None, 2**63 - 1, -0.0, "\u00e9\U0001f600", 2**64),
+                    (None, 0, 2.0, "\ud800", datetime(2020, 1, 2, 3, 4, 5, 6)),
+                    (None, 5, 3.0, "b", date(1, 1, 1)),
+                    (None, 6, 4.0, "c", time(23, 59, 59, 999999)),
+                    (None, 7, 5.0, "d", timedelta(days=-1, microseconds=1)),
+                    (None, 8, 6.0, "e", "text"),
+                    (None, 9, 7.0, "f", 2**53 + 1),
+                    (None, 10, 8.0, "g", 0.1),
+                ],
+            ),
+            TableValues(header=("a", "b"), rows=[]),
+            TableValues(header=(), rows=[(), ()]),
+        ]
+
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir, "tables.bin")
+            with path.open("wb") as f:
+                write_tables(f, tables)
+            actual = read_tables(path)
+
+        self.assertEqual(tables, actual)
+        for expected_table, actual_table in zip(tables, actual):
+            for expected_row, actual_row in zip(expected_table.rows, actual_table.rows):
+                self.assertEqual(
+                    list(map(type, expected_row)), list(map(type, actual_row))
+                )
+
+    def test_values_that_cant_be_stored(self) -> None:
+        from datetime import timezone
+        from io import BytesIO
+
+        from openpyxl.worksheet.formula import ArrayFormula
+
+        for value in [
+            ArrayFormula("A1:A2", "=1"),
+            datetime(2020, 1, 1, tzinfo=timezone.utc),
+            object(),
+        ]:
+            with self.subTest(value):
+                with self.assertRaises(ValueError):
+                    write_tables(
+                        BytesIO(), [TableValues(header=("a",), rows=[(value,)])]
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
@@ -1,8 +1,20 @@
 import unittest
 from datetime import datetime
+from logging import WARNING
 from pathlib import Path
+from unittest.mock import patch
 
-from aa_py_openpyxl_util import safe_load_workbook, extract_data_from_numbered_tables
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import _cells
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    extract_data_from_numbered_tables,
+    read_table,
+    read_table_batches,
+    ReadDiagnostics,
+)
 
 repo_dir = Path(__file__).parent.parent
 data_dir = repo_dir / "test_data/extract"
@@ -10,35 +22,282 @@ data_dir = repo_dir / "test_data/extract"
 
 class TestExtractDataFromNumberedTables(unittest.TestCase):
     def test_missing_table(self) -> None:
-        with safe_load_workbook(
-            path=data_dir / "empty.xlsx",
-            read_only=False,  # Because openpyxl can't find ListObjects in read-only mode!
-            data_only=True,
-        ) as book:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir / "empty.xlsx",
+                    read_only=read_only,
+                    data_only=True,
+                ) as book:
+                    results = list(
+                        extract_data_from_numbered_tables(book=book, base_name="Table")
+                    )
+                    self.assertEqual([], results)
+
+    def test_dates(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir / "dates.xlsx",
+                    read_only=read_only,
+                    data_only=True,
+                ) as book:
+                    results = list(
+                        extract_data_from_numbered_tables(book=book, base_name="Table")
+                    )
+                    self.assertEqual(
+                        [
+                            {
+                                "DateValues": datetime(2024, 1, 15, 0, 0, tzinfo=None),
+                                "DateFormulas": datetime(
+                                    2024, 1, 15, 0, 0, tzinfo=None
+                                ),
+                            },
+                            {
+                                "DateValues": datetime(
+                                    2024, 1, 15, 10, 30, tzinfo=None
+                                ),
+                                "DateFormulas": datetime(
+                                    2024, 1, 15, 10, 30, tzinfo=None
+                                ),
+                            },
+                        ],
+                        results,
+                    )
+
+
+class TestReadTable(unittest.TestCase):
+    def test_carriage_return(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        sheet.append(["Key", "Value"])
+        sheet.append(["a", "one_x000D_\ntwo"])
+        sheet.append(["b", "three"])
+        book.defined_names.add(DefinedName(name="Table1", attr_text="Sheet1!$A$1:$B$3"))
+
+        with self.assertLogs(level=WARNING) as logs:
+            results = list(read_table(book=book, table_name="Table1"))
+
+        self.assertEqual(
+            [{"Key": "a", "Value": "one\ntwo"}, {"Key": "b", "Value": "three"}],
+            results,
+        )
+        self.assertEqual(
+            [
+                "Cell B2 contains a carriage return. "
+                "This is not supported. Please replace the carriage return with a newline."
+            ],
+            [r.message for r in logs.records],
+        )
+
+    def test_diagnostics(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        sheet.append(["Key", "Value"])
+        for i in range(10):
+            sheet.append([f"a_x000D_\n{i}", f"b_x000D_\n{i}_x0009_"])
+        sheet.append(["c", "literal _x005F_x000D_"])
+        book.defined_names.add(
+            DefinedName(name="Table1", attr_text="Sheet1!$A$1:$B$12")
+        )
+
+        diagnostics = ReadDiagnostics(max_samples=2)
+        with self.assertNoLogs(level=WARNING):
             results = list(
-                extract_data_from_numbered_tables(book=book, base_name="Table")
+                read_table(book=book, table_name="Table1", diagnostics=diagnostics)
             )
-            self.assertEqual([], results)
 
-    def test_dates(self) -> None:
-        with safe_load_workbook(
-            path=data_dir / "dates.xlsx",
-            read_only=False,  # Because openpyxl can't find ListObjects in read-only mode!
-            data_only=True,
-        ) as book:
+        self.assertEqual({"Key": "a\n0", "Value": "b\n0\t"}, results[0])
+        self.assertEqual({"Key": "c", "Value": "literal _x000D_"}, results[-1])
+        self.assertEqual(
+            {("Table1", "A"): 10, ("Table1", "B"): 10}, diagnostics.carriage_returns
+        )
+
+        with self.assertLogs(level=WARNING) as logs:
+            diagnostics.log_summary()
+
+        self.assertEqual(
+            [
+                "Cells contain carriage returns. This is not supported. "
+                "Please replace the carriage returns with newlines. "
+                "Table1 column A: 10 cells, e.g. A2, A3; "
+                "Table1 column B: 10 cells, e.g. B2, B3."
+            ],
+            [r.message for r in logs.records],
+        )
+
+    def test_numbered_named_ranges(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        for row in [["x"], [1], [None], ["x"], [2], ["X"], [3]]:
+            sheet.append(row)
+        for name, attr_text in [
+            ("Data10", "Sheet1!$A$6:$A$7"),
+            ("Data", "Sheet1!$A$1:$A$2"),
+            ("Data2", "Sheet1!$A$4:$A$5"),
+            ("Other1", "Sheet1!$A$1:$A$7"),
+        ]:
+            book.defined_names.add(DefinedName(name=name, attr_text=attr_text))
+
+        self.assertEqual(
+            [{"x": 1}, {"x": 2}, {"x": 3}],
+            list(extract_data_from_numbered_tables(book=book, base_name="data")),
+        )
+
+
+class TestReadTableColumnProjection(unittest.TestCase):
+    def create_book(self) -> Workbook:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        sheet["A1"], sheet["B1"], sheet["C1"], sheet["D1"], sheet["E1"] = "abcde"
+        sheet["A2"], sheet["C2"], sheet["E2"] = 1, 2, "x_x000D_\ny"
+        sheet["A3"], sheet["C3"] = 3, 4
+        sheet["C4"] = 5
+        book.defined_names.add(DefinedName(name="Table1", attr_text="Sheet1!$A$1:$E$4"))
+        return book
+
+    def test_only_requested_cells_are_accessed(self) -> None:
+        book = self.create_book()
+        sheet = book["Sheet1"]
+
+        with (
+            self.assertLogs(level=WARNING) as logs,
+            patch.object(
+                _cells, "iter_existing_values", wraps=_cells.iter_existing_values
+            ) as iter_values,
+        ):
             results = list(
-                extract_data_from_numbered_tables(book=book, base_name="Table")
+                read_table(book=book, table_name="Table1", columns=["E", "a"])
             )
+
+        self.assertEqual(
+            [{"E": "x\ny", "a": 1}, {"E": None, "a": 3}, {"E": None, "a": None}],
+            results,
+        )
+        self.assertEqual(
+            [
+                "Cell E2 contains a carriage return. "
+                "This is not supported. Please replace the carriage return with a newline."
+            ],
+            [r.message for r in logs.records],
+        )
+
+        # After the header, only the requested columns were read, not column C.
+        self.assertEqual(
+            [(1, 1, 5), (2, 1, 1), (2, 5, 5)],
+            [
+                (c.kwargs["min_row"], c.kwargs["min_col"], c.kwargs["max_col"])
+                for c in iter_values.call_args_list
+            ],
+        )
+
+        # No cells were created in the empty columns which were not requested.
+        for row in [2, 3, 4]:
+            for col in [2, 4]:
+                self.assertNotIn((row, col), sheet._cells)
+
+    def test_missing_column(self) -> None:
+        book = self.create_book()
+        with self.assertRaises(KeyError):
+            list(read_table(book=book, table_name="Table1", columns=["a", "z"]))
+
+
+class TestExtractIsLazy(unittest.TestCase):
+    def test_tables_are_read_one_at_a_time(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        for row in [["x", "y"], [1, 10], [2, 20], [3, 30]]:
+            sheet.append(row)
+        for name, attr_text in [
+            ("Data2", "Sheet1!$A$1:$A$3"),
+            ("Data1", "Sheet1!$A$1:$A$2"),
+            ("Other", "Sheet1!$B$1:$B$4"),
+        ]:
+            book.defined_names.add(DefinedName(name=name, attr_text=attr_text))
+
+        with patch.object(
+            _cells, "iter_existing_values", wraps=_cells.iter_existing_values
+        ) as iter_values:
+            g = extract_data_from_numbered_tables(book=book, base_name="Data")
+            self.assertEqual(0, iter_values.call_count)
+
+            self.assertEqual({"x": 1}, next(g))
             self.assertEqual(
                 [
-                    {
-                        "DateValues": datetime(2024, 1, 15, 0, 0, tzinfo=None),
-                        "DateFormulas": datetime(2024, 1, 15, 0, 0, tzinfo=None),
-                    },
-                    {
-                        "DateValues": datetime(2024, 1, 15, 10, 30, tzinfo=None),
-                        "DateFormulas": datetime(2024, 1, 15, 10, 30, tzinfo=None),
-                    },
+                    (
+                        (),
+                        dict(sheet=sheet, min_row=1, max_row=2, min_col=1, max_col=1),
+                    )
                 ],
-                results,
+                iter_values.call_args_list,
+            )
+
+            self.assertEqual([{"x": 1}, {"x": 2}], list(g))
+            self.assertEqual(2, iter_values.call_count)
+
+
+class TestReadTableBatches(unittest.TestCase):
+    def create_book(self) -> Workbook:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        for row in [
+            ["a", "b", "A"],
+            [1, 2, 3],
+            [None, None, None],
+            [4, 5, 6],
+            [7, 8, 9],
+        ]:
+            sheet.append(row)
+        book.defined_names.add(DefinedName(name="Table1", attr_text="Sheet1!$A$1:$C$5"))
+        return book
+
+    def test_batches(self) -> None:
+        book = self.create_book()
+        self.assertEqual(
+            [
+                (("a", "b"), [(3, 2), (None, None)]),
+                (("a", "b"), [(6, 5), (9, 8)]),
+            ],
+            list(
+                read_table_batches(
+                    book=book, table_name="Table1", batch_size=2, ci=False
+                )
+            ),
+        )
+
+    def test_same_rows_as_read_table(self) -> None:
+        book = self.create_book()
+        for columns in [None, ["B"]]:
+            with self.subTest(columns=columns):
+                expected = [
+                    tuple(row.values())
+                    for row in read_table(
+                        book=book, table_name="Table1", columns=columns
+                    )
+                ]
+                batches = list(
+                    read_table_batches(
+                        book=book,
+                        table_name="Table1",
+                        batch_size=100,
+                        columns=columns,
+                        ci=False,
+                    )
+                )
+                self.assertEqual(1, len(batches))
+                self.assertEqual(expected, batches[0][1])
+
+    def test_invalid_batch_size(self) -> None:
+        book = self.create_book()
+        with self.assertRaises(ValueError):
+            next(
+                read_table_batches(
+                    book=book, table_name="Table1", batch_size=0, ci=False
+                )
             )
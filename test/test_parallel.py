@@ -0,0 +1,150 @@
+import gc
+import sys
+import unittest
+import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List
+from unittest.mock import patch
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    safe_load_workbook_parallel,
+    read_table,
+    read_tables,
+    extract_data_from_numbered_tables,
+)
+from aa_py_openpyxl_util._grid_worksheet import GridWorksheet
+
+# noinspection PyProtectedMember
+from aa_py_openpyxl_util._parallel import _init_worker, parse_value_grid
+
+data_dir = this_dir().parent.joinpath("test_data")
+table_names = ["Table1", "Table2", "FooBar1", "FooBar2"]
+
+
+class TestSafeLoadWorkbookParallel(unittest.TestCase):
+    def setUp(self) -> None:
+        # Fail on file handles that are left open, e.g. the archive of the workbook.
+        # ResourceWarning is raised when a file is garbage collected, so it is reported through sys.unraisablehook.
+        unraisable: List[Any] = []
+        catch_warnings = warnings.catch_warnings()
+        catch_warnings.__enter__()
+        warnings.simplefilter("error", ResourceWarning)
+
+        def cleanup() -> None:
+            gc.collect()
+            catch_warnings.__exit__(None, None, None)
+            self.assertEqual([], [u.exc_value for u in unraisable])
+
+        self.addCleanup(cleanup)
+        self.addCleanup(setattr, sys, "unraisablehook", sys.unraisablehook)
+        sys.unraisablehook = unraisable.append
+
+    def test_workers_are_not_forked(self) -> None:
+        with patch(
+            "concurrent.futures.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as executor:
+            with safe_load_workbook_parallel(
+                path=data_dir.joinpath("tables.xlsx"), data_only=True, workers=1
+            ) as book:
+                self.assertEqual(
+                    [{"a": 1, "b": 2}, {"a": 3, "b": 4}],
+                    list(read_table(book=book, table_name="Table1", ci=False)),
+                )
+
+        self.assertNotEqual(
+            "fork", executor.call_args.kwargs["mp_context"].get_start_method()
+        )
+
+    def test_same_result_as_read_only(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=True,
+        ) as book:
+            expected = read_tables(book=book, table_names=table_names, ci=False)
+            expected_numbered = list(
+                extract_data_from_numbered_tables(book=book, base_name="FooBar")
+            )
+
+        with safe_load_workbook_parallel(
+            path=data_dir.joinpath("tables.xlsx"),
+            data_only=True,
+            workers=2,
+        ) as book:
+            for sheet in book.worksheets:
+                self.assertIsInstance(sheet, GridWorksheet)
+
+            # The values come from the grids, without parsing the sheets again.
+            with patch(
+                "openpyxl.worksheet._reader.WorkSheetParser.parse",
+                side_effect=AssertionError("Sheets should not be parsed again."),
+            ):
+                self.assertEqual(
+                    expected,
+                    read_tables(book=book, table_names=table_names, ci=False),
+                )
+                for name in table_names:
+                    self.assertEqual(
+                        expected[name],
+                        list(read_table(book=book, table_name=name, ci=False)),
+                    )
+                self.assertEqual(
+                    expected_numbered,
+                    list(
+                        extract_data_from_numbered_tables(book=book, base_name="FooBar")
+                    ),
+                )
+
+            # Cells are still available.
+            self.assertEqual("a", book["Sheet1"]["B2"].value)
+
+    def test_max_memory(self) -> None:
+        with safe_load_workbook_parallel(
+            path=data_dir.joinpath("tables.xlsx"),
+            data_only=True,
+            workers=1,
+            max_memory=0,
+        ) as book:
+            for sheet in book.worksheets:
+                self.assertNotIsInstance(sheet, GridWorksheet)
+            self.assertEqual(
+                [{"a": 1, "b": 2}, {"a": 3, "b": 4}],
+                list(read_table(book=book, table_name="Table1", ci=False)),
+            )
+
+
+class TestWorker(unittest.TestCase):
+    def test_archive_is_closed(self) -> None:
+        archives: List[zipfile.ZipFile] = []
+
+        class ZipFile(zipfile.ZipFile):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                archives.append(self)
+
+        path = data_dir.joinpath("tables.xlsx")
+        with safe_load_workbook(path=path, read_only=True, data_only=True) as book:
+            # noinspection PyProtectedMember
+            worksheet_path = book["Sheet1"]._worksheet_path
+            # noinspection PyProtectedMember
+            date_formats = set(book._date_formats)
+            epoch = book.epoch
+
+        # Run the worker in this process.
+        with patch.object(zipfile, "ZipFile", ZipFile):
+            _init_worker(path, True, epoch, date_formats)
+            grid = parse_value_grid(worksheet_path)
+
+        first, values = grid[2]
+        self.assertEqual((2, "a"), (first, values[0]))
+        self.assertTrue(archives)
+        for archive in archives:
+            self.assertIsNone(archive.fp)
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
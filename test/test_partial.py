@@ -0,0 +1,65 @@
+import unittest
+
+from locate import this_dir
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.worksheet import Worksheet
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    safe_load_workbook_for_tables,
+    read_table,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestSafeLoadWorkbookForTables(unittest.TestCase):
+    def test_only_needed_sheets_are_parsed(self) -> None:
+        with safe_load_workbook_for_tables(
+            path=data_dir.joinpath("tables.xlsx"),
+            table_names=["table1"],
+            data_only=False,
+        ) as book:
+            self.assertEqual(["Sheet1", "Sheet2"], book.sheetnames)
+            self.assertIsInstance(book["Sheet1"], Worksheet)
+            self.assertIsInstance(book["Sheet2"], ReadOnlyWorksheet)
+
+    def test_list_object(self) -> None:
+        with safe_load_workbook_for_tables(
+            path=data_dir.joinpath("tables.xlsx"),
+            table_names=lambda name: name == "FooBar1",
+            data_only=False,
+        ) as book:
+            self.assertIsInstance(book["Sheet1"], ReadOnlyWorksheet)
+            self.assertIsInstance(book["Sheet2"], Worksheet)
+
+    def test_same_result_as_full_load(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=False,
+            data_only=False,
+        ) as book:
+            expected = {
+                name: list(read_table(book=book, table_name=name, ci=False))
+                for name in ["Table1", "Table2", "FooBar1", "FooBar2"]
+            }
+
+        with safe_load_workbook_for_tables(
+            path=data_dir.joinpath("tables.xlsx"),
+            table_names=["Table1"],
+            data_only=False,
+        ) as book:
+            self.assertEqual(
+                {"FooBar2", "SingleCell1", "SingleRow1", "Table1"},
+                set(book.defined_names.keys()),
+            )
+            # Tables on the streamed sheets can still be read.
+            for name, rows in expected.items():
+                with self.subTest(name=name):
+                    self.assertEqual(
+                        rows, list(read_table(book=book, table_name=name, ci=False))
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
@@ -0,0 +1,134 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from locate import this_dir
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+
+from aa_py_openpyxl_util import (
+    get_cell_values,
+    safe_load_workbook,
+    read_table,
+    read_tables,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestReadTables(unittest.TestCase):
+    def test_same_as_read_table(self) -> None:
+        names = ["Table1", "Table2", "FooBar1", "FooBar2"]
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=False,
+                ) as book:
+                    expected = {
+                        name: list(read_table(book=book, table_name=name))
+                        for name in names
+                    }
+                    actual = read_tables(book=book, table_names=names, ci=False)
+                    self.assertEqual(names, list(actual.keys()))
+                    self.assertEqual(expected, actual)
+
+    def test_columns(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            self.assertEqual(
+                {
+                    "table2": [{"d": 2}],
+                    "Table1": list(read_table(book=book, table_name="Table1")),
+                },
+                read_tables(
+                    book=book,
+                    table_names=["table2", "Table1"],
+                    columns={"table2": ["D"]},
+                    ci=True,
+                ),
+            )
+
+    def test_repeated_names(self) -> None:
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with safe_load_workbook(
+                    path=data_dir.joinpath("tables.xlsx"),
+                    read_only=read_only,
+                    data_only=False,
+                ) as book:
+                    self.assertEqual(
+                        {
+                            "Table1": list(read_table(book=book, table_name="Table1")),
+                            "Table2": list(read_table(book=book, table_name="Table2")),
+                        },
+                        read_tables(
+                            book=book,
+                            table_names=["Table1", "Table2", "Table1"],
+                            ci=False,
+                        ),
+                    )
+
+    def test_empty_rows(self) -> None:
+        book = Workbook()
+        sheet = book.active
+        sheet.title = "Sheet1"
+        for row in [["a", "b"], [1, 10], [None, 20], [None, None], [3, 30]]:
+            sheet.append(row)
+        # The range extends below the last row of the sheet.
+        book.defined_names.add(DefinedName(name="Table1", attr_text="Sheet1!$A$1:$B$7"))
+
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir, "test.xlsx")
+            book.save(path)
+
+            # In read-only mode, openpyxl does not yield the rows below the last row of the sheet.
+            for read_only, n_rows in [(False, 6), (True, 4)]:
+                with self.subTest(read_only=read_only):
+                    with safe_load_workbook(
+                        path=path, read_only=read_only, data_only=False
+                    ) as book:
+                        # The same rows as the cells of the table, including the empty ones.
+                        header, *rows = get_cell_values(book["Sheet1"]["A1:B7"])
+                        expected = [dict(zip(header, row)) for row in rows]
+                        self.assertEqual(n_rows, len(expected))
+
+                        self.assertEqual(
+                            expected, list(read_table(book=book, table_name="Table1"))
+                        )
+                        self.assertEqual(
+                            [{"a": row["a"]} for row in expected],
+                            list(
+                                read_table(
+                                    book=book, table_name="Table1", columns=["a"]
+                                )
+                            ),
+                        )
+                        self.assertEqual(
+                            {"Table1": [{"a": row["a"]} for row in expected]},
+                            read_tables(
+                                book=book,
+                                table_names=["Table1"],
+                                columns={"Table1": ["a"]},
+                                ci=False,
+                            ),
+                        )
+
+    def test_missing_table(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            with self.assertRaises(KeyError):
+                read_tables(book=book, table_names=["Table1", "Table999"], ci=False)
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import scan_workbook, ScannedTable
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestScanWorkbook(unittest.TestCase):
+    def test_tables(self) -> None:
+        self.assertEqual(
+            [
+                ScannedTable(
+                    name="FooBar2",
+                    table_type="Named range",
+                    sheet_name="Sheet2",
+                    table_range="$F$2:$H$5",
+                    boundaries=(6, 2, 8, 5),
+                ),
+                ScannedTable(
+                    name="Table1",
+                    table_type="Named range",
+                    sheet_name="Sheet1",
+                    table_range="$B$2:$C$4",
+                    boundaries=(2, 2, 3, 4),
+                ),
+                ScannedTable(
+                    name="Table2",
+                    table_type="ListObject",
+                    sheet_name="Sheet1",
+                    table_range="E2:F3",
+                    boundaries=(5, 2, 6, 3),
+                ),
+                ScannedTable(
+                    name="FooBar1",
+                    table_type="ListObject",
+                    sheet_name="Sheet2",
+                    table_range="B2:D5",
+                    boundaries=(2, 2, 4, 5),
+                ),
+            ],
+            scan_workbook(path=data_dir.joinpath("tables.xlsx")),
+        )
+
+    def test_no_cells_are_read(self) -> None:
+        with (
+            patch(
+                "openpyxl.worksheet._reader.WorkSheetParser.parse",
+                side_effect=AssertionError("Cells should not be read."),
+            ),
+            patch(
+                "openpyxl.reader.strings.read_string_table",
+                side_effect=AssertionError("Shared strings should not be read."),
+            ),
+        ):
+            self.assertEqual(
+                4, len(scan_workbook(path=data_dir.joinpath("tables.xlsx")))
+            )
+
+    def test_headers(self) -> None:
+        self.assertEqual(
+            {
+                "FooBar2": ("l", "m", "n"),
+                "Table1": ("a", "b"),
+                "Table2": ("c", "d"),
+                "FooBar1": ("i", "j", "k"),
+            },
+            {
+                table.name: table.header
+                for table in scan_workbook(
+                    path=data_dir.joinpath("tables.xlsx"), headers=True
+                )
+            },
+        )
+
+    def test_empty(self) -> None:
+        self.assertEqual(
+            [],
+            scan_workbook(
+                path=data_dir.joinpath("extract", "empty.xlsx"), headers=True
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
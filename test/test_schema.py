@@ -0,0 +1,109 @@
+import unittest
+from datetime import date, datetime
+
+from openpyxl import Workbook
+
+from aa_py_openpyxl_util import (
+    ColumnSchema,
+    SchemaError,
+    read_typed_table,
+)
+
+
+def make_book() -> Workbook:
+    from openpyxl.workbook.defined_name import DefinedName
+
+    book = Workbook()
+    sheet = book.active
+    sheet.title = "Sheet1"
+    for row in [
+        ("id", "amount", "code", "start", "flag"),
+        (1, "12.5", 100, datetime(2024, 1, 15), True),
+        (None, None, None, None, None),
+        ("2", 3, "A1", 45307, "false"),
+        (3.0, 4.25, None, "2024-01-17", 1),
+    ]:
+        sheet.append(row)
+    book.defined_names["Data"] = DefinedName("Data", attr_text="Sheet1!$A$1:$E$5")
+    return book
+
+
+class TestReadTypedTable(unittest.TestCase):
+    def test_conversion(self) -> None:
+        rows = read_typed_table(
+            book=make_book(),
+            table_name="data",
+            schema={
+                "start": ColumnSchema(date),
+                "id": ColumnSchema(int, nullable=False),
+                "amount": ColumnSchema(float),
+                "code": ColumnSchema(str, default=""),
+                "flag": ColumnSchema(bool),
+            },
+            ci=True,
+        )
+        self.assertEqual(3, len(rows))
+        self.assertEqual(["start", "id", "amount", "code", "flag"], list(rows[0]))
+        self.assertEqual(
+            [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)],
+            [row["start"] for row in rows],
+        )
+        self.assertEqual([1, 2, 3], [row["ID"] for row in rows])
+        self.assertEqual([12.5, 3.0, 4.25], [row["amount"] for row in rows])
+        self.assertEqual(["100", "A1", ""], [row["code"] for row in rows])
+        self.assertEqual([True, False, True], [row["flag"] for row in rows])
+
+    def test_str(self) -> None:
+        rows = read_typed_table(
+            book=make_book(),
+            table_name="Data",
+            schema={"start": ColumnSchema(str)},
+            ci=False,
+        )
+        self.assertEqual(
+            ["2024-01-15 00:00:00", "45307", "2024-01-17"],
+            [row["start"] for row in rows],
+        )
+
+    def test_errors_are_collected_per_column(self) -> None:
+        with self.assertRaises(SchemaError) as cm:
+            read_typed_table(
+                book=make_book(),
+                table_name="Data",
+                schema={
+                    "id": ColumnSchema(int),
+                    "code": ColumnSchema(int, nullable=False),
+                    "amount": ColumnSchema(date),
+                },
+                ci=False,
+            )
+
+        errors = cm.exception.errors
+        self.assertEqual(["code", "amount"], list(errors))
+        self.assertEqual([4, 5], [e.row_number for e in errors["code"]])
+        self.assertEqual(["A1", None], [e.value for e in errors["code"]])
+        self.assertEqual([2], [e.row_number for e in errors["amount"]])
+
+    def test_unsupported_type(self) -> None:
+        with self.assertRaises(TypeError):
+            read_typed_table(
+                book=make_book(),
+                table_name="Data",
+                schema={"id": ColumnSchema(complex)},
+                ci=False,
+            )
+
+    def test_missing_column(self) -> None:
+        with self.assertRaises(KeyError):
+            read_typed_table(
+                book=make_book(),
+                table_name="Data",
+                schema={"missing": ColumnSchema(int)},
+                ci=False,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
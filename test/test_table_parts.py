@@ -0,0 +1,78 @@
+import unittest
+
+from locate import this_dir
+from openpyxl import load_workbook
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    attach_list_objects,
+    find_table,
+    iter_list_object_tables,
+    read_table,
+)
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestAttachListObjects(unittest.TestCase):
+    def test_safe_load_workbook(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            self.assertEqual(["Table2"], list(book["Sheet1"].tables.keys()))
+            self.assertEqual(["FooBar1"], list(book["Sheet2"].tables.keys()))
+            self.assertEqual("B2:D5", book["Sheet2"].tables["FooBar1"].ref)
+
+    def test_load_workbook(self) -> None:
+        book = load_workbook(
+            filename=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+        )
+        try:
+            self.assertFalse(hasattr(book["Sheet1"], "tables"))
+            attach_list_objects(book=book)
+            self.assertEqual(["Table2"], list(book["Sheet1"].tables.keys()))
+        finally:
+            book.close()
+
+    def test_no_table_parts(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("extract/empty.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            for sheet in book.worksheets:
+                self.assertEqual({}, sheet.tables)
+
+    def test_find_and_read(self) -> None:
+        with safe_load_workbook(
+            path=data_dir.joinpath("tables.xlsx"),
+            read_only=True,
+            data_only=False,
+        ) as book:
+            sheet, table_range = find_table(book=book, name="table2", ci=True)
+            self.assertEqual("Sheet1", sheet.title)
+            self.assertEqual("E2:F3", table_range)
+
+            self.assertEqual(
+                [("Sheet1", "Table2", "E2:F3"), ("Sheet2", "FooBar1", "B2:D5")],
+                [
+                    (s.title, t.name, t.ref)
+                    for s, t in iter_list_object_tables(
+                        book=book, exclude_list_objects=[], exclude_sheets=[]
+                    )
+                ],
+            )
+
+            self.assertEqual(
+                [{"c": 1, "d": 2}],
+                list(read_table(book=book, table_name="Table2")),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
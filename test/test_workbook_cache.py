@@ -0,0 +1,138 @@
+import os
+import shutil
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest.mock import patch
+
+from locate import this_dir
+
+from aa_py_openpyxl_util import WorkbookCache, read_table
+from aa_py_openpyxl_util._context import open_workbook
+
+data_dir = this_dir().parent.joinpath("test_data")
+
+
+class TestWorkbookCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name, "tables.xlsx")
+        shutil.copy(data_dir.joinpath("tables.xlsx"), self.path)
+
+    def test_reuse(self) -> None:
+        cache = WorkbookCache(max_count=2)
+        self.addCleanup(cache.clear)
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                with cache.safe_load_workbook(
+                    path=self.path, read_only=read_only, data_only=True, copy=False
+                ) as book1:
+                    pass
+                with cache.safe_load_workbook(
+                    path=self.path, read_only=read_only, data_only=True, copy=False
+                ) as book2:
+                    self.assertIs(book1, book2)
+                    self.assertEqual(
+                        [{"a": 1, "b": 2}, {"a": 3, "b": 4}],
+                        list(read_table(book=book2, table_name="Table1", ci=False)),
+                    )
+        self.assertEqual(2, len(cache))
+
+    def test_changed_workbook(self) -> None:
+        cache = WorkbookCache(max_count=2)
+        self.addCleanup(cache.clear)
+        with cache.safe_load_workbook(
+            path=self.path, read_only=False, data_only=True, copy=False
+        ) as book1:
+            pass
+
+        shutil.copy(data_dir.joinpath("extract", "dates.xlsx"), self.path)
+        with cache.safe_load_workbook(
+            path=self.path, read_only=False, data_only=True, copy=False
+        ) as book2:
+            self.assertIsNot(book1, book2)
+        self.assertEqual(1, len(cache))
+
+    def test_eviction_closes_read_only_workbooks(self) -> None:
+        cache = WorkbookCache(max_count=1)
+        self.addCleanup(cache.clear)
+        with cache.safe_load_workbook(
+            path=self.path, read_only=True, data_only=True
+        ) as book1:
+            # Evicted while in use: it stays open until it is released.
+            with cache.safe_load_workbook(
+                path=self.path, read_only=True, data_only=False
+            ):
+                self.assertEqual(1, len(cache))
+            self.assertEqual("a", book1["Sheet1"]["B2"].value)
+
+        with self.assertRaises(ValueError):
+            # Reading from a closed archive fails.
+            book1["Sheet1"]["B2"].value
+
+    def test_max_memory(self) -> None:
+        cache = WorkbookCache(max_count=10, max_memory=1)
+        self.addCleanup(cache.clear)
+        with cache.safe_load_workbook(path=self.path, read_only=True, data_only=True):
+            pass
+        self.assertEqual(0, len(cache))
+
+    def test_copy(self) -> None:
+        cache = WorkbookCache(max_count=1)
+        self.addCleanup(cache.clear)
+
+        # Workbooks in normal mode are copied by default.
+        with cache.safe_load_workbook(
+            path=self.path, read_only=False, data_only=True
+        ) as copy:
+            copy["Sheet1"]["B2"].value = "changed"
+
+        for kwargs in [{}, {"copy": True}, {"copy": False}]:
+            with self.subTest(**kwargs):
+                with cache.safe_load_workbook(
+                    path=self.path, read_only=False, data_only=True, **kwargs
+                ) as book:
+                    self.assertIsNot(copy, book)
+                    self.assertEqual("a", book["Sheet1"]["B2"].value)
+
+        with self.assertRaises(ValueError):
+            with cache.safe_load_workbook(
+                path=self.path, read_only=True, data_only=True, copy=True
+            ):
+                pass
+
+    def test_replaced_while_loading(self) -> None:
+        cache = WorkbookCache(max_count=2)
+        self.addCleanup(cache.clear)
+        replacement = Path(self.temp_dir.name, "replacement.xlsx")
+        shutil.copy(data_dir.joinpath("extract", "dates.xlsx"), replacement)
+
+        def replace_and_open(**kwargs: Any) -> Any:
+            os.replace(replacement, self.path)
+            return open_workbook(**kwargs)
+
+        for read_only in [False, True]:
+            with self.subTest(read_only=read_only):
+                shutil.copy(data_dir.joinpath("tables.xlsx"), self.path)
+                shutil.copy(data_dir.joinpath("extract", "dates.xlsx"), replacement)
+
+                with patch(
+                    "aa_py_openpyxl_util._workbook_cache.open_workbook",
+                    replace_and_open,
+                ):
+                    with cache.safe_load_workbook(
+                        path=self.path, read_only=read_only, data_only=True
+                    ) as book:
+                        # The workbook that was stat'ed is loaded, not its replacement.
+                        self.assertIn("Sheet2", book.sheetnames)
+
+                with cache.safe_load_workbook(
+                    path=self.path, read_only=read_only, data_only=True
+                ) as book:
+                    self.assertNotIn("Sheet2", book.sheetnames)
+
+
+if __name__ == "__main__":
+    unittest.main(failfast=True)
@@ -1,6 +1,11 @@
 import unittest
+from datetime import date, datetime
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill
 
 from aa_py_openpyxl_util import FormattedCell
+from aa_py_openpyxl_util._styles import get_style_interner
 
 
 class TestFormattedCell(unittest.TestCase):
@@ -46,3 +51,68 @@ class TestFormattedCell(unittest.TestCase):
         # ws = book.create_sheet()
         # ws.append([fc.create_openpyxl_cell(ws, "A1")])
         # book.save("too_long.xlsx")
+
+
+class TestCreateOpenpyxlCell(unittest.TestCase):
+    def test_same_as_assigning_styles(self) -> None:
+        book = Workbook(write_only=True)
+        sheet = book.create_sheet()
+        font = Font(bold=True)
+        fill = PatternFill("solid", fgColor="FFFF00")
+
+        cell = FormattedCell(
+            value=1.5, number_format="0.000", font=font, fill=fill
+        ).create_openpyxl_cell(sheet=sheet, ref="A1")
+
+        self.assertEqual(1.5, cell.value)
+        self.assertEqual("0.000", cell.number_format)
+        self.assertEqual(cell.font, font)
+        self.assertEqual(cell.fill, fill)
+
+        plain = FormattedCell(value="x").create_openpyxl_cell(sheet=sheet, ref="A1")
+        self.assertFalse(plain.has_style)
+
+    def test_dates(self) -> None:
+        book = Workbook(write_only=True)
+        sheet = book.create_sheet()
+        font = Font(bold=True)
+
+        # A given number format is kept, even if it is not a date format.
+        cell = FormattedCell(
+            value=datetime(2024, 1, 15, 12), number_format="0.00"
+        ).create_openpyxl_cell(sheet=sheet, ref="A1")
+        self.assertEqual("0.00", cell.number_format)
+
+        # Otherwise, dates get the default format, like without any formatting.
+        for value in [datetime(2024, 1, 15, 12), date(2024, 1, 15)]:
+            with self.subTest(value=value):
+                plain = FormattedCell(value=value).create_openpyxl_cell(
+                    sheet=sheet, ref="A1"
+                )
+                cell = FormattedCell(value=value, font=font).create_openpyxl_cell(
+                    sheet=sheet, ref="A1"
+                )
+                self.assertEqual(plain.number_format, cell.number_format)
+                self.assertNotEqual("General", cell.number_format)
+                self.assertEqual(cell.font, font)
+
+    def test_equal_styles_are_shared(self) -> None:
+        book = Workbook(write_only=True)
+        sheet = book.create_sheet()
+
+        cells = [
+            FormattedCell(
+                value=i, number_format="0.0", font=Font(name="Arial", italic=True)
+            ).create_openpyxl_cell(sheet=sheet, ref="A1")
+            for i in range(3)
+        ]
+
+        self.assertEqual(1, len({c.style_id for c in cells}))
+        interner = get_style_interner(book)
+        self.assertEqual(1, len(interner._by_value))
+
+        # Each cell has its own copy of the style, so changing one does not affect the others.
+        cells[0].number_format = "0.00"
+        self.assertEqual("0.0", cells[1].number_format)
+
+        self.assertIsNot(interner, get_style_interner(Workbook(write_only=True)))
@@ -0,0 +1,188 @@
+import unittest
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy
+from openpyxl import Workbook
+from openpyxl.styles import Font
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+from aa_py_openpyxl_util import (
+    safe_load_workbook,
+    TableInfo,
+    FormattedCell,
+    find_table,
+    write_tables_side_by_side,
+)
+
+# noinspection PyProtectedMember
+from aa_py_openpyxl_util._write_only import stack_table_rows_side_by_side
+
+
+class TestFromColumns(unittest.TestCase):
+    def test_write(self) -> None:
+        bold = Font(bold=True)
+        table = TableInfo.from_columns(
+            name="Table1",
+            columns={
+                "list": [1, float("nan"), "x"],
+                "floats": numpy.array([1.5, numpy.nan, 3]),
+                "ints": array("q", [1, 2, 3]),
+                "dates": numpy.array(
+                    ["2024-01-15T12:00", "NaT", "1900-01-01"], dtype="datetime64[ns]"
+                ),
+                "durations": numpy.array([1, 2, 3], dtype="timedelta64[h]"),
+                "objects": numpy.array(
+                    [numpy.int64(1), numpy.float64("nan"), "y"], dtype=object
+                ),
+            },
+            number_formats={"floats": "0.00"},
+            fonts={"ints": bold},
+        )
+
+        for engine in ["openpyxl", "xml"]:
+            with self.subTest(engine=engine):
+                book = Workbook(write_only=True)
+                with patch.object(table, "get_cell") as get_cell:
+                    write_tables_side_by_side(
+                        book=book,
+                        sheet_name="Sheet1",
+                        tables=[table],
+                        row_margin=0,
+                        col_margin=0,
+                        write_captions=False,
+                        write_pre_rows=False,
+                        engine=engine,  # type: ignore[arg-type]
+                    )
+
+                # The values are written without creating cells.
+                get_cell.assert_not_called()
+
+                with TemporaryDirectory() as tmp_dir:
+                    path = Path(tmp_dir, "test.xlsx")
+                    book.save(path)
+
+                    with safe_load_workbook(
+                        path=path, read_only=False, data_only=False
+                    ) as book:
+                        sheet, table_range = find_table(
+                            book=book, name="Table1", ci=False
+                        )
+                        self.assertEqual("A1:F4", table_range)
+                        values = [
+                            [cell.value for cell in row] for row in sheet["A2:F4"]
+                        ]
+                        self.assertEqual(
+                            [
+                                [
+                                    1,
+                                    1.5,
+                                    1,
+                                    datetime(2024, 1, 15, 12),
+                                    timedelta(hours=1),
+                                    1,
+                                ],
+                                [None, None, 2, None, timedelta(hours=2), None],
+                                [
+                                    "x",
+                                    3,
+                                    3,
+                                    datetime(1900, 1, 1),
+                                    timedelta(hours=3),
+                                    "y",
+                                ],
+                            ],
+                            values,
+                        )
+                        self.assertEqual("0.00", sheet["B2"].number_format)
+                        self.assertTrue(sheet["C2"].font.bold)
+                        self.assertEqual(
+                            "yyyy-mm-dd h:mm:ss", sheet["D2"].number_format
+                        )
+                        self.assertEqual("[hh]:mm:ss", sheet["E2"].number_format)
+
+    def test_get_cell(self) -> None:
+        table = TableInfo.from_columns(
+            name="Table1",
+            columns={"a": [1, 2], "b": numpy.array(["x", "y"])},
+            number_formats={"a": "0.00"},
+        )
+        self.assertEqual(2, table.n_rows)
+        self.assertEqual(FormattedCell(2, number_format="0.00"), table.get_cell(1, 0))
+        self.assertEqual(
+            [
+                [FormattedCell("a"), FormattedCell("b")],
+                [FormattedCell(1, number_format="0.00"), FormattedCell("x")],
+                [FormattedCell(2, number_format="0.00"), FormattedCell("y")],
+            ],
+            list(
+                stack_table_rows_side_by_side(
+                    tables=[table],
+                    row_margin=0,
+                    col_margin=0,
+                    write_captions=False,
+                    write_pre_rows=False,
+                )
+            ),
+        )
+
+    def test_epoch(self) -> None:
+        dates = numpy.array(["2024-01-15T12:00", "1904-01-02"], dtype="datetime64[ns]")
+
+        def write(book: Workbook, table: TableInfo) -> None:
+            write_tables_side_by_side(
+                book=book,
+                sheet_name="Sheet1",
+                tables=[table],
+                row_margin=0,
+                col_margin=0,
+                write_captions=False,
+                write_pre_rows=False,
+            )
+
+        book = Workbook(write_only=True)
+        book.epoch = CALENDAR_MAC_1904
+
+        # The dates were converted for another epoch.
+        with self.assertRaises(ValueError):
+            write(book, TableInfo.from_columns(name="Table1", columns={"d": dates}))
+
+        write(
+            book,
+            TableInfo.from_columns(
+                name="Table1", columns={"d": dates}, epoch=book.epoch
+            ),
+        )
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir, "test.xlsx")
+            book.save(path)
+
+            with safe_load_workbook(
+                path=path, read_only=False, data_only=False
+            ) as book:
+                self.assertEqual(CALENDAR_MAC_1904, book.epoch)
+                self.assertEqual(
+                    [datetime(2024, 1, 15, 12), datetime(1904, 1, 2)],
+                    [row[0].value for row in book["Sheet1"]["A2:A3"]],
+                )
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            TableInfo.from_columns(name="Table1", columns={"a": [1, 2], "b": [1]})
+
+        with self.assertRaises(ValueError):
+            TableInfo.from_columns(
+                name="Table1", columns={"a": [1]}, number_formats={"b": "0.00"}
+            )
+
+        with self.assertRaises(ValueError):
+            TableInfo.from_columns(name="Table1", columns={"a": numpy.zeros((2, 2))})
+
+
+if __name__ == "__main__":
+    unittest.main(
+        failfast=True,
+    )
@@ -1,9 +1,15 @@
 import unittest
+from unittest.mock import patch
 
 from aa_py_openpyxl_util import FormattedCell, TableInfo
 
 # noinspection PyProtectedMember
-from aa_py_openpyxl_util._write_only import stack_table_rows_side_by_side
+from aa_py_openpyxl_util import _write_only
+from aa_py_openpyxl_util._write_only import (
+    BLANK_CELL,
+    stack_table_cells_side_by_side,
+    stack_table_rows_side_by_side,
+)
 
 
 class TestStackTableRowsSideBySide(unittest.TestCase):
@@ -466,6 +472,88 @@ class TestStackTableRowsSideBySide(unittest.TestCase):
             ),
         )
 
+    def test_no_cells_created_per_row(self) -> None:
+        cells = [[FormattedCell(i), FormattedCell(-i)] for i in range(100)]
+        tables = [
+            TableInfo(name="Table1", column_names=["a", "b"], rows=cells),
+            TableInfo(name="Table2", column_names=["c"], rows=[[FormattedCell(1)]]),
+        ]
+
+        with patch.object(
+            _write_only, "FormattedCell", wraps=FormattedCell
+        ) as formatted_cell:
+            rows = list(
+                stack_table_rows_side_by_side(
+                    tables=tables,
+                    row_margin=1,
+                    col_margin=1,
+                    write_captions=True,
+                    write_pre_rows=False,
+                )
+            )
+
+        # Only the names, descriptions and headers are created.
+        self.assertEqual(2 + 2 + 3, formatted_cell.call_count)
+
+        # The data cells are passed through, and the padding is shared.
+        self.assertIs(cells[50][1], rows[54][2])
+        for cell in [rows[54][0], rows[54][3], rows[54][4]]:
+            self.assertIs(BLANK_CELL, cell)
+
+
+class TestStackTableCellsSideBySide(unittest.TestCase):
+    def test_ragged(self) -> None:
+        cells = [FormattedCell(i) for i in range(4)]
+        tables = [
+            TableInfo(name="Table1", column_names=["a"], rows=[[c] for c in cells]),
+            TableInfo(name="Table2", column_names=["b", "c"], rows=[cells[:2]]),
+            TableInfo(name="Table3", column_names=["d"], rows=[[c] for c in cells[:3]]),
+        ]
+
+        with patch.object(tables[1], "get_cell", wraps=tables[1].get_cell) as get_cell:
+            rows = list(
+                stack_table_cells_side_by_side(
+                    tables=tables,
+                    row_margin=1,
+                    col_margin=1,
+                    write_captions=False,
+                    write_pre_rows=False,
+                )
+            )
+
+        self.assertEqual(
+            [
+                [],
+                [
+                    (1, [FormattedCell("a")], None),
+                    (3, [FormattedCell("b"), FormattedCell("c")], None),
+                    (6, [FormattedCell("d")], None),
+                ],
+                [(1, [cells[0]], None), (3, cells[:2], None), (6, [cells[0]], None)],
+                [(1, [cells[1]], None), (6, [cells[1]], None)],
+                [(1, [cells[2]], None), (6, [cells[2]], None)],
+                [(1, [cells[3]], None)],
+            ],
+            rows,
+        )
+
+        # The exhausted table is not visited again.
+        self.assertEqual(2, get_cell.call_count)
+
+    def test_no_rows(self) -> None:
+        self.assertEqual(
+            [[(0, [FormattedCell("a")], None)], []],
+            list(
+                stack_table_cells_side_by_side(
+                    tables=[TableInfo(name="Table1", column_names=["a"], rows=[])],
+                    row_margin=0,
+                    col_margin=0,
+                    write_captions=False,
+                    write_pre_rows=False,
+                )
+            ),
+        )
+
 
 if __name__ == "__main__":
     unittest.main(
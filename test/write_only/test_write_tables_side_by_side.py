@@ -1,14 +1,18 @@
 import unittest
+from copy import copy
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Callable
+from typing import Any, Callable, Literal
+from unittest.mock import patch
 
+import et_xmlfile
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.table import TableStyleInfo
 
 from aa_py_openpyxl_util import (
+    can_write_xml,
     safe_load_workbook,
     TableInfo,
     write_tables_side_by_side,
@@ -658,6 +662,168 @@ class TestWriteTablesSideBySideOverMultipleSheets(unittest.TestCase):
         test_helper(write, test, True)
 
 
+class TestXmlEngine(unittest.TestCase):
+    def test_same_as_openpyxl(self) -> None:
+        from decimal import Decimal
+        from openpyxl.styles import Font, PatternFill
+
+        bold = Font(bold=True)
+        fill = PatternFill("solid", fgColor="FFFF00")
+        tables = [
+            TableInfo(
+                name="Table1",
+                column_names=["a", "b", "c", "d"],
+                rows=[
+                    [
+                        FormattedCell(1),
+                        FormattedCell(1.5, number_format="0.00"),
+                        FormattedCell("x", font=bold),
+                        FormattedCell(None, fill=fill),
+                    ],
+                    [
+                        FormattedCell(True),
+                        FormattedCell(datetime(2024, 1, 15, 12)),
+                        FormattedCell(" leading & <trailing> "),
+                        FormattedCell("=SUM(A1:A2)"),
+                    ],
+                    [
+                        FormattedCell("=A1:A2*2", array=True),
+                        FormattedCell(datetime(2024, 1, 15), number_format="yyyy"),
+                        FormattedCell("#N/A"),
+                        FormattedCell(Decimal("2.5"), font=bold, fill=fill),
+                    ],
+                    [
+                        FormattedCell(""),
+                        FormattedCell(float("nan")),
+                        FormattedCell(None),
+                        FormattedCell(10**20, font=Font(bold=True)),
+                    ],
+                    [
+                        FormattedCell(datetime(2024, 1, 15), number_format="0.00"),
+                        FormattedCell(datetime(2024, 1, 15), font=bold),
+                        FormattedCell(1),
+                        FormattedCell(2),
+                    ],
+                ],
+                pre_rows=[[FormattedCell("pre", font=bold)]],
+                description="A table",
+            ),
+            TableInfo(
+                name="Table2",
+                column_names=["e"],
+                rows=[[FormattedCell(i)] for i in range(3)],
+            ),
+        ]
+
+        def write(engine: Literal["openpyxl", "xml"]) -> Callable[[Workbook], None]:
+            def write(book: Workbook) -> None:
+                write_tables_side_by_side(
+                    book=book,
+                    sheet_name="Sheet1",
+                    tables=tables,
+                    row_margin=1,
+                    col_margin=1,
+                    write_captions=True,
+                    write_pre_rows=True,
+                    engine=engine,
+                )
+
+            return write
+
+        def describe(book: Workbook) -> Any:
+            sheet = book["Sheet1"]
+            return (
+                [
+                    (
+                        cell.coordinate,
+                        (
+                            cell.value.text
+                            if cell.data_type == "f" and not isinstance(cell.value, str)
+                            else cell.value
+                        ),
+                        getattr(cell.value, "ref", None),
+                        cell.data_type,
+                        cell.number_format,
+                        copy(cell.font),
+                        copy(cell.fill),
+                    )
+                    for row in sheet.iter_rows()
+                    for cell in row
+                    if cell.value is not None or cell.has_style
+                ],
+                dict(sheet.tables.items()),
+            )
+
+        results = []
+        for engine in ["openpyxl", "xml"]:
+            test_helper(
+                write(engine),  # type: ignore[arg-type]
+                lambda book: results.append(describe(book)),
+                True,
+            )
+
+        self.assertEqual(results[0], results[1])
+        cells = {c[0]: c for c in results[1][0]}
+        self.assertEqual("=A1:A2*2", cells["B8"][1])
+        self.assertEqual("B8", cells["B8"][2])
+        self.assertEqual(" leading & <trailing> ", cells["D7"][1])
+        self.assertEqual("yyyy", cells["C8"][4])
+        self.assertTrue(cells["D6"][5].bold)
+        self.assertEqual("0.00", cells["B10"][4])
+        self.assertEqual("yyyy-mm-dd h:mm:ss", cells["C10"][4])
+
+    def test_old_et_xmlfile(self) -> None:
+        tables = [
+            TableInfo(
+                name="Table1",
+                column_names=["a", "b"],
+                rows=[[FormattedCell(1), FormattedCell("x")]],
+            )
+        ]
+
+        def write(book: Workbook) -> None:
+            write_tables_side_by_side(
+                book=book,
+                sheet_name="Sheet1",
+                tables=tables,
+                row_margin=0,
+                col_margin=0,
+                write_captions=False,
+                write_pre_rows=False,
+                engine="xml",
+            )
+
+        def test(book: Workbook) -> None:
+            self.assertEqual(
+                [["a", "b"], [1, "x"]],
+                get_cell_values(book["Sheet1"]["A1:B2"]),
+            )
+
+        # The writer of et_xmlfile 1.x does not accept raw XML, so openpyxl writes the rows instead.
+        with (
+            patch.object(et_xmlfile, "__version__", "1.1.0"),
+            patch(
+                "aa_py_openpyxl_util._xml_writer.append_rows_xml",
+                side_effect=AssertionError("The rows should not be written as XML."),
+            ),
+        ):
+            self.assertFalse(can_write_xml())
+            test_helper(write, test, True)
+
+    def test_unknown_engine(self) -> None:
+        with self.assertRaises(ValueError):
+            write_tables_side_by_side(
+                book=Workbook(write_only=True),
+                sheet_name="Sheet1",
+                tables=[],
+                row_margin=0,
+                col_margin=0,
+                write_captions=False,
+                write_pre_rows=False,
+                engine="fast",  # type: ignore[arg-type]
+            )
+
+
 def test_helper(
     write: Callable[[Workbook], None],
     test: Callable[[Workbook], None],